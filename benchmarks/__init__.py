@@ -0,0 +1,4 @@
+"""
+End-to-end performance benchmarks of the DataProfiler, run with
+`python -m benchmarks.run_benchmarks`.
+"""
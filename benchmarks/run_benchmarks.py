@@ -0,0 +1,338 @@
+#!/usr/bin/env python
+"""
+coding=utf-8
+
+Profiles synthetic datasets end-to-end and records the throughput and peak
+memory of each run, optionally comparing them to a baseline saved by a
+previous run. Each run is executed in a new process so its peak memory is
+not affected by the runs before it, and the memory is sampled while profiling
+only, so it is not affected by the generation of the data either.
+
+Usage:
+    python -m benchmarks.run_benchmarks --output results.json
+    python -m benchmarks.run_benchmarks --baseline benchmarks/baseline.json
+"""
+import argparse
+import contextlib
+import json
+import multiprocessing as mp
+import os
+import platform
+import sys
+import threading
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+import psutil
+
+
+MIXED_TYPES = {'int': 0.3, 'float': 0.3, 'string': 0.2, 'datetime': 0.1,
+               'category': 0.1}
+
+BENCHMARK_CASES = [
+    dict(name='numeric', rows=100000, columns=10,
+         type_mix={'int': 0.5, 'float': 0.5}, null_rate=0.),
+    dict(name='mixed', rows=100000, columns=10,
+         type_mix=MIXED_TYPES, null_rate=0.1),
+    dict(name='wide', rows=10000, columns=200,
+         type_mix=MIXED_TYPES, null_rate=0.1),
+    dict(name='long_text', rows=500000, columns=4,
+         type_mix={'string': 0.5, 'category': 0.5}, null_rate=0.3),
+    dict(name='sparse', rows=100000, columns=20,
+         type_mix=MIXED_TYPES, null_rate=0.9),
+]
+
+_WORDS = np.array(['alpha', 'bravo', 'charlie', 'delta', 'echo', 'foxtrot',
+                   'golf', 'hotel', 'india', 'juliet', 'kilo', 'lima'])
+
+
+def generate_data(rows, columns, type_mix, null_rate, seed=0):
+    """
+    Generates a synthetic dataset with columns of the given types in the given
+    proportions, with the given fraction of each column's cells null.
+
+    :param rows: number of rows
+    :type rows: int
+    :param columns: number of columns
+    :type columns: int
+    :param type_mix: fraction of the columns of each type, the types being
+        'int', 'float', 'string', 'datetime' and 'category'
+    :type type_mix: dict(str, float)
+    :param null_rate: fraction of the cells which are null
+    :type null_rate: float
+    :param seed: seed of the random generator
+    :type seed: int
+    :return: the dataset
+    :rtype: pandas.DataFrame
+    """
+    rng = np.random.default_rng(seed)
+    types = list(type_mix)
+    weights = np.array([type_mix[col_type] for col_type in types], dtype=float)
+    col_types = rng.choice(types, size=columns, p=weights / weights.sum())
+
+    data = dict()
+    for ind, col_type in enumerate(col_types):
+        if col_type == 'int':
+            values = rng.integers(-10 ** 6, 10 ** 6, rows).astype(object)
+        elif col_type == 'float':
+            values = rng.normal(100., 25., rows).round(4).astype(object)
+        elif col_type == 'string':
+            values = np.char.add(
+                rng.choice(_WORDS, rows),
+                rng.integers(0, 10 ** 4, rows).astype(str)).astype(object)
+        elif col_type == 'datetime':
+            values = (np.datetime64('2000-01-01')
+                      + rng.integers(0, 10 ** 4, rows).astype('timedelta64[D]')
+                      ).astype(str).astype(object)
+        elif col_type == 'category':
+            values = rng.choice(_WORDS[:4], rows).astype(object)
+        else:
+            raise ValueError("Unknown column type: {}".format(col_type))
+        values[rng.random(rows) < null_rate] = None
+        data['{}_{}'.format(col_type, ind)] = values
+    return pd.DataFrame(data)
+
+
+class PeakRSSMonitor(object):
+    """
+    Samples the resident memory of this process and of its children, e.g. the
+    workers of the profiler's pool, while in its context, keeping the peak of
+    each in bytes. Unlike the peak of the process as reported by the OS, it
+    excludes the memory used before entering the context, e.g. to generate
+    the data.
+    """
+
+    def __init__(self, interval=0.005):
+        """
+        :param interval: seconds between two samples
+        :type interval: float
+        """
+        self.interval = interval
+        self.peak_rss = 0
+        self.peak_children_rss = 0
+        self._process = psutil.Process()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        self.peak_rss = max(self.peak_rss, self._process.memory_info().rss)
+        children_rss = 0
+        for child in self._process.children(recursive=True):
+            try:
+                children_rss += child.memory_info().rss
+            except psutil.Error:  # terminated since listed
+                pass
+        self.peak_children_rss = max(self.peak_children_rss, children_rss)
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        self._stopped.clear()
+        self._sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stopped.set()
+        self._thread.join()
+        self._sample()
+
+
+def _run_case(case, multiprocess, data_labeler, repeat, connection):
+    """
+    Profiles the dataset of a benchmark case and sends the results through
+    the connection. Executed in a process of its own.
+    """
+    import dataprofiler as dp
+
+    try:
+        data = generate_data(case['rows'], case['columns'], case['type_mix'],
+                             case['null_rate'])
+        data_rss = psutil.Process().memory_info().rss
+        options = dp.ProfilerOptions()
+        options.set({'multiprocess.is_enabled': multiprocess,
+                     'data_labeler.is_enabled': data_labeler})
+
+        seconds = []
+        memory = PeakRSSMonitor()
+        for _ in range(repeat):
+            with warnings.catch_warnings(), open(os.devnull, 'w') as devnull, \
+                    contextlib.redirect_stdout(devnull), \
+                    contextlib.redirect_stderr(devnull), memory:
+                warnings.simplefilter('ignore')
+                start = time.perf_counter()
+                with dp.Profiler(None, profiler_options=options) as profile:
+                    profile.update_profile(data)
+                    profile.report()
+                seconds.append(time.perf_counter() - start)
+
+        best_seconds = min(seconds)
+        connection.send({
+            'case': case['name'],
+            'multiprocess': multiprocess,
+            'data_labeler': data_labeler,
+            # the labeler is disabled if it fails to load, e.g. without ml deps
+            'data_labeler_loaded':
+                options.structured_options.data_labeler.is_enabled,
+            'rows': case['rows'],
+            'columns': case['columns'],
+            'seconds': best_seconds,
+            'rows_per_second': case['rows'] / best_seconds,
+            'cells_per_second': case['rows'] * case['columns'] / best_seconds,
+            # memory once the data is generated, then peaks while profiling
+            'data_rss_bytes': data_rss,
+            'peak_rss_bytes': memory.peak_rss,
+            'peak_children_rss_bytes': memory.peak_children_rss,
+        })
+    except Exception as e:
+        connection.send({'case': case['name'], 'multiprocess': multiprocess,
+                         'data_labeler': data_labeler, 'error': repr(e)})
+    finally:
+        connection.close()
+
+
+def run_benchmark(case, multiprocess=False, data_labeler=False, repeat=1):
+    """
+    Profiles the dataset of a benchmark case in a new process.
+
+    :param case: benchmark case, see `BENCHMARK_CASES`
+    :type case: dict
+    :param multiprocess: whether the profiler uses multiprocessing
+    :type multiprocess: bool
+    :param data_labeler: whether the profiler labels the data
+    :type data_labeler: bool
+    :param repeat: number of times the data is profiled, the fastest is kept
+    :type repeat: int
+    :return: results of the benchmark
+    :rtype: dict
+    """
+    receiver, sender = mp.Pipe(duplex=False)
+    process = mp.get_context('spawn').Process(
+        target=_run_case,
+        args=(case, multiprocess, data_labeler, repeat, sender))
+    process.start()
+    sender.close()
+    try:
+        result = receiver.recv()
+    except EOFError:
+        result = {'case': case['name'], 'multiprocess': multiprocess,
+                  'data_labeler': data_labeler,
+                  'error': 'exit code {}'.format(process.exitcode)}
+    process.join()
+    return result
+
+
+def _get_result_key(result):
+    return result['case'], result['multiprocess'], result['data_labeler']
+
+
+def compare_to_baseline(results, baseline, tolerance=0.1):
+    """
+    Lists the benchmarks which regressed against the baseline, i.e. whose
+    throughput is lower or whose peak memory is higher than the baseline's by
+    more than the tolerated fraction. Benchmarks missing from the baseline
+    are not compared.
+
+    :param results: results of the benchmarks
+    :type results: list(dict)
+    :param baseline: results of the benchmarks of the baseline
+    :type baseline: list(dict)
+    :param tolerance: tolerated fraction of the baseline
+    :type tolerance: float
+    :return: description of each regression
+    :rtype: list(str)
+    """
+    baseline = {_get_result_key(result): result for result in baseline
+                if 'error' not in result}
+    regressions = []
+    for result in results:
+        key = _get_result_key(result)
+        if 'error' in result:
+            regressions.append('{}: failed with {}'.format(
+                key, result['error']))
+            continue
+        if key not in baseline:
+            continue
+        for metric in ['rows_per_second', 'cells_per_second']:
+            if result[metric] < baseline[key][metric] * (1 - tolerance):
+                regressions.append('{}: {} dropped from {:.1f} to {:.1f}'
+                                   .format(key, metric, baseline[key][metric],
+                                           result[metric]))
+        if result['peak_rss_bytes'] and baseline[key]['peak_rss_bytes'] \
+                and result['peak_rss_bytes'] \
+                > baseline[key]['peak_rss_bytes'] * (1 + tolerance):
+            regressions.append('{}: peak_rss_bytes rose from {} to {}'.format(
+                key, baseline[key]['peak_rss_bytes'],
+                result['peak_rss_bytes']))
+    return regressions
+
+
+def _get_environment():
+    import dataprofiler as dp
+    return {
+        'dataprofiler_version': dp.__version__,
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Benchmarks the DataProfiler end-to-end on synthetic '
+                    'datasets.')
+    parser.add_argument('--output', default='benchmark_results.json',
+                        help='file to save the results to')
+    parser.add_argument('--baseline',
+                        help='results of a previous run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='tolerated fraction of the baseline')
+    parser.add_argument('--cases', nargs='+',
+                        choices=[case['name'] for case in BENCHMARK_CASES],
+                        help='cases to run, all if unspecified')
+    parser.add_argument('--scale', type=float, default=1.,
+                        help='scales the number of rows of each case')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='runs per benchmark, the fastest is kept')
+    parser.add_argument('--multiprocess', choices=['on', 'off', 'both'],
+                        default='both')
+    parser.add_argument('--data-labeler', choices=['on', 'off', 'both'],
+                        default='both')
+    args = parser.parse_args(argv)
+
+    settings = {'on': [True], 'off': [False], 'both': [False, True]}
+    results = []
+    for case in BENCHMARK_CASES:
+        if args.cases and case['name'] not in args.cases:
+            continue
+        case = dict(case, rows=max(int(case['rows'] * args.scale), 1))
+        for multiprocess in settings[args.multiprocess]:
+            for data_labeler in settings[args.data_labeler]:
+                result = run_benchmark(case, multiprocess, data_labeler,
+                                       args.repeat)
+                results.append(result)
+                print(json.dumps(result))
+
+    with open(args.output, 'w') as outfile:
+        json.dump({'environment': _get_environment(), 'results': results},
+                  outfile, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as infile:
+            baseline = json.load(infile)['results']
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        for regression in regressions:
+            print('REGRESSION', regression)
+        if regressions:
+            return 1
+        print('No regressions against {}'.format(args.baseline))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+"""
+coding=utf-8
+
+Measures the time to hand the arguments of a profiler update to a worker
+process, either pickled as the pool does by default or shared once via
+`utils.share_args` and attached by the worker, for each dtype of column and
+for the typed view of a string column. Arguments which `share_args` does not
+share are reported with no shared timing.
+
+Usage:
+    python -m benchmarks.shared_memory_benchmark --rows 1000000
+"""
+import argparse
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+try:
+    from multiprocessing import resource_tracker
+except ImportError:  # python < 3.8
+    resource_tracker = None
+
+from dataprofiler.profilers import utils
+
+
+def generate_args(rows, seed=0):
+    """
+    Generates a column of each dtype handed to the column profilers, and the
+    typed view of the string column handed to the primitive type profilers.
+
+    :param rows: number of rows of each column
+    :type rows: int
+    :param seed: seed of the random generator
+    :type seed: int
+    :return: arguments by the name of their kind
+    :rtype: dict(str, Union[pandas.Series, utils.TypedView])
+    """
+    rng = np.random.default_rng(seed)
+    str_series = pd.Series(
+        rng.normal(100., 25., rows).round(4).astype(str).astype(object))
+    return {
+        'int64': pd.Series(rng.integers(-10 ** 6, 10 ** 6, rows)),
+        'float64': pd.Series(rng.normal(100., 25., rows)),
+        'string': str_series,
+        'typed_view': utils.get_typed_view(str_series),
+    }
+
+
+def _count(*args):
+    return len(args[0])
+
+
+def _count_shared(*shared_args):
+    shared_blocks, args = utils.attach_args(shared_args)
+    try:
+        return _count(*args)
+    finally:
+        del args
+        utils.release_shared_memory(shared_blocks)
+
+
+def _time_pickled(pool, arg, repeat):
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        pool.apply(_count, (arg,))
+        seconds.append(time.perf_counter() - start)
+    return min(seconds)
+
+
+def _time_shared(pool, arg, repeat):
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        shared_blocks, shared_args = utils.share_args((arg,))
+        if not shared_blocks:
+            return None
+        try:
+            pool.apply(_count_shared, shared_args)
+        finally:
+            utils.release_shared_memory(shared_blocks, unlink=True)
+        seconds.append(time.perf_counter() - start)
+    return min(seconds)
+
+
+def run_benchmark(rows, repeat=5):
+    """
+    Times handing the arguments of each kind to a worker process, pickled and
+    through shared memory.
+
+    :param rows: number of rows of each column
+    :type rows: int
+    :param repeat: number of times each argument is handed, the fastest is
+        kept
+    :type repeat: int
+    :return: results of the benchmark, one per kind of argument
+    :rtype: list(dict)
+    """
+    # workers must share the resource tracker of this process, as in
+    # `utils.generate_pool`
+    if resource_tracker is not None and os.name == 'posix':
+        resource_tracker.ensure_running()
+
+    results = []
+    with mp.Pool(1) as pool:
+        pool.apply(len, ([],))  # warm up the worker
+        for kind, arg in generate_args(rows).items():
+            pickled = _time_pickled(pool, arg, repeat)
+            shared = _time_shared(pool, arg, repeat)
+            results.append({
+                'kind': kind,
+                'rows': rows,
+                'pickled_seconds': pickled,
+                'shared_seconds': shared,
+                'speedup': pickled / shared if shared else None,
+            })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Benchmarks handing profiler arguments to worker '
+                    'processes pickled against through shared memory.')
+    parser.add_argument('--rows', type=int, default=1000000,
+                        help='number of rows of each column')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='runs per argument, the fastest is kept')
+    args = parser.parse_args(argv)
+
+    for result in run_benchmark(args.rows, args.repeat):
+        print(json.dumps(result))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -46,6 +46,10 @@ class AVROData(JSONData, BaseData):
             df_reader = fastavro.reader(input_file)
             lines = list()
             for line in df_reader:
+                # only the selected keys are held in memory
+                if self.selected_keys:
+                    line = data_utils.select_json_keys(
+                        line, self.selected_keys)
                 lines.append(line)
             return lines
 
@@ -1,10 +1,14 @@
 import sys
+import copy
 import logging
+import types
 from collections import OrderedDict
 
 import numpy as np
 import pandas as pd
 
+from .. import tracing
+
 logger = logging.getLogger('DataProfiler.data')
 
 
@@ -54,7 +58,8 @@ class BaseData(object):
     @property
     def data(self):
         if self._data is None:
-            self._load_data()
+            with tracing.span(type(self).__name__ + '.load_data'):
+                self._load_data()
 
         allowed_data_formats = list(self._data_formats.keys())
         if not self._selected_data_format:
@@ -121,6 +126,61 @@ class BaseData(object):
             else:
                 yield list(self.data[k] for k in indices[i:i + batch_size])
 
+    def get_chunk_generator(self, chunk_size):
+        """
+        Returns a generator over the data, in order, in chunks of at most
+        `chunk_size` rows. Subclasses able to read their input file
+        incrementally override this so the entire dataset is never held in
+        memory.
+
+        :param chunk_size: maximum number of rows per chunk
+        :type chunk_size: int
+        :return: chunks of the data
+        :rtype: generator
+        """
+        data = self.data
+        for i in range(0, len(data), chunk_size):
+            if isinstance(data, pd.DataFrame):
+                yield data.iloc[i:i + chunk_size]
+            else:
+                yield data[i:i + chunk_size]
+
+    def select_columns(self, columns):
+        """
+        Selects the columns read from the input file from now on. Readers
+        which support it push the selection down to the file, hence the other
+        columns are never parsed nor held in memory. Other readers read every
+        column, leaving the selection to the caller. Data already loaded keeps
+        its columns.
+
+        :param columns: columns to be read
+        :type columns: list(str)
+        :return: None
+        """
+        if isinstance(columns, str) or not pd.api.types.is_list_like(columns):
+            raise ValueError("`columns` must be a list of columns.")
+
+    def project_columns(self, columns):
+        """
+        Returns a copy of the data which only reads the given columns from the
+        input file, leaving this data and the columns it reads unchanged. Data
+        already loaded is shared with the copy rather than copied.
+
+        :param columns: columns to be read
+        :type columns: list(str)
+        :return: the projected data
+        :rtype: BaseData
+        """
+        projection = copy.copy(self)
+        # the data formats are bound to the copy to convert its own data
+        projection._data_formats = OrderedDict(
+            (data_format, types.MethodType(function.__func__, projection)
+             if getattr(function, '__self__', None) is self else function)
+            for data_format, function in self._data_formats.items())
+        projection._batch_info = dict(perm=list(), iter=0)
+        projection.select_columns(columns)
+        return projection
+
     @classmethod
     def is_match(cls, input_file_path, options):
         raise NotImplementedError()
@@ -481,9 +481,10 @@ class CSVData(SpreadSheetDataMixin, BaseData):
             read_in_string=True
         )
 
-    def _load_data_from_file(self, input_file_path):
+    def _load_data_from_file(self, input_file_path, chunk_size=None):
         """
-        Loads the data into memory from the file.
+        Loads the data into memory from the file. If `chunk_size` is specified,
+        an iterator over dataframes of `chunk_size` rows is returned instead.
         """
         
         self._file_encoding = data_utils.detect_file_encoding(input_file_path)
@@ -524,9 +525,32 @@ class CSVData(SpreadSheetDataMixin, BaseData):
             input_file_path,
             self.delimiter, self.header, self.selected_columns,
             read_in_string=True,
-            encoding=self.file_encoding
+            encoding=self.file_encoding,
+            chunk_size=chunk_size
         )
 
+    def get_chunk_generator(self, chunk_size):
+        """
+        Returns a generator over the data, in order, in chunks of at most
+        `chunk_size` rows. If the data is not yet loaded, the chunks are read
+        directly from the file without loading the entire file into memory.
+
+        :param chunk_size: maximum number of rows per chunk
+        :type chunk_size: int
+        :return: chunks of the data
+        :rtype: generator
+        """
+        if self._data is not None or not self.input_file_path:
+            yield from super(CSVData, self).get_chunk_generator(chunk_size)
+            return
+
+        reader = self._load_data_from_file(self.input_file_path, chunk_size)
+        try:
+            for chunk in reader:
+                yield self._data_formats[self._selected_data_format](chunk)
+        finally:
+            reader.close()
+
     def _get_data_as_records(self, data):
         sep = self.delimiter if self.delimiter else self._default_delimiter
         quote = self.quotechar if self.quotechar else self._default_quotechar
@@ -88,6 +88,40 @@ def unicode_to_str(data, ignore_dicts=False):
     return data
 
 
+def select_json_keys(json_obj, selected_columns, separator='.'):
+    """
+    Drops the keys of a JSON object which, once flattened, neither are one of
+    the selected columns nor hold one, so they are never flattened.
+
+    :param json_obj: JSON object to select keys from
+    :type json_obj: dict
+    :param selected_columns: a list of flattened keys to be processed
+    :type selected_columns: list(str)
+    :param separator: separator of the nested keys in the flattened keys
+    :type separator: str
+    :return: JSON object with only the selected keys
+    :rtype: dict
+    """
+    selected_columns = set(map(str, selected_columns))
+    nested_paths = set()
+    for column in selected_columns:
+        keys = column.split(separator)
+        for i in range(1, len(keys)):
+            nested_paths.add(separator.join(keys[:i]))
+
+    def select_keys(obj, path):
+        selected_obj = type(obj)()
+        for key, value in obj.items():
+            key_path = path + str(key)
+            if key_path in selected_columns:
+                selected_obj[key] = value
+            elif key_path in nested_paths and isinstance(value, dict):
+                selected_obj[key] = select_keys(value, key_path + separator)
+        return selected_obj
+
+    return select_keys(json_obj, '')
+
+
 def json_to_dataframe(json_lines, selected_columns=None, read_in_string=False):
     """
     This function takes a list of json objects and returns the dataframe
@@ -114,16 +148,20 @@ def json_to_dataframe(json_lines, selected_columns=None, read_in_string=False):
             'data type (i.e. list-dicts).'
         )
     elif first_item_type == dict:
+        # only the selected keys are flattened
+        if selected_columns:
+            json_lines = [select_json_keys(line, selected_columns)
+                          for line in json_lines]
         df = pd.json_normalize(json_lines)
     else:
         df = pd.DataFrame(json_lines)
-    original_df_dtypes = df.dtypes
-
-    df[df.columns] = df[df.columns].astype(str)
 
     # filter some columns to be processed if specified by users
     if selected_columns:
         df = df[selected_columns]
+    original_df_dtypes = df.dtypes
+
+    df[df.columns] = df[df.columns].astype(str)
     return df, original_df_dtypes
 
 
@@ -221,6 +259,9 @@ def read_json(data_generator, selected_columns=None, read_in_string=False):
                            object_pairs_hook=OrderedDict),
                 ignore_dicts=True
             )
+            # only the selected keys are held in memory
+            if selected_columns and isinstance(obj, dict):
+                obj = select_json_keys(obj, selected_columns)
             lines.append(obj)
         except ValueError:
             pass
@@ -232,7 +273,7 @@ def read_json(data_generator, selected_columns=None, read_in_string=False):
 
 
 def read_csv_df(file_path, delimiter, header, selected_columns=[],
-                read_in_string=False, encoding='utf-8'):
+                read_in_string=False, encoding='utf-8', chunk_size=None):
     """
     Reads a CSV file in chunks and returns a dataframe in the form of iterator.
     
@@ -247,8 +288,11 @@ def read_csv_df(file_path, delimiter, header, selected_columns=[],
     :param read_in_string: if True, all the values in dataframe will be
         converted to string
     :type read_in_string: bool
+    :param chunk_size: if specified, the file is not loaded at once, instead
+        an iterator returning dataframes of `chunk_size` rows is returned
+    :type chunk_size: int
     :return: Iterator
-    :rtype: pd.DataFrame
+    :rtype: Union[pd.DataFrame, Iterator(pd.DataFrame)]
     """
     args = {
         'delimiter': delimiter,
@@ -264,27 +308,31 @@ def read_csv_df(file_path, delimiter, header, selected_columns=[],
 
     if len(selected_columns) > 0:
         args['usecols'] = selected_columns
+    if chunk_size is not None:
+        args['chunksize'] = chunk_size
+        return pd.read_csv(file_path, **args)
     fo = pd.read_csv(file_path, **args)
     data = fo.read()
     fo.close()
     return data
 
 
-def read_parquet_df(file_path, selected_columns=None, read_in_string=False):
+def read_parquet_row_groups(file_path, selected_columns=None):
     """
     Returns an iterator that returns one row group each time.
-    
+
     :param file_path: path to the Parquet file.
     :type file_path: str
+    :param selected_columns: a list of columns to be processed
+    :type selected_columns: list(str)
     :return:
     :rtype: Iterator(pd.DataFrame)
     """
-
     parquet_file = pq.ParquetFile(file_path)
-    data = pd.DataFrame()
     for i in range(parquet_file.num_row_groups):
 
-        data_row_df = parquet_file.read_row_group(i).to_pandas()
+        data_row_df = parquet_file.read_row_group(
+            i, columns=selected_columns or None).to_pandas()
 
         # Convert all the unicode columns to utf-8
         types = data_row_df.apply(lambda x: pd.api.types.infer_dtype(
@@ -302,6 +350,25 @@ def read_parquet_df(file_path, selected_columns=None, read_in_string=False):
         if selected_columns:
             data_row_df = data_row_df[selected_columns]
 
+        yield data_row_df
+
+
+def read_parquet_df(file_path, selected_columns=None, read_in_string=False):
+    """
+    Reads all the row groups of a Parquet file into a single dataframe.
+    
+    :param file_path: path to the Parquet file.
+    :type file_path: str
+    :param selected_columns: a list of columns to be processed
+    :type selected_columns: list(str)
+    :param read_in_string: if True, all the values in dataframe will be
+        converted to string
+    :type read_in_string: bool
+    :return: dataframe and the original dtypes of its columns
+    :rtype: tuple(pd.DataFrame, pd.Series(dtypes))
+    """
+    data = pd.DataFrame()
+    for data_row_df in read_parquet_row_groups(file_path, selected_columns):
         data = pd.concat([data, data_row_df])
 
     original_df_dtypes = data.dtypes
@@ -75,6 +75,17 @@ class JSONData(SpreadSheetDataMixin, BaseData):
     def selected_keys(self):
         return self._selected_keys
 
+    def select_columns(self, columns):
+        """
+        Selects the flattened keys read from the input file from now on, the
+        other keys being dropped before the JSON is flattened.
+
+        :param columns: flattened keys to be read
+        :type columns: list(str)
+        :return: None
+        """
+        self._selected_keys = list(columns)
+
     @property
     def metadata(self):
         """
@@ -23,11 +23,15 @@ class ParquetData(SpreadSheetDataMixin, BaseData):
                 data_format= type: str, choices: "dataframe", "records", "json"
                 selected_columns= type: list(str)
                 header= type: any
+                native_dtypes= type: bool
             )
         
         data_format: user selected format in which to return data
         can only be of specified types
         selected_columns: columns being selected from the entire dataset
+        native_dtypes: whether the columns keep their native dtypes, e.g. int,
+        float or datetime, instead of being converted to strings, which the
+        profiler then uses without parsing them
 
         :param input_file_path: path to the file being loaded or None
         :type input_file_path: str
@@ -48,10 +52,12 @@ class ParquetData(SpreadSheetDataMixin, BaseData):
         #  _selected_data_format: user selected format in which to return data
         #                         can only be of types in _data_formats
         #  _selected_columns: columns being selected from the entire dataset
+        #  _native_dtypes: whether columns keep their native dtypes
         self._data_formats["records"] = self._get_data_as_records
         self._data_formats["json"] = self._get_data_as_json
         self._selected_data_format = options.get("data_format", "dataframe")
         self._selected_columns = options.get("selected_columns", list())
+        self._native_dtypes = options.get("native_dtypes", False)
 
         if data is not None:
             self._load_data(data)
@@ -64,7 +70,7 @@ class ParquetData(SpreadSheetDataMixin, BaseData):
         data_generator = data_utils.data_generator(data_as_str.splitlines())
         data, original_df_dtypes = data_utils.read_json_df(
             data_generator=data_generator,
-            read_in_string=True
+            read_in_string=not self._native_dtypes
         )
         self._original_df_dtypes = original_df_dtypes
         return data
@@ -73,11 +79,37 @@ class ParquetData(SpreadSheetDataMixin, BaseData):
         data, original_df_dtypes = data_utils.read_parquet_df(
             input_file_path,
             self.selected_columns,
-            read_in_string=True
+            read_in_string=not self._native_dtypes
         )
         self._original_df_dtypes = original_df_dtypes
         return data
 
+    def get_chunk_generator(self, chunk_size):
+        """
+        Returns a generator over the data, in order, in chunks of at most
+        `chunk_size` rows. If the data is not yet loaded, the file is read one
+        row group at a time instead of being loaded entirely into memory.
+
+        :param chunk_size: maximum number of rows per chunk
+        :type chunk_size: int
+        :return: chunks of the data
+        :rtype: generator
+        """
+        if self._data is not None or not self.input_file_path:
+            yield from super(ParquetData, self).get_chunk_generator(chunk_size)
+            return
+
+        row_groups = data_utils.read_parquet_row_groups(
+            self.input_file_path, self.selected_columns)
+        for data_row_df in row_groups:
+            if self._original_df_dtypes is None:
+                self._original_df_dtypes = data_row_df.dtypes
+            if not self._native_dtypes:
+                data_row_df = data_row_df.astype(str)
+            for i in range(0, len(data_row_df), chunk_size):
+                chunk = data_row_df.iloc[i:i + chunk_size]
+                yield self._data_formats[self._selected_data_format](chunk)
+
     def _get_data_as_records(self, data):
         # split into row samples separate by `\n`
         data = data.to_json(orient="records", lines=True)
@@ -50,6 +50,17 @@ class SpreadSheetDataMixin(object):
         else:
             raise ValueError("No data to load.")
 
+    def select_columns(self, columns):
+        """
+        Selects the columns read from the input file from now on, which are
+        the only ones parsed. Data already loaded keeps its columns.
+
+        :param columns: columns to be read
+        :type columns: list(str)
+        :return: None
+        """
+        self._selected_columns = list(columns)
+
     def _get_data_as_df(self, data):
         if not isinstance(data, pd.DataFrame):
             raise ValueError(
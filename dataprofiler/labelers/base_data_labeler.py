@@ -7,7 +7,7 @@ import pkg_resources
 import numpy as np
 import pandas as pd
 
-from .. import data_readers
+from .. import data_readers, tracing
 from . import data_processing
 from .base_model import BaseModel
 
@@ -273,17 +273,22 @@ class BaseDataLabeler(object):
             skip_postprocessor=False, error_on_mismatch=error_on_mismatch)
 
         # preprocess
-        samples = self._preprocessor.process(data, batch_size=batch_size)
+        with tracing.span('data_labeler.preprocess'):
+            samples = self._preprocessor.process(data, batch_size=batch_size)
 
         # predicting:
-        results = self._model.predict(
-            samples, batch_size,
-            show_confidences=predict_options.get('show_confidences', False),
-            verbose=verbose
-        )
+        with tracing.span('data_labeler.predict'):
+            results = self._model.predict(
+                samples, batch_size,
+                show_confidences=predict_options.get('show_confidences',
+                                                     False),
+                verbose=verbose
+            )
 
         # postprocessing:
-        results = self._postprocessor.process(data, results, self.label_mapping)
+        with tracing.span('data_labeler.postprocess'):
+            results = self._postprocessor.process(
+                data, results, self.label_mapping)
 
         return results
 
@@ -10,7 +10,8 @@ from .order_column_profile import OrderColumn
 
 from .data_labeler_column_profile import DataLabelerColumn
 
-from .profile_builder import Profiler
+from .profile_builder import Profiler, profile_dataset
+from .profile_cache import ProfileCache
 """
 The purpose of this package is to provide statistics and predictions for a 
 given dataset.
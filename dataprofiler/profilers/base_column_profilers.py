@@ -17,6 +17,9 @@ import warnings
 
 import numpy as np
 
+from .. import tracing
+from .helpers.report_helpers import _select_keys
+
 
 class BaseColumnProfiler(with_metaclass(abc.ABCMeta, object)):
     """
@@ -31,6 +34,11 @@ class BaseColumnProfiler(with_metaclass(abc.ABCMeta, object)):
     _SAMPLING_RATIO = 0.20
     _MIN_SAMPLING_COUNT = 500
 
+    # Declares whether the bulk of the update releases the GIL (e.g. numpy or
+    # pandas vectorized work), in which case the 'auto' multiprocess backend
+    # executes it on a thread rather than pickling it to another process.
+    releases_gil = False
+
     def __init__(self, name):
         """
         Initialization of base class properties for the subclass.
@@ -71,7 +79,7 @@ class BaseColumnProfiler(with_metaclass(abc.ABCMeta, object)):
     def _timeit(method=None, name=None):
         """
         Measure execution time of provided method
-        Records time into times dictionary
+        Records time into times dictionary, and as a span when tracing
 
         :param method: method to time
         :type method: Callable
@@ -86,9 +94,10 @@ class BaseColumnProfiler(with_metaclass(abc.ABCMeta, object)):
                 name_dec = name
                 if not name_dec:
                     name_dec = method.__name__
-                ts = time.time()
-                result = method(self, *args, **kw)
-                te = time.time()
+                ts = time.perf_counter()
+                with tracing.span(type(self).__name__ + '.' + name_dec):
+                    result = method(self, *args, **kw)
+                te = time.perf_counter()
                 self.times[name_dec] += (te - ts)
                 return result
 
@@ -236,6 +245,21 @@ class BaseColumnProfiler(with_metaclass(abc.ABCMeta, object)):
         """
         raise NotImplementedError()
 
+    def get_profile(self, keys=None):
+        """
+        Returns the profile of the column with only the given keys. Profilers
+        with costly statistics override it to only compute the selected ones.
+
+        :param keys: keys of the profile to select, all if None, where a '.'
+            represents a level of recursion and '*' matches any key
+        :type keys: list(str)
+        :return: profile of the column
+        :rtype: dict
+        """
+        if keys is None:
+            return self.profile
+        return _select_keys(self.profile, keys)
+
 
 class BaseColumnPrimitiveTypeProfiler(with_metaclass(abc.ABCMeta,
                                                      BaseColumnProfiler)):
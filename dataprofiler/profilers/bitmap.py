@@ -0,0 +1,242 @@
+"""
+coding=utf-8
+
+Compressed bitmap of non-negative integer row indices.
+"""
+import numpy as np
+
+
+# number of set bits in each byte
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+
+
+class RoaringBitmap(object):
+
+    # containers with more indices than this are stored as bitsets
+    array_max_size = 4096
+
+    def __init__(self, values=None):
+        """
+        Initialization of a roaring style bitmap. Indices are grouped into
+        containers by their upper bits, where each container holds the lower
+        16 bits either as a sorted uint16 array, when sparse, or as a packed
+        bitset of 8KB, when dense.
+
+        :param values: non-negative integer indices in the bitmap
+        :type values: Union[list(int), numpy.ndarray, iterable]
+        """
+        self._containers = dict()
+        if values is not None:
+            self.update(values)
+
+    @staticmethod
+    def _get_bits(container):
+        """
+        Unpacks a container into a boolean mask of its 2 ** 16 lower bits.
+
+        :param container: sorted uint16 array or packed bitset
+        :type container: numpy.ndarray
+        :return: mask of the indices in the container
+        :rtype: numpy.ndarray
+        """
+        if container.dtype == np.uint8:
+            return np.unpackbits(container).astype(bool)
+        bits = np.zeros(2 ** 16, dtype=bool)
+        bits[container] = True
+        return bits
+
+    @classmethod
+    def _from_bits(cls, bits):
+        """
+        Creates the container best suited for the given mask, None if empty.
+
+        :param bits: mask of the indices in the container
+        :type bits: numpy.ndarray
+        :return: sorted uint16 array or packed bitset
+        :rtype: numpy.ndarray
+        """
+        count = np.count_nonzero(bits)
+        if not count:
+            return None
+        if count <= cls.array_max_size:
+            return np.flatnonzero(bits).astype(np.uint16)
+        return np.packbits(bits)
+
+    @staticmethod
+    def _container_len(container):
+        if container.dtype == np.uint8:
+            return int(_POPCOUNT[container].sum())
+        return len(container)
+
+    @classmethod
+    def _union_containers(cls, container, other):
+        if container.dtype == np.uint16 and other.dtype == np.uint16:
+            values = np.union1d(container, other)
+            if len(values) <= cls.array_max_size:
+                return values
+        return cls._from_bits(cls._get_bits(container) | cls._get_bits(other))
+
+    @classmethod
+    def _intersect_containers(cls, container, other):
+        if container.dtype == np.uint16 and other.dtype == np.uint16:
+            values = np.intersect1d(container, other, assume_unique=True)
+            return values if len(values) else None
+        if container.dtype == np.uint16:
+            container, other = other, container
+        if other.dtype == np.uint16:
+            values = other[cls._get_bits(container)[other]]
+            return values if len(values) else None
+        return cls._from_bits(cls._get_bits(container) & cls._get_bits(other))
+
+    def update(self, values):
+        """
+        Adds the indices to the bitmap.
+
+        :param values: non-negative integer indices to add
+        :type values: Union[list(int), numpy.ndarray, iterable, RoaringBitmap]
+        :return: None
+        """
+        if isinstance(values, RoaringBitmap):
+            other_containers = values._containers
+        else:
+            values = np.asarray(
+                values if hasattr(values, '__len__') else list(values))
+            if not len(values):
+                return
+            if not np.issubdtype(values.dtype, np.integer) \
+                    or values.min() < 0:
+                raise ValueError("RoaringBitmap only stores non-negative "
+                                 "integer indices.")
+            values = np.unique(values.astype(np.int64))
+            highs = values >> 16
+            split_ind = np.flatnonzero(np.diff(highs)) + 1
+            other_containers = dict()
+            for group in np.split(values, split_ind):
+                container = (group & 0xFFFF).astype(np.uint16)
+                if len(container) > self.array_max_size:
+                    container = np.packbits(self._get_bits(container))
+                other_containers[int(group[0] >> 16)] = container
+
+        for high, container in other_containers.items():
+            if high in self._containers:
+                container = self._union_containers(
+                    self._containers[high], container)
+            self._containers[high] = container
+
+    def union(self, *others):
+        """
+        Bitmap of the indices in this or any of the other bitmaps.
+
+        :param others: bitmaps to union with this one
+        :type others: RoaringBitmap
+        :return: union of the bitmaps
+        :rtype: RoaringBitmap
+        """
+        union_bitmap = RoaringBitmap()
+        union_bitmap._containers = dict(self._containers)
+        for other in others:
+            union_bitmap.update(other)
+        return union_bitmap
+
+    def intersection(self, *others):
+        """
+        Bitmap of the indices in this and all of the other bitmaps.
+
+        :param others: bitmaps to intersect with this one
+        :type others: RoaringBitmap
+        :return: intersection of the bitmaps
+        :rtype: RoaringBitmap
+        """
+        containers = dict(self._containers)
+        for other in others:
+            intersected_containers = dict()
+            for high in containers.keys() & other._containers.keys():
+                container = self._intersect_containers(
+                    containers[high], other._containers[high])
+                if container is not None:
+                    intersected_containers[high] = container
+            containers = intersected_containers
+        intersection_bitmap = RoaringBitmap()
+        intersection_bitmap._containers = containers
+        return intersection_bitmap
+
+    def to_array(self):
+        """
+        Sorted indices in the bitmap.
+
+        :return: indices in the bitmap
+        :rtype: numpy.ndarray
+        """
+        arrays = [np.empty(0, dtype=np.int64)]
+        for high in sorted(self._containers):
+            container = self._containers[high]
+            if container.dtype == np.uint8:
+                container = np.flatnonzero(np.unpackbits(container))
+            arrays.append((high << 16) | container.astype(np.int64))
+        return np.concatenate(arrays)
+
+    def __len__(self):
+        return sum(map(self._container_len, self._containers.values()))
+
+    def __iter__(self):
+        return iter(self.to_array().tolist())
+
+    def __contains__(self, value):
+        if not isinstance(value, (int, np.integer)) or value < 0:
+            return False
+        container = self._containers.get(int(value) >> 16)
+        if container is None:
+            return False
+        low = int(value) & 0xFFFF
+        if container.dtype == np.uint8:
+            return bool(container[low >> 3] & (0x80 >> (low & 7)))
+        ind = np.searchsorted(container, low)
+        return ind < len(container) and container[ind] == low
+
+    def __or__(self, other):
+        if isinstance(other, RoaringBitmap):
+            return self.union(other)
+        if isinstance(other, (set, frozenset)):
+            return set(self) | other
+        return NotImplemented
+
+    def __and__(self, other):
+        if isinstance(other, RoaringBitmap):
+            return self.intersection(other)
+        if isinstance(other, (set, frozenset)):
+            return set(self) & other
+        return NotImplemented
+
+    __ror__ = __or__
+    __rand__ = __and__
+
+    def __eq__(self, other):
+        if isinstance(other, RoaringBitmap):
+            return np.array_equal(self.to_array(), other.to_array())
+        if isinstance(other, (set, frozenset)):
+            return set(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, self.to_array().tolist())
+
+
+def to_row_index(rows):
+    """
+    Stores row indices as a bitmap when they are non-negative integers,
+    otherwise as a set of the row labels.
+
+    :param rows: row indices or labels
+    :type rows: Union[list, numpy.ndarray, pandas.Index, set, RoaringBitmap]
+    :return: the stored rows
+    :rtype: Union[RoaringBitmap, set]
+    """
+    if isinstance(rows, (RoaringBitmap, set)):
+        return rows
+    rows_array = np.asarray(rows if hasattr(rows, '__len__') else list(rows))
+    if not len(rows_array) or (np.issubdtype(rows_array.dtype, np.integer)
+                               and rows_array.min() >= 0):
+        return RoaringBitmap(rows_array)
+    return set(rows_array.tolist())
@@ -1,14 +1,55 @@
 from future.utils import with_metaclass
 import abc
+import copy
 from collections import OrderedDict
 
 import pandas as pd
 
 from . import utils
+from .. import tracing
 from . import DateTimeColumn, IntColumn, FloatColumn, TextColumn
 from . import OrderColumn, CategoricalColumn
 from . import DataLabelerColumn
 from .profiler_options import StructuredOptions
+from .helpers.report_helpers import _get_selected_keys
+
+
+def _update_profile(profile, df_series, *update_args):
+    """
+    Updates a profiler with a column, recording the update as a span, in this
+    process or in a worker.
+
+    :param profile: profiler to update
+    :type profile: BaseColumnProfiler
+    :param df_series: a given column, assume df_series in str
+    :type df_series: pandas.core.series.Series
+    :param update_args: arguments of the update following the column
+    :type update_args: tuple
+    :return: the updated profiler
+    :rtype: BaseColumnProfiler
+    """
+    with tracing.span(type(profile).__name__ + '.update'):
+        return profile.update(df_series, *update_args)
+
+
+def _update_profile_from_shared_data(profile, *shared_args):
+    """
+    Worker side of a profiler update whose arguments were published to shared
+    memory where possible.
+
+    :param profile: profiler to update
+    :type profile: BaseColumnProfiler
+    :param shared_args: arguments of the update returned by `utils.share_args`
+    :type shared_args: tuple
+    :return: the updated profiler
+    :rtype: BaseColumnProfiler
+    """
+    shared_blocks, update_args = utils.attach_args(shared_args)
+    try:
+        return _update_profile(profile, *update_args)
+    finally:
+        del update_args
+        utils.release_shared_memory(shared_blocks)
 
 
 class BaseColumnProfileCompiler(with_metaclass(abc.ABCMeta, object)):
@@ -19,22 +60,42 @@ class BaseColumnProfileCompiler(with_metaclass(abc.ABCMeta, object)):
     def __repr__(self):
         return self.__class__.__name__
 
-    def __init__(self, df_series=None, options=None, pool=None):
+    def __init__(self, df_series=None, options=None, pool=None,
+                 typed_view=None):
         if not self._profilers:
             raise NotImplementedError("Must add profilers.")
 
         self._profiles = OrderedDict()
         if df_series is not None:
             self.name = df_series.name
-            self._create_profile(df_series, options, pool)
+            self._create_profile(df_series, options, pool, typed_view)
 
         
     @property
     @abc.abstractmethod
     def profile(self):
         raise NotImplementedError()
+
+    def get_profile(self, keys=None):
+        """
+        Returns the profile of the compiled profilers with only the given
+        keys, computing only those of each profiler.
+
+        :param keys: keys of the column report to select, all if None, where
+            a '.' represents a level of recursion and '*' matches any key
+        :type keys: list(str)
+        :return: profile of the compiled profilers
+        :rtype: dict
+        """
+        if keys is None:
+            return self.profile
+        profile = dict()
+        for _, profiler in self._profiles.items():
+            utils.dict_merge(profile, profiler.get_profile(keys))
+        return profile
     
-    def _create_profile(self, df_series, options=None, pool=None):
+    def _create_profile(self, df_series, options=None, pool=None,
+                        typed_view=None):
         """
         Initializes and evaluates all profilers for the given dataframe.
         
@@ -42,6 +103,8 @@ class BaseColumnProfileCompiler(with_metaclass(abc.ABCMeta, object)):
         :type df_series: pandas.core.series.Series
         :param options: Options for the structured profiler
         :type options: StructuredOptions
+        :param typed_view: values of df_series already parsed
+        :type typed_view: utils.TypedView
         :return: None
         :rtype: None
         """
@@ -60,9 +123,13 @@ class BaseColumnProfileCompiler(with_metaclass(abc.ABCMeta, object)):
             if selected_col_profiles is None or \
                col_profile_type.col_type in selected_col_profiles:
 
+                # Only the options of the profiler are copied, rather than
+                # all the properties for each profiler
                 col_options = None
-                if options and options.properties[col_profile_type.col_type]:
-                    col_options = options.properties[col_profile_type.col_type]
+                if options and getattr(options, col_profile_type.col_type,
+                                       None):
+                    col_options = copy.deepcopy(
+                        getattr(options, col_profile_type.col_type))
                     
                 try:
                     self._profiles[col_profile_type.col_type] = \
@@ -71,7 +138,7 @@ class BaseColumnProfileCompiler(with_metaclass(abc.ABCMeta, object)):
                     utils.warn_on_profile(col_profile_type.col_type, e)
 
         # Update profile after creation
-        self.update_profile(df_series, pool)
+        self.update_profile(df_series, pool, typed_view)
 
     def __add__(self, other):
         """
@@ -100,39 +167,111 @@ class BaseColumnProfileCompiler(with_metaclass(abc.ABCMeta, object)):
             )
         return merged_profile_compiler
 
-    def update_profile(self, df_series, pool=None):
+    @staticmethod
+    def merge_many(profile_compilers, executor=None):
+        """
+        Merges many profile compilers together as a balanced binary tree of
+        pairwise merges, equivalent to adding them all with the `+` operator.
+
+        :param profile_compilers: profile compilers to merge
+        :type profile_compilers: list(BaseColumnProfileCompiler)
+        :param executor: executor whose `map` executes the merges of each level
+            of the tree in parallel
+        :type executor: Union[concurrent.futures.Executor, multiprocessing.Pool]
+        :return: merger of the profile compilers
+        :rtype: BaseColumnProfileCompiler
+        """
+        return utils.merge_in_trees({0: profile_compilers}, executor)[0]
+
+    def _get_update_args(self, df_series, typed_view=None):
+        """
+        Arguments the profiles are updated with, computed once per update for
+        all the profiles.
+
+        :param df_series: a given column, assume df_series in str
+        :type df_series: pandas.core.series.Series
+        :param typed_view: values of df_series already parsed
+        :type typed_view: utils.TypedView
+        :return: arguments of the update
+        :rtype: tuple
+        """
+        return (df_series,)
+
+    def _update_column_profile(self, col_profile, df_series, *update_args):
+        """
+        Updates one of the profiles in this process.
+
+        :param col_profile: name of the profile
+        :type col_profile: str
+        :param df_series: a given column, assume df_series in str
+        :type df_series: pandas.core.series.Series
+        :param update_args: arguments of the update following the column
+        :type update_args: tuple
+        :return: None
+        """
+        _update_profile(self._profiles[col_profile], df_series, *update_args)
+
+    @tracing.traced_method()
+    def update_profile(self, df_series, pool=None, typed_view=None):
         """
         Updates the profiles from the data frames
         
         :param df_series: a given column, assume df_series in str
         :type df_series: pandas.core.series.Series
         :param pool: pool to utilized for multiprocessing
-        :type pool: multiprocessing.Pool
+        :type pool: Union[multiprocessing.Pool, utils.AutoPool]
+        :param typed_view: values of df_series already parsed, e.g. from
+            their native dtype, parsed by the compilers needing it if None
+        :type typed_view: utils.TypedView
         :return: Self
         :rtype: BaseColumnProfileCompiler
         """
         
         if len(self._profilers) == 0:
             return 
+
+        update_args = self._get_update_args(df_series, typed_view)
         
         # If single process, loop and return
         if pool is None:
             for col_profile in self._profiles:
-                self._profiles[col_profile].update(df_series)
+                self._update_column_profile(col_profile, *update_args)
             return self
         
         # If multiprocess, setup pool, etc
         single_process_list = []
         multi_process_dict = {}
-        
+
+        # Arguments are published once to shared memory for all process
+        # profilers, those which cannot be shared are pickled
+        shared_blocks, shared_args = [], None
+
         # Spin off seperate processes, where possible
         for col_profile in self._profiles:
-            
+
+            # Select processes or threads, None if run in this process
+            profile_pool = utils.select_pool(pool, self._profiles[col_profile])
+            if profile_pool is None:
+                single_process_list.append(col_profile)
+                continue
+
             if self._profiles[col_profile].thread_safe:
                 
                 try: # Add update function to be applied on the pool
-                    multi_process_dict[col_profile] = pool.apply_async(
-                        self._profiles[col_profile].update, (df_series,))
+                    use_shared_memory = utils.can_share_memory(profile_pool)
+                    if use_shared_memory and shared_args is None:
+                        shared_blocks, shared_args = \
+                            utils.share_args(update_args)
+                    if use_shared_memory and shared_blocks:
+                        multi_process_dict[col_profile] = \
+                            profile_pool, utils.apply_async(
+                                profile_pool, _update_profile_from_shared_data,
+                                (self._profiles[col_profile],) + shared_args)
+                    else:
+                        multi_process_dict[col_profile] = \
+                            profile_pool, utils.apply_async(
+                                profile_pool, _update_profile,
+                                (self._profiles[col_profile],) + update_args)
                 except Exception as e: # Attempt again as a single process
                     self._profiles[col_profile].thread_safe = False
                 
@@ -141,22 +280,27 @@ class BaseColumnProfileCompiler(with_metaclass(abc.ABCMeta, object)):
 
         # Single process thread to loop through any known unsafe
         for col_profile in single_process_list:
-            self._profiles[col_profile].update(df_series)
+            self._update_column_profile(col_profile, *update_args)
                 
         # Loop through remaining multiprocesses and close them out
         single_process_list = []
         for col_profile in multi_process_dict.keys():
             try:
-                returned_profile = multi_process_dict[col_profile].get()
+                with tracing.span('pool_wait', profile=col_profile):
+                    returned_profile = utils.get_async_result(
+                        *multi_process_dict[col_profile])
                 if returned_profile is not None:
                     self._profiles[col_profile] = returned_profile
             except Exception as e: # Attempt again as a single process
                 self._profiles[col_profile].thread_safe = False            
                 single_process_list.append(col_profile)                
+
+        # All workers are done with the shared data
+        utils.release_shared_memory(shared_blocks, unlink=True)
         
         # Single process thread to loop through
         for col_profile in single_process_list:
-            self._profiles[col_profile].update(df_series)
+            self._update_column_profile(col_profile, *update_args)
         return self
 
 
@@ -170,21 +314,54 @@ class ColumnPrimitiveTypeProfileCompiler(BaseColumnProfileCompiler):
         TextColumn,
     ]
 
+    def _get_update_args(self, df_series, typed_view=None):
+        """
+        Arguments the profiles are updated with: the column and its typed view,
+        so each value is parsed once for all the profiles rather than by each.
+
+        :param df_series: a given column, assume df_series in str
+        :type df_series: pandas.core.series.Series
+        :param typed_view: values of df_series already parsed, parsed here if
+            None
+        :type typed_view: utils.TypedView
+        :return: arguments of the update
+        :rtype: tuple(pandas.core.series.Series, utils.TypedView)
+        """
+        if typed_view is None:
+            with tracing.span('typed_view'):
+                typed_view = utils.get_typed_view(df_series)
+        return df_series, typed_view
+
     @property
     def profile(self):
+        return self.get_profile()
+
+    def get_profile(self, keys=None):
+        """
+        Returns the profile of the matched data type, computing its statistics
+        only if selected by the given keys.
+
+        :param keys: keys of the column report to select, all if None
+        :type keys: list(str)
+        :return: profile of the compiled profilers
+        :rtype: dict
+        """
         profile = {
             "data_type_representation": dict(),
             "data_type": None,
             "statistics": dict()
         }
         has_found_match = False
-        
+        stats_keys = None
+        if keys is not None:
+            stats_keys = _get_selected_keys("statistics", keys)
+
         for _, profiler in self._profiles.items():
             if not has_found_match and profiler.data_type_ratio == 1.0:
-                profile.update({
-                    "data_type": profiler.col_type,
-                    "statistics": profiler.profile,
-                })
+                profile["data_type"] = profiler.col_type
+                if keys is None or stats_keys is not None:
+                    profile["statistics"] = profiler.get_profile(
+                        stats_keys or None)
                 has_found_match = True
             profile["data_type_representation"].update(
                 dict([(profiler.col_type, profiler.data_type_ratio)])
@@ -217,12 +394,31 @@ class ColumnDataLabelerCompiler(BaseColumnProfileCompiler):
 
     @property
     def profile(self):
+        return self.get_profile()
+
+    def get_profile(self, keys=None):
+        """
+        Returns the profile of the data labeler, computing the label and its
+        statistics only if selected by the given keys.
+
+        :param keys: keys of the column report to select, all if None
+        :type keys: list(str)
+        :return: profile of the compiled profilers
+        :rtype: dict
+        """
         profile = {
             "data_label": None,
             "statistics": dict()
         }
+        stats_keys = None
+        if keys is not None:
+            stats_keys = _get_selected_keys("statistics", keys)
         # TODO: Only works for last profiler. Abstracted for now.
         for _, profiler in self._profiles.items():
-            profile["data_label"] = profiler.data_label
-            profile["statistics"].update(profiler.profile)
+            if keys is None or \
+                    _get_selected_keys("data_label", keys) is not None:
+                profile["data_label"] = profiler.data_label
+            if keys is None or stats_keys is not None:
+                profile["statistics"].update(
+                    profiler.get_profile(stats_keys or None))
         return profile
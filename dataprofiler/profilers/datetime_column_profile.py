@@ -37,6 +37,13 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler):
         "%H:%M:%S.%f"  # 05:46:30.258509
     ]
 
+    # formats of native datetimes formatted as strings, without and with
+    # fractions of a second
+    _native_date_formats = [
+        "%Y-%m-%d %H:%M:%S",  # 2013-03-5 15:43:30
+        "%Y-%m-%d %H:%M:%S.%f",  # 2013-03-5 15:43:30.123456
+    ]
+
     def __init__(self, name, options=None):
         """
         Initialization of column base properties and itself.
@@ -237,12 +244,16 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler):
         profile["match_count"] = is_row_datetime.sum()
         return profile
 
-    def _is_subset_datetime_column(self, df_series):
+    def _is_subset_datetime_column(self, df_series,
+                                   is_datetime_candidate=None):
         """
         Checks whether a subset of the data could be considered datetime.
         
-        :param df_series: df series
+        :param df_series: df series, indexed by position
         :type df_series: pandas.core.series.Series
+        :param is_datetime_candidate: whether each row could be a datetime,
+            all rows are checked if None
+        :type is_datetime_candidate: numpy.ndarray
         :return: True or False
         :rtype: bool
         """
@@ -251,7 +262,10 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler):
         num_samples_to_check = 50
         thresh = 0.10
         sample_size = min(num_samples_to_check, len(df_series))
-        profile = self._get_datetime_profile(df_series.sample(sample_size))
+        df_sample = df_series.sample(sample_size)
+        if is_datetime_candidate is not None:
+            df_sample = df_sample[is_datetime_candidate[df_sample.index]]
+        profile = self._get_datetime_profile(df_sample)
 
         if profile["match_count"] / sample_size < thresh:
             return False
@@ -281,9 +295,51 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler):
                 self.date_formats, date_formats
             )
 
-        # min datetime
-        min_obj = profile.pop("min_obj")
-        min_dt_value = profile.pop("min")
+        self._update_min_max(profile.pop("min"), profile.pop("min_obj"),
+                             profile.pop("max"), profile.pop("max_obj"))
+        subset_properties.update(profile)
+
+    @BaseColumnProfiler._timeit(name="datetime")
+    def _update_native_datetime(self, datetimes, prev_dependent_properties,
+                                subset_properties):
+        """
+        Calculates the datetime properties for the profile from native
+        datetimes, which are all datetimes, without parsing them.
+
+        :param datetimes: nanoseconds since the epoch of each value
+        :type datetimes: numpy.ndarray
+        :param prev_dependent_properties: Contains all the previous properties
+        that the calculations depend on.
+        :type prev_dependent_properties: dict
+        :param subset_properties: Contains the results of the properties of the
+        subset before they are merged into the main data profile.
+        :type subset_properties: dict
+        :return:
+        """
+        has_fractions = bool(np.any(datetimes % 10 ** 9))
+        self.date_formats = self._combine_unique_sets(
+            self.date_formats, [self._native_date_formats[has_fractions]])
+
+        # formatted as the native values are formatted for the other profilers
+        min_obj = pd.Timestamp(datetimes.min())
+        max_obj = pd.Timestamp(datetimes.max())
+        self._update_min_max(str(min_obj), min_obj, str(max_obj), max_obj)
+        subset_properties["match_count"] = len(datetimes)
+
+    def _update_min_max(self, min_dt_value, min_obj, max_dt_value, max_obj):
+        """
+        Updates the min and max of the profile with those of a subset.
+
+        :param min_dt_value: min of the subset as formatted in the data
+        :type min_dt_value: str
+        :param min_obj: min of the subset
+        :type min_obj: datetime.datetime
+        :param max_dt_value: max of the subset as formatted in the data
+        :type max_dt_value: str
+        :param max_obj: max of the subset
+        :type max_obj: datetime.datetime
+        :return: None
+        """
         if not self._dt_obj_min:
             self._dt_obj_min = min_obj
             self.min = min_dt_value
@@ -291,8 +347,6 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler):
             self._dt_obj_min = min_obj
             self.min = min_dt_value
 
-        max_obj = profile.pop("max_obj")
-        max_dt_value = profile.pop("max")
         if not self._dt_obj_max:
             self._dt_obj_max = max_obj
             self.max = max_dt_value
@@ -300,8 +354,6 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler):
             self._dt_obj_max = max_obj
             self.max = max_dt_value
 
-        subset_properties.update(profile)
-
     def _update_helper(self, df_series, profile):
         """
         Method for updating the column profile properties.
@@ -314,12 +366,16 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler):
         """
         self._update_column_base_properties(profile)
 
-    def update(self, df_series):
+    def update(self, df_series, typed_view=None):
         """
         Updates the column profile.
         
         :param df_series: df series
         :type df_series: pandas.core.series.Series
+        :param typed_view: values of df_series already parsed, whose datetime
+            candidates are the only rows checked for datetimes, native
+            datetimes being used as is
+        :type typed_view: utils.TypedView
         :return: None
         """
         if len(df_series) == 0:
@@ -327,8 +383,23 @@ class DateTimeColumn(BaseColumnPrimitiveTypeProfiler):
         
         df_series = df_series.reset_index(drop=True)
         profile = {"sample_size": len(df_series), "match_count": 0}
-        if self._is_subset_datetime_column(df_series):
-            self._update_datetime(df_series, {}, profile)
+        is_datetime_candidate = None
+        if typed_view is not None:
+            is_datetime_candidate = typed_view.is_datetime_candidate
+        if typed_view is not None \
+                and np.all(typed_view.datetimes != utils.NAT_VALUE):
+            self._update_native_datetime(typed_view.datetimes, {}, profile)
+            super(DateTimeColumn, self)._perform_property_calcs(
+                self.__calculations,
+                df_series=df_series,
+                prev_dependent_properties={},
+                subset_properties=profile)
+        elif self._is_subset_datetime_column(df_series,
+                                             is_datetime_candidate):
+            df_datetime = df_series
+            if is_datetime_candidate is not None:
+                df_datetime = df_series[is_datetime_candidate]
+            self._update_datetime(df_datetime, {}, profile)
             super(DateTimeColumn, self)._perform_property_calcs(
                 self.__calculations,
                 df_series=df_series,
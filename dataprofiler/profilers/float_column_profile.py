@@ -2,11 +2,13 @@ import re
 import copy
 import math
 import numpy as np
+import pandas as pd
 
 from .numerical_column_stats import NumericStatsMixin
 from .base_column_profilers import BaseColumnProfiler, \
     BaseColumnPrimitiveTypeProfiler
 from .profiler_options import FloatOptions
+from .helpers.report_helpers import _select_keys
 
 
 class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
@@ -118,17 +120,28 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
     def profile(self):
         """
         Property for profile. Returns the profile of the column.
-        :return:
         """
+        return self.get_profile()
 
+    def get_profile(self, keys=None):
+        """
+        Returns the profile of the column, computing the histogram and
+        quantiles only if selected by the given keys.
+
+        :param keys: keys of the profile to select, all if None
+        :type keys: list(str)
+        :return: profile of the column
+        :rtype: dict
+        """
         profile = dict(
             min=self.np_type_to_type(self.min),
             max=self.np_type_to_type(self.max),
             mean=self.np_type_to_type(self.mean),
             variance=self.np_type_to_type(self.variance),
             stddev=self.np_type_to_type(self.stddev),
-            histogram=self._get_best_histogram_for_profile(),
-            quantiles=self.quantiles,
+        )
+        profile.update(self._get_histogram_profile(keys))
+        profile.update(
             times=self.times,
             precision=dict(
                 min=self.np_type_to_type(self.precision['min']),
@@ -141,7 +154,9 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
                 confidence_level=self.np_type_to_type(self.precision['confidence_level'])
             )
         )
-        
+
+        if keys is not None:
+            profile = _select_keys(profile, keys)
         return profile
 
     @property
@@ -305,27 +320,36 @@ class FloatColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         """
         super(FloatColumn, self)._update_helper(df_series, subset_properties)
         
-    def update(self, df_series):
+    def update(self, df_series, typed_view=None):
         """
         Updates the column profile.
         :param df_series: df series
         :type df_series: pandas.core.series.Series
+        :param typed_view: values of df_series already parsed, parsed here if
+            None
+        :type typed_view: utils.TypedView
         :return: None
         """
         if len(df_series) == 0:
             return self
         
-        is_each_row_float = self._is_each_row_float(df_series)
+        if typed_view is None:
+            is_each_row_float = self._is_each_row_float(df_series)
+            df_series_clean = df_series[is_each_row_float]
+        else:
+            is_each_row_float = typed_view.is_float
+            df_series_clean = pd.Series(typed_view.floats[is_each_row_float])
         sample_size = len(is_each_row_float)
         float_count = np.sum(is_each_row_float)
         profile = dict(match_count=float_count, sample_size=sample_size)
 
+        # precision is determined from the string values
         BaseColumnProfiler._perform_property_calcs(
             self, self.__calculations, df_series=df_series[is_each_row_float],
             prev_dependent_properties={}, subset_properties=profile)
 
         self._update_helper(
-            df_series_clean=df_series[is_each_row_float],
+            df_series_clean=df_series_clean,
             profile=profile
         )
 
@@ -155,3 +155,53 @@ def _prepare_report(report, output_format=None, omit_keys=[]):
         fmt_report = flat_dict(fmt_report)
 
     return fmt_report
+
+
+def _get_selected_keys(key, keys):
+    """
+    Determines whether a key of a report is selected by the given keys, and
+    which of its subkeys are.
+
+    :param key: key of the report
+    :type key: str
+    :param keys: keys to select, where a '.' represents a level of recursion
+        and '*' matches any key, as for the omitted keys of `_prepare_report`
+    :type keys: list(str)
+    :return: None if the key is not selected, an empty list if it is selected
+        entirely, otherwise the keys selected within it
+    :rtype: list(str)
+    """
+    selected_keys = []
+    for select_key in keys:
+        prior_key_layer, _, next_key_layer = select_key.partition('.')
+        if prior_key_layer == '*' or prior_key_layer == str(key):
+            if not next_key_layer:
+                return []
+            selected_keys.append(next_key_layer)
+    return selected_keys or None
+
+
+def _select_keys(report, keys):
+    """
+    Selects the given keys of a report, dropping all others.
+
+    :param report: contains the values identified from the profile
+    :type report: dict()
+    :param keys: keys to select, where a '.' represents a level of recursion
+        and '*' matches any key, example: report: { 'test1': { 'test2': val,
+        'test3': val }, to only select 'test3': keys=['test1.test3']
+    :type keys: list(str)
+    :return report: report of the selected keys
+    :type report: dict()
+    """
+    selected_report = type(report)()
+    for key, value in report.items():
+        selected_keys = _get_selected_keys(key, keys)
+        if selected_keys is None:
+            continue
+        if selected_keys:
+            if not isinstance(value, dict):
+                continue
+            value = _select_keys(value, selected_keys)
+        selected_report[key] = value
+    return selected_report
@@ -0,0 +1,148 @@
+"""
+coding=utf-8
+
+HyperLogLog sketch estimating the number of distinct 64-bit hashes within a
+bounded amount of memory.
+"""
+import numpy as np
+
+
+def _bit_length(values):
+    """
+    Number of bits required to represent each of the unsigned 64-bit values.
+
+    :param values: unsigned 64-bit values
+    :type values: numpy.ndarray
+    :return: bit length of each value, 0 for 0
+    :rtype: numpy.ndarray
+    """
+    values = values.astype(np.uint64)
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    # 32-bit values are exact as floats, their exponent is the bit length
+    return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+
+
+class HyperLogLog(object):
+
+    min_precision = 4
+    max_precision = 18
+
+    def __init__(self, precision=14):
+        """
+        Initialization of the HyperLogLog sketch. Each hash is assigned to one
+        of `2 ** precision` registers by its leading bits, which keeps the
+        longest run of leading zeros seen in the remaining bits. The standard
+        error of the estimate is about `1.04 / sqrt(2 ** precision)`.
+
+        :param precision: number of bits used to index the registers
+        :type precision: int
+        """
+        if not isinstance(precision, int) \
+                or not self.min_precision <= precision <= self.max_precision:
+            raise ValueError("HyperLogLog precision must be an integer from {} "
+                             "to {}.".format(self.min_precision,
+                                             self.max_precision))
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    def __add__(self, other):
+        """
+        Merges two sketches together overriding the `+` operator. The merged
+        sketch has the lower precision of the two.
+
+        :param other: sketch being added to this one
+        :type other: HyperLogLog
+        :return: union of the two sketches
+        :rtype: HyperLogLog
+        """
+        if not isinstance(other, HyperLogLog):
+            raise TypeError('`{}` and `{}` are not of the same sketch type.'
+                            .format(type(self).__name__, type(other).__name__))
+        merged_sketch = HyperLogLog(min(self.precision, other.precision))
+        merged_sketch.merge(self)
+        merged_sketch.merge(other)
+        return merged_sketch
+
+    def update(self, hashes):
+        """
+        Adds 64-bit hashes, e.g. from `pandas.util.hash_pandas_object`, to the
+        sketch.
+
+        :param hashes: hashes to add
+        :type hashes: Union[numpy.ndarray, pandas.Series, list(int)]
+        :return: None
+        """
+        hashes = np.asarray(hashes).astype(np.uint64, copy=False).ravel()
+        if not len(hashes):
+            return
+        remaining_bits = 64 - self.precision
+        indices = (hashes >> np.uint64(remaining_bits)).astype(np.intp)
+        remainder = hashes & np.uint64((1 << remaining_bits) - 1)
+        ranks = (remaining_bits - _bit_length(remainder) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, indices, ranks)
+
+    def merge(self, other):
+        """
+        Merges the hashes of another sketch into this one, lowering this
+        sketch's precision if the other's is lower.
+
+        :param other: sketch to merge into this one
+        :type other: HyperLogLog
+        :return: None
+        """
+        if other.precision < self.precision:
+            self.registers = self._reduce_registers(
+                self.registers, self.precision, other.precision)
+            self.precision = other.precision
+        np.maximum(self.registers, self._reduce_registers(
+            other.registers, other.precision, self.precision),
+            out=self.registers)
+
+    @staticmethod
+    def _reduce_registers(registers, precision, new_precision):
+        """
+        Folds registers into those of a lower precision. The index bits dropped
+        become the leading bits of the remainder used to rank the hash.
+
+        :param registers: registers of the sketch
+        :type registers: numpy.ndarray
+        :param precision: precision of the registers
+        :type precision: int
+        :param new_precision: precision to reduce the registers to
+        :type new_precision: int
+        :return: registers of the new precision
+        :rtype: numpy.ndarray
+        """
+        dropped_bits = precision - new_precision
+        if not dropped_bits:
+            return registers
+        dropped = np.arange(len(registers), dtype=np.uint64) \
+            & np.uint64((1 << dropped_bits) - 1)
+        ranks = np.where(dropped > 0,
+                         dropped_bits - _bit_length(dropped) + 1,
+                         registers.astype(np.int64) + dropped_bits)
+        ranks[registers == 0] = 0
+        return ranks.astype(np.uint8).reshape(
+            2 ** new_precision, 2 ** dropped_bits).max(axis=1)
+
+    def count(self):
+        """
+        Estimates the number of distinct hashes added to the sketch. Small
+        cardinalities are estimated by linear counting of the empty registers.
+
+        :return: estimated number of distinct hashes
+        :rtype: float
+        """
+        num_registers = len(self.registers)
+        if num_registers >= 128:
+            alpha = 0.7213 / (1 + 1.079 / num_registers)
+        else:
+            alpha = {16: 0.673, 32: 0.697, 64: 0.709}[num_registers]
+        estimate = alpha * num_registers ** 2 \
+            / np.sum(np.ldexp(1., -self.registers.astype(np.int64)))
+
+        num_zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * num_registers and num_zeros:
+            estimate = num_registers * np.log(num_registers / num_zeros)
+        return float(estimate)
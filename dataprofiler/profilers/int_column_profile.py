@@ -1,9 +1,11 @@
 import numpy as np
+import pandas as pd
 
 from .numerical_column_stats import NumericStatsMixin
 from .base_column_profilers import BaseColumnProfiler, \
     BaseColumnPrimitiveTypeProfiler
 from .profiler_options import IntOptions
+from .helpers.report_helpers import _select_keys
 
 
 class IntColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
@@ -57,8 +59,18 @@ class IntColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
     def profile(self):
         """
         Property for profile. Returns the profile of the column.
-        
-        :return:
+        """
+        return self.get_profile()
+
+    def get_profile(self, keys=None):
+        """
+        Returns the profile of the column, computing the histogram and
+        quantiles only if selected by the given keys.
+
+        :param keys: keys of the profile to select, all if None
+        :type keys: list(str)
+        :return: profile of the column
+        :rtype: dict
         """
         profile = dict(
             min=self.np_type_to_type(self.min),
@@ -66,11 +78,12 @@ class IntColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             mean=self.np_type_to_type(self.mean),
             variance=self.np_type_to_type(self.variance),
             stddev=self.np_type_to_type(self.stddev),
-            histogram=self._get_best_histogram_for_profile(),
-            quantiles=self.quantiles,
-            times=self.times
         )
+        profile.update(self._get_histogram_profile(keys))
+        profile['times'] = self.times
 
+        if keys is not None:
+            profile = _select_keys(profile, keys)
         return profile
 
 
@@ -122,19 +135,27 @@ class IntColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             NumericStatsMixin._update_helper(self, df_series_clean, profile)
         self._update_column_base_properties(profile)
 
-    def update(self, df_series):
+    def update(self, df_series, typed_view=None):
         """
         Updates the column profile.
         
         :param df_series: df series
         :type df_series: pandas.core.series.Series
+        :param typed_view: values of df_series already parsed, parsed here if
+            None
+        :type typed_view: utils.TypedView
         :return: None
         """
         if len(df_series) == 0:
             return self
         
         df_series = df_series.reset_index(drop=True)
-        is_each_row_int = self._is_each_row_int(df_series)
+        if typed_view is None:
+            is_each_row_int = self._is_each_row_int(df_series)
+            df_series_clean = df_series[is_each_row_int]
+        else:
+            is_each_row_int = typed_view.is_int
+            df_series_clean = pd.Series(typed_view.floats[is_each_row_int])
         sample_size = len(is_each_row_int)
         match_int_count = np.sum(is_each_row_int)
         profile = dict(match_count=match_int_count, sample_size=sample_size)
@@ -144,7 +165,7 @@ class IntColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
             prev_dependent_properties={}, subset_properties=profile)
 
         self._update_helper(
-            df_series_clean=df_series[is_each_row_int],
+            df_series_clean=df_series_clean,
             profile=profile
         )
 
@@ -16,6 +16,7 @@ import numpy as np
 
 from . import histogram_utils
 from .base_column_profilers import BaseColumnProfiler
+from .helpers.report_helpers import _get_selected_keys
 from .profiler_options import NumericalOptions
 
 
@@ -30,6 +31,55 @@ class abstractstaticmethod(staticmethod):
     __isabstractmethod__ = True
 
 
+class _HistogramMethodState(object):
+    """
+    Losses and suggested bin count of a histogram bin method, along with its
+    histogram once computed. Its items are accessed as those of a dict, e.g.
+    `state['total_loss']`.
+    """
+
+    __slots__ = ('total_loss', 'current_loss', 'suggested_bin_count',
+                 '_histogram')
+
+    _keys = ('total_loss', 'current_loss', 'suggested_bin_count', 'histogram')
+
+    def __init__(self, suggested_bin_count=None):
+        """
+        Initialization of the state of a histogram bin method.
+
+        :param suggested_bin_count: number of bins suggested by the method
+        :type suggested_bin_count: int
+        """
+        self.total_loss = 0
+        self.current_loss = 0
+        self.suggested_bin_count = suggested_bin_count
+        self._histogram = None
+
+    @property
+    def histogram(self):
+        """
+        Histogram of the method, with bin counts and edges of None if it has
+        not been computed yet.
+        """
+        if self._histogram is None:
+            return {'bin_counts': None, 'bin_edges': None}
+        return self._histogram
+
+    @histogram.setter
+    def histogram(self, histogram):
+        self._histogram = histogram
+
+    def __getitem__(self, key):
+        if key not in self._keys:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self._keys:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+
 class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
     """
     Abstract numerical column profile subclass of BaseColumnProfiler. Represents
@@ -37,6 +87,10 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
     """
     col_type = None
 
+    # the quantiles are derived from the stored histogram when requested, as
+    # storing them would take most of the memory of the profile
+    num_quantiles = 1000  # TODO: add to options
+
     def __init__(self, options=None):
         """
         Initialization of column base properties and itself.
@@ -79,17 +133,8 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
                 }
             }
         for method in self.histogram_bin_method_names:
-            self.histogram_methods[method] = {
-                'total_loss': 0,
-                'current_loss': 0,
-                'suggested_bin_count': self.min_histogram_bin,
-                'histogram': {
-                    'bin_counts': None,
-                    'bin_edges': None
-                }
-            }
-        num_quantiles = 1000  # TODO: add to options
-        self.quantiles = {bin_num: None for bin_num in range(num_quantiles - 1)}
+            self.histogram_methods[method] = _HistogramMethodState(
+                self.min_histogram_bin)
         self.__calculations = {
             "min": NumericStatsMixin._get_min,
             "max": NumericStatsMixin._get_max,
@@ -140,14 +185,7 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
         self.histogram_bin_method_names = bin_methods
         self.histogram_methods = dict()
         for method in self.histogram_bin_method_names:
-            self.histogram_methods[method] = {
-                'total_loss': 0,
-                'current_loss': 0,
-                'histogram': {
-                    'bin_counts': None,
-                    'bin_edges': None
-                }
-            }
+            self.histogram_methods[method] = _HistogramMethodState()
 
         combined_values = np.concatenate([other1._histogram_to_array(),
                                           other2._histogram_to_array()])
@@ -159,8 +197,6 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
         self._stored_histogram['histogram']['current_loss'] = histogram_loss
         self._stored_histogram['histogram']['total_loss'] = histogram_loss
 
-        self._get_quantiles()
-
     def _add_helper(self, other1, other2):
         """
         Helper function for merging profiles.
@@ -185,10 +221,12 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
                 self._add_helper_merge_profile_histograms(other1, other2)
             elif not other2._has_histogram:
                 self.histogram_methods = other1.histogram_methods
-                self.quantiles = other1.quantiles
+                self._stored_histogram = copy.deepcopy(
+                    other1._stored_histogram)
             else:
                 self.histogram_methods = other2.histogram_methods
-                self.quantiles = other2.quantiles
+                self._stored_histogram = copy.deepcopy(
+                    other2._stored_histogram)
         if "min" in self.__calculations.keys():
             if other1.min is not None and other2.min is not None:
                 self.min = min(other1.min, other2.min)
@@ -408,10 +446,8 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
                 unique_value = values.iloc[0]
             bin_edges = np.array([unique_value, unique_value])
             for bin_method in self.histogram_bin_method_names:
-                self.histogram_methods[bin_method]['histogram'][
-                    'bin_counts'] = bin_counts
-                self.histogram_methods[bin_method]['histogram'][
-                    'bin_edges'] = bin_edges
+                self.histogram_methods[bin_method]['histogram'] = {
+                    'bin_counts': bin_counts, 'bin_edges': bin_edges}
                 self.histogram_methods[bin_method]['suggested_bin_count'] = 1
         else:
             # if user set the bin count, then use the user set count to
@@ -431,10 +467,7 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
                     suggested_bin_count = min(suggested_bin_count,
                                               self.max_histogram_bin)
                     n_equal_bins = max(n_equal_bins, suggested_bin_count)
-                self.histogram_methods[bin_method]['histogram'][
-                    'bin_counts'] = None
-                self.histogram_methods[bin_method]['histogram'][
-                    'bin_edges'] = None
+                self.histogram_methods[bin_method]['histogram'] = None
                 self.histogram_methods[bin_method]['suggested_bin_count'] = \
                     suggested_bin_count
 
@@ -596,6 +629,23 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
                     best_hist_loss = hist_loss
         return self.histogram_methods[self.histogram_selection]['histogram']
 
+    def _get_histogram_profile(self, keys=None):
+        """
+        Returns the histogram and quantiles of the profile, each only if
+        selected by the given keys, as they are its costliest statistics.
+
+        :param keys: keys of the profile to compute, all if None
+        :type keys: list(str)
+        :return: histogram and quantiles of the profile
+        :rtype: dict
+        """
+        profile = dict()
+        if keys is None or _get_selected_keys('histogram', keys) is not None:
+            profile['histogram'] = self._get_best_histogram_for_profile()
+        if keys is None or _get_selected_keys('quantiles', keys) is not None:
+            profile['quantiles'] = self.quantiles
+        return profile
+
     def _get_percentile(self, percentiles):
         """
         Get value for the number where the given percentage of values fall below
@@ -633,16 +683,37 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
             quantiles[499] = median_value
         return quantiles
 
-    def _get_quantiles(self):
+    @property
+    def quantiles(self):
         """
-        Retrieves the quantile set based on the specified number of quantiles
-        in self.quantiles.
+        Retrieves the quantile set based on the specified number of quantiles,
+        from the stored histogram. Each quantile is None if there is no
+        histogram.
 
         :return: list of quantiles
+        :rtype: Union[list(float), dict(int, None)]
+        """
+        if not self._has_histogram:
+            return dict.fromkeys(range(self.num_quantiles - 1))
+        percentiles = np.linspace(0, 100, self.num_quantiles + 1)[1:-1]
+        return self._get_percentile(percentiles=percentiles)
+
+    def _set_stats_from(self, other):
+        """
+        Sets the statistics of the profile, other than its histogram and
+        quantiles, to those of another profile of the same column, e.g. one
+        updated with every value while this one profiles a sample of them.
+
+        :param other: profile of the same column
+        :type other: NumericStatsMixin
+        :return: None
         """
-        percentiles = np.linspace(0, 100, len(self.quantiles) + 2)[1:-1]
-        self.quantiles = self._get_percentile(
-            percentiles=percentiles)
+        self.min = other.min
+        self.max = other.max
+        self.sum = other.sum
+        self.variance = other.variance
+        self.match_count = other.match_count
+        self.sample_size = other.sample_size
 
     def _update_helper(self, df_series_clean, profile):
         """
@@ -709,8 +780,6 @@ class NumericStatsMixin(with_metaclass(abc.ABCMeta, object)):
         try:
             self._update_histogram(df_series)
             self.histogram_selection = None
-            if self._has_histogram:
-                self._get_quantiles()
         except BaseException:
             warnings.warn(
                 'Histogram error. Histogram and quantile results will not be '
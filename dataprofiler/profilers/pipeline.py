@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+"""
+coding=utf-8
+
+Runs the items of a source through stages, each stage in a thread of its own
+so the stages overlap, e.g. reading the next chunk of data while the current
+one is processed. The stages are connected by bounded queues, hence a fast
+stage is held back by a slower one rather than piling up items in memory.
+"""
+import queue
+import threading
+import time
+
+from .. import tracing
+
+
+_END = object()
+
+
+class Pipeline(object):
+
+    # seconds between checks of whether the pipeline was stopped while a
+    # stage is blocked on a queue
+    _poll_seconds = 0.1
+
+    def __init__(self, stages, depth=1, get_rows=len):
+        """
+        Instantiates a pipeline of the given stages.
+
+        :param stages: name and function of each stage, in order, the first
+            stage being applied to the items of the source and every other
+            stage to the output of the previous one
+        :type stages: list(tuple(str, Callable))
+        :param depth: maximum number of items waiting between two stages
+        :type depth: int
+        :param get_rows: returns the number of rows of an item of the source
+        :type get_rows: Callable
+        """
+        if not isinstance(depth, int) or depth <= 0:
+            raise ValueError("`depth` must be a positive integer.")
+        if not stages:
+            raise ValueError("A pipeline must have at least one stage.")
+        self._stages = list(stages)
+        self._depth = depth
+        self._get_rows = get_rows
+        self._stop = threading.Event()
+        self._error = None
+        self._seconds = 0.
+        self._stage_metrics = dict()
+        self._queue_metrics = dict()
+
+    @property
+    def metrics(self):
+        """
+        Metrics of the last run of the pipeline. For each stage, the number
+        of items and rows it processed, the seconds it was busy processing
+        them and idle waiting on its queues, and its throughput while busy.
+        For each queue, its depth and the maximum and mean number of items
+        waiting in it, measured whenever an item is taken from it.
+
+        :return: metrics of the stages and queues
+        :rtype: dict
+        """
+        stages = dict()
+        for name, stats in self._stage_metrics.items():
+            stages[name] = dict(stats)
+            stages[name]['rows_per_second'] = None
+            if stats['busy_seconds']:
+                stages[name]['rows_per_second'] = \
+                    stats['rows'] / stats['busy_seconds']
+        queues = dict()
+        for name, stats in self._queue_metrics.items():
+            mean_occupancy = None
+            if stats['gets']:
+                mean_occupancy = stats['occupancy_sum'] / stats['gets']
+            queues[name] = {'depth': self._depth,
+                            'max_occupancy': stats['max_occupancy'],
+                            'mean_occupancy': mean_occupancy}
+        return {'seconds': self._seconds, 'stages': stages, 'queues': queues}
+
+    def run(self, source, source_name='read'):
+        """
+        Runs the items of the source through the stages until the source is
+        exhausted. If a stage raises an error, the pipeline is stopped and
+        the error is raised once all the stages have stopped.
+
+        :param source: items to run through the pipeline
+        :type source: Iterable
+        :param source_name: name of the stage iterating over the source
+        :type source_name: str
+        :return: None
+        """
+        names = [source_name] + [name for name, _ in self._stages]
+        self._stop.clear()
+        self._error = None
+        self._stage_metrics = {
+            name: {'items': 0, 'rows': 0, 'busy_seconds': 0.,
+                   'idle_seconds': 0.}
+            for name in names}
+        queues = [queue.Queue(maxsize=self._depth) for _ in self._stages]
+        queue_names = ['{}->{}'.format(names[i], names[i + 1])
+                       for i in range(len(self._stages))]
+        self._queue_metrics = {
+            name: {'max_occupancy': 0, 'occupancy_sum': 0, 'gets': 0}
+            for name in queue_names}
+
+        threads = [threading.Thread(
+            target=self._run_source, args=(source, source_name, queues[0]),
+            name=source_name, daemon=True)]
+        for i, (name, func) in enumerate(self._stages):
+            out_queue = queues[i + 1] if i + 1 < len(queues) else None
+            threads.append(threading.Thread(
+                target=self._run_stage,
+                args=(name, func, queues[i], queue_names[i], out_queue),
+                name=name, daemon=True))
+
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self._seconds = time.perf_counter() - start
+        if self._error is not None:
+            raise self._error
+
+    def _fail(self, error):
+        if self._error is None:
+            self._error = error
+        self._stop.set()
+
+    def _put(self, out_queue, item):
+        while not self._stop.is_set():
+            try:
+                out_queue.put(item, timeout=self._poll_seconds)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, in_queue, queue_name):
+        stats = self._queue_metrics[queue_name]
+        occupancy = in_queue.qsize()
+        stats['max_occupancy'] = max(stats['max_occupancy'], occupancy)
+        stats['occupancy_sum'] += occupancy
+        stats['gets'] += 1
+        while not self._stop.is_set():
+            try:
+                return in_queue.get(timeout=self._poll_seconds)
+            except queue.Empty:
+                continue
+        return _END
+
+    def _run_source(self, source, name, out_queue):
+        stats = self._stage_metrics[name]
+        iterator = iter(source)
+        try:
+            while not self._stop.is_set():
+                start = time.perf_counter()
+                with tracing.span(name):
+                    item = next(iterator, _END)
+                stats['busy_seconds'] += time.perf_counter() - start
+                if item is _END:
+                    break
+                rows = self._get_rows(item)
+                stats['items'] += 1
+                stats['rows'] += rows
+
+                start = time.perf_counter()
+                put = self._put(out_queue, (rows, item))
+                stats['idle_seconds'] += time.perf_counter() - start
+                if not put:
+                    break
+            self._put(out_queue, _END)
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            if hasattr(iterator, 'close'):
+                iterator.close()
+
+    def _run_stage(self, name, func, in_queue, in_queue_name, out_queue):
+        stats = self._stage_metrics[name]
+        try:
+            while True:
+                start = time.perf_counter()
+                entry = self._get(in_queue, in_queue_name)
+                stats['idle_seconds'] += time.perf_counter() - start
+                if entry is _END:
+                    break
+                rows, item = entry
+
+                start = time.perf_counter()
+                with tracing.span(name):
+                    output = func(item)
+                stats['busy_seconds'] += time.perf_counter() - start
+                stats['items'] += 1
+                stats['rows'] += rows
+
+                if out_queue is not None:
+                    start = time.perf_counter()
+                    put = self._put(out_queue, (rows, output))
+                    stats['idle_seconds'] += time.perf_counter() - start
+                    if not put:
+                        break
+            if out_queue is not None:
+                self._put(out_queue, _END)
+        except BaseException as e:
+            self._fail(e)
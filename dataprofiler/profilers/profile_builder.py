@@ -8,10 +8,19 @@ respective parameters.
 from __future__ import print_function
 from __future__ import division
 
+import asyncio
 import copy
+import functools
+import glob
+import io
+import itertools
+import mmap
+import multiprocessing as mp
+import os
 import random
-import re
-from collections import OrderedDict
+import struct
+import weakref
+from collections import OrderedDict, namedtuple
 import warnings
 import pickle
 from datetime import datetime
@@ -20,16 +29,50 @@ import pandas as pd
 import numpy as np
 
 from . import utils
-from .. import data_readers
+from .. import data_readers, tracing
 from .column_profile_compilers import ColumnPrimitiveTypeProfileCompiler, \
     ColumnStatsProfileCompiler, ColumnDataLabelerCompiler
 from ..labelers.data_labelers import DataLabeler
-from .helpers.report_helpers import calculate_quantiles, _prepare_report
+from ..labelers.base_data_labeler import BaseDataLabeler
+from .helpers.report_helpers import calculate_quantiles, _prepare_report, \
+    _get_selected_keys, _select_keys
+from .hyperloglog import HyperLogLog
+from .reservoir import Reservoir
+from .numerical_column_stats import NumericStatsMixin
+from .int_column_profile import IntColumn
+from .float_column_profile import FloatColumn
+from .bitmap import RoaringBitmap, to_row_index
 from .profiler_options import ProfilerOptions, StructuredOptions
+from .pipeline import Pipeline
+
+
+# a chunk whose columns were cleaned, to be profiled. Columns sampled
+# adaptively are cleaned round by round as they are profiled instead, from the
+# sample ids of the chunk
+_CleanedChunk = namedtuple(
+    '_CleanedChunk', ['df', 'clean_sampled_dict', 'base_stats',
+                      'samples_for_row_stats', 'pool', 'pool_size',
+                      'sample_ids', 'sample_size', 'min_true_samples',
+                      'new_profiles'])
 
 
 class StructuredDataProfile(object):
 
+    # Cells matching these values, regardless of case, are null
+    _null_values = frozenset(["", "nan", "none", "null"])
+
+    # Cells only made up of one of these characters are null
+    _null_repeated_chars = frozenset([" ", "-", "_"])
+
+    # Compilers which profile every value, even when the others only profile
+    # the reservoir, as their statistics are cheap to update
+    _every_value_compilers = frozenset(['data_stats_profile'])
+
+    # Profilers whose statistics, other than the histogram, quantiles and
+    # precision, are updated with every value when the others only profile
+    # the reservoir
+    _every_value_numeric_profilers = [IntColumn, FloatColumn]
+
     def __init__(self, df_series=None, sample_size=None, min_sample_size=5000,
                  sampling_ratio=0.2, min_true_samples=None,
                  sample_ids=None, pool=None, options=None):
@@ -64,6 +107,9 @@ class StructuredDataProfile(object):
         self.null_types = list()
         self.null_types_index = {}
         self.profiles = {}
+        self._reservoir = None
+        self._numeric_profiles = None
+        self._profile_cache = None
                          
         if df_series is not None and len(df_series) > 0:
             
@@ -74,6 +120,12 @@ class StructuredDataProfile(object):
                               "All statistics will be based on this subsample and "
                               "not the whole dataset.".format(sample_size))
                 
+            if self._is_sampled_adaptively:
+                self._update_profile_in_rounds(
+                    df_series, sample_size, self._min_true_samples,
+                    sample_ids, pool)
+                return
+
             clean_sampled_df, base_stats = \
                 self.clean_data_and_get_base_stats(
                     df_series=df_series, sample_size=sample_size,
@@ -81,16 +133,20 @@ class StructuredDataProfile(object):
             self.update_column_profilers(clean_sampled_df, pool)
             self._update_base_stats(base_stats)
 
+    @tracing.traced()
     def update_column_profilers(self, clean_sampled_df, pool):
         """
         Calculates type statistics and labels dataset
         
-        :param clean_sampled_df: sampled series with none types dropped
+        :param clean_sampled_df: sampled series with none types dropped, of
+            strings or of a native dtype
         :type clean_sampled_df: Pandas.Series
         :param pool: pool utilized for multiprocessing
         :type pool: multiprocessing.pool
         """
 
+        self._profile_cache = None
+
         if self.name is None:
             self.name = clean_sampled_df.name
         if self.name != clean_sampled_df.name:
@@ -98,33 +154,161 @@ class StructuredDataProfile(object):
                 'Column names have changed, col {} does not match prior name {}',
                 clean_sampled_df.name, self.name
             )
-        
-        # First run, create the compilers
-        if self.profiles is None or len(self.profiles) == 0:
-            self.profiles = {
-                'data_type_profile':
-                ColumnPrimitiveTypeProfileCompiler(
-                    clean_sampled_df, self.options, pool),
-                'data_stats_profile':
-                ColumnStatsProfileCompiler(
-                    clean_sampled_df, self.options, pool)
-            }
-        
-            use_data_labeler = True
-            if self.options and isinstance(self.options, StructuredOptions):
-                use_data_labeler = self.options.data_labeler.is_enabled
 
-            if use_data_labeler:
-                self.profiles.update({
-                    'data_label_profile':
-                    ColumnDataLabelerCompiler(
-                        clean_sampled_df, self.options, pool)
-                })
-        else:
+        # The compilers profiling the reservoir are recreated from it when it
+        # changes, the others are updated with every value
+        reservoir_changed = False
+        if self._reservoir is None and self._reservoir_size is not None:
+            self._reservoir = Reservoir(self._reservoir_size)
+        if self._reservoir is not None:
+            reservoir_changed = self._reservoir.update(clean_sampled_df.values)
+
+        compiler_classes = self._get_compiler_classes()
+        profile_reservoir = False
+        if self._reservoir is not None:
+            profile_reservoir = reservoir_changed \
+                or not set(compiler_classes).issubset(self.profiles)
+            compiler_classes = {
+                name: compiler_class
+                for name, compiler_class in compiler_classes.items()
+                if name in self._every_value_compilers}
+
+        clean_sampled_df, typed_view = self._format_values(clean_sampled_df)
+        if self._reservoir is not None:
+            typed_view = self._update_numeric_profiles(
+                clean_sampled_df, typed_view)
+        for name, compiler_class in compiler_classes.items():
+            if name not in self.profiles:
+                self.profiles[name] = compiler_class(
+                    clean_sampled_df, self.options, pool, typed_view)
+            else:
+                self.profiles[name].update_profile(
+                    clean_sampled_df, pool, typed_view)
+        if profile_reservoir:
+            self._profile_reservoir(pool)
+        elif self._reservoir is not None:
+            self._set_numeric_stats()
+
+    def _get_compiler_classes(self):
+        """
+        Returns the class of each compiler profiling the column, by name.
+
+        :return: class of each compiler
+        :rtype: dict(str, type)
+        """
+        compiler_classes = {
+            'data_type_profile': ColumnPrimitiveTypeProfileCompiler,
+            'data_stats_profile': ColumnStatsProfileCompiler,
+        }
+
+        use_data_labeler = True
+        if self.options and isinstance(self.options, StructuredOptions):
+            use_data_labeler = self.options.data_labeler.is_enabled
+
+        if use_data_labeler:
+            compiler_classes['data_label_profile'] = ColumnDataLabelerCompiler
+        return compiler_classes
 
-            # Profile compilers being updated
-            for profile in self.profiles.values():
-                profile.update_profile(clean_sampled_df, pool)
+    def _update_numeric_profiles(self, df_series, typed_view=None):
+        """
+        Updates the int and float profiles of a column sampled with a
+        reservoir with every value. Their histogram, quantiles and precision
+        are not computed, being profiled from the reservoir instead.
+
+        :param df_series: values of the column as strings
+        :type df_series: pandas.Series
+        :param typed_view: typed view of the values if already computed
+        :type typed_view: utils.TypedView
+        :return: typed view of the values, shared with the other profilers
+        :rtype: utils.TypedView
+        """
+        if self._numeric_profiles is None:
+            self._numeric_profiles = OrderedDict()
+            for profiler_class in self._every_value_numeric_profilers:
+                col_options = getattr(self.options, profiler_class.col_type)
+                if not col_options.is_enabled:
+                    continue
+                col_options = copy.deepcopy(col_options)
+                col_options.histogram_and_quantiles.is_enabled = False
+                if hasattr(col_options, 'precision'):
+                    col_options.precision.is_enabled = False
+                self._numeric_profiles[profiler_class.col_type] = \
+                    profiler_class(self.name, options=col_options)
+
+        if self._numeric_profiles and len(df_series):
+            if typed_view is None:
+                typed_view = utils.get_typed_view(df_series)
+            for numeric_profile in self._numeric_profiles.values():
+                numeric_profile.update(df_series, typed_view)
+        return typed_view
+
+    def _set_numeric_stats(self):
+        """
+        Sets the statistics of the int and float profiles of the reservoir,
+        other than their histogram, quantiles and precision, to those of
+        every value.
+
+        :return: None
+        """
+        data_type_profile = self.profiles.get('data_type_profile')
+        if data_type_profile is None or not self._numeric_profiles:
+            return
+        for col_type, numeric_profile in self._numeric_profiles.items():
+            if col_type in data_type_profile._profiles:
+                data_type_profile._profiles[col_type]._set_stats_from(
+                    numeric_profile)
+
+    @property
+    def _reservoir_size(self):
+        """
+        Size of the reservoir sampling the column, None if it is not sampled
+        with a reservoir.
+        """
+        if isinstance(self.options, StructuredOptions) \
+                and self.options.reservoir.is_enabled:
+            return self.options.reservoir.size
+        return None
+
+    @staticmethod
+    def _format_values(df_series):
+        """
+        Formats native values as strings, for the profilers of strings, along
+        with their typed view so they are typed as is.
+
+        :param df_series: values of the column, of strings or of a native dtype
+        :type df_series: pandas.Series
+        :return: values of the column as strings and their typed view, if
+            native
+        :rtype: tuple(pandas.Series, Optional[utils.TypedView])
+        """
+        if not utils.is_native_series(df_series):
+            return df_series, None
+        typed_view = utils.get_typed_view(df_series)
+        return df_series.map(str), typed_view
+
+    def _profile_reservoir(self, pool=None):
+        """
+        Recreates the compilers which profile the reservoir, rather than every
+        value, from the values of the reservoir.
+
+        :param pool: pool utilized for multiprocessing
+        :type pool: multiprocessing.pool
+        :return: None
+        """
+        self._profile_cache = None
+        values = self._reservoir.values
+        reservoir_df = pd.Series(values, name=self.name,
+                                 dtype=None if values else object)
+        reservoir_df, typed_view = self._format_values(reservoir_df)
+        profiles = dict()
+        for name, compiler_class in self._get_compiler_classes().items():
+            if name not in self._every_value_compilers:
+                profiles[name] = compiler_class(
+                    reservoir_df, self.options, pool, typed_view)
+            elif name in self.profiles:
+                profiles[name] = self.profiles[name]
+        self.profiles = profiles
+        self._set_numeric_stats()
 
     def __add__(self, other):
         """
@@ -168,17 +352,87 @@ class StructuredDataProfile(object):
         )
         samples = list(dict.fromkeys(self.sample + other.sample))
         merged_profile.sample = random.sample(samples, min(len(samples), 5))
+
+        # The profiles of the reservoirs are recreated from their merger
+        if self._reservoir is not None and other._reservoir is not None:
+            merged_profile._reservoir = self._reservoir + other._reservoir
+        if self._numeric_profiles is not None \
+                and other._numeric_profiles is not None:
+            merged_profile._numeric_profiles = OrderedDict(
+                (col_type, numeric_profile
+                 + other._numeric_profiles[col_type])
+                for col_type, numeric_profile
+                in self._numeric_profiles.items())
         for profile_name in self.profiles:
+            if merged_profile._reservoir is not None \
+                    and profile_name not in self._every_value_compilers:
+                continue
             merged_profile.profiles[profile_name] = (
                 self.profiles[profile_name] + other.profiles[profile_name]
             )
+        if merged_profile._reservoir is not None:
+            merged_profile._profile_reservoir()
         return merged_profile
 
+    @staticmethod
+    def merge_many(profiles, executor=None):
+        """
+        Merges many structured profiles together as a balanced binary tree of
+        pairwise merges, equivalent to adding them all with the `+` operator.
+
+        :param profiles: structured profiles to merge
+        :type profiles: list(StructuredDataProfile)
+        :param executor: executor whose `map` executes the merges of each level
+            of the tree in parallel
+        :type executor: Union[concurrent.futures.Executor, multiprocessing.Pool]
+        :return: merger of the structured profiles
+        :rtype: StructuredDataProfile
+        """
+        return utils.merge_in_trees({0: profiles}, executor)[0]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_profile_cache'] = None
+        return state
+
+    def __setstate__(self, state):
+        # profiles saved before the cache and reservoir were added lack them
+        state.setdefault('_profile_cache', None)
+        state.setdefault('_reservoir', None)
+        state.setdefault('_numeric_profiles', None)
+        self.__dict__.update(state)
+
     @property
     def profile(self):
+        """
+        Profile of the column. It is computed once and cached until the column
+        is updated, hence it must not be modified.
+        """
+        if self._profile_cache is None:
+            self._profile_cache = self._get_profile()
+        return self._profile_cache
+
+    def get_profile(self, keys=None):
+        """
+        Returns the profile of the column with only the given keys. Unless the
+        whole profile is cached, only the selected keys are computed.
+
+        :param keys: keys of the profile to select, all if None, where a '.'
+            represents a level of recursion and '*' matches any key
+        :type keys: list(str)
+        :return: profile of the column
+        :rtype: OrderedDict
+        """
+        if keys is None:
+            return self.profile
+        if self._profile_cache is not None:
+            return _select_keys(self._profile_cache, keys)
+        return _select_keys(self._get_profile(keys), keys)
+
+    def _get_profile(self, keys=None):
         unordered_profile = dict()
         for profile in self.profiles.values():
-            utils.dict_merge(unordered_profile, profile.profile)
+            utils.dict_merge(unordered_profile, profile.get_profile(keys))
 
         name = self.name
         if isinstance(self.name, np.integer):
@@ -194,7 +448,10 @@ class StructuredDataProfile(object):
                 "sample_size": self.sample_size,
                 "null_count": self.null_count,
                 "null_types": self.null_types,
-                "null_types_index": self.null_types_index,
+                "null_types_index": {
+                    null_type: set(null_rows)
+                    for null_type, null_rows in self.null_types_index.items()
+                },
                 "data_type_representation":
                 unordered_profile["data_type_representation"]
             })
@@ -220,6 +477,7 @@ class StructuredDataProfile(object):
         return profile
     
     def _update_base_stats(self, base_stats):
+        self._profile_cache = None
         self.sample_size += base_stats["sample_size"]
         self.sample = base_stats["sample"]
         self.null_count += base_stats["null_count"]
@@ -228,9 +486,10 @@ class StructuredDataProfile(object):
         )
 
         for null_type, null_rows in base_stats["null_types"].items():
-            if type(null_rows) is list:
-                null_rows.sort()
-            self.null_types_index.setdefault(null_type, set()).update(null_rows)
+            null_rows = to_row_index(null_rows)
+            if null_type in self.null_types_index:
+                null_rows = self.null_types_index[null_type] | null_rows
+            self.null_types_index[null_type] = null_rows
 
     def update_profile(self, df_series, sample_size=None,
                        min_true_samples=None, sample_ids=None,
@@ -256,6 +515,11 @@ class StructuredDataProfile(object):
             sample_size = self._get_sample_size(df_series)
         if not min_true_samples:
             min_true_samples = self._min_true_samples
+
+        if self._is_sampled_adaptively:
+            self._update_profile_in_rounds(
+                df_series, sample_size, min_true_samples, sample_ids, pool)
+            return
         
         clean_sampled_df, base_stats = self.clean_data_and_get_base_stats(
             df_series=df_series, sample_size=sample_size,
@@ -264,6 +528,129 @@ class StructuredDataProfile(object):
         self._update_base_stats(base_stats)
         self.update_column_profilers(clean_sampled_df, pool)
 
+    @property
+    def _is_sampled_adaptively(self):
+        """
+        Whether the column is sampled until its statistics converge, i.e. a
+        tolerance of the adaptive sampling options is set.
+        """
+        if not isinstance(self.options, StructuredOptions):
+            return False
+        adaptive_options = self.options.adaptive_sampling
+        return adaptive_options.is_enabled \
+            and (adaptive_options.ratio_tolerance is not None
+                 or adaptive_options.stats_tolerance is not None)
+
+    def _update_profile_in_rounds(self, df_series, sample_size,
+                                  min_true_samples=None, sample_ids=None,
+                                  pool=None):
+        """
+        Updates the profile with rounds of samples of growing size, each round
+        doubling the rows sampled, until the statistics of the column converge
+        or the sample size is reached. Rows are only sampled beyond the sample
+        size while the minimum number of true samples is not met.
+
+        :param df_series: Data to be profiled
+        :type df_series: pandas.core.series.Series
+        :param sample_size: Maximum number of samples to use in generating
+            the profile
+        :type sample_size: int
+        :param min_true_samples: Minimum number of samples required for the
+            profiler
+        :type min_true_samples: int
+        :param sample_ids: Randomized list of sample indices
+        :type sample_ids: list(list)
+        :param pool: pool utilized for multiprocessing
+        :type pool: multiprocessing.Pool
+        :return: None
+        """
+        if min_true_samples is None:
+            min_true_samples = 0
+        if sample_ids is None:
+            sample_ids = next(iter(utils.shuffle_in_chunks(
+                len(df_series), len(df_series))), [])
+        else:
+            sample_ids = sample_ids[0]
+
+        round_size = self.options.adaptive_sampling.initial_sample_size
+        num_sampled = 0
+        num_true_samples = 0
+        while num_sampled < len(sample_ids):
+            round_end = num_sampled + round_size
+            if num_sampled < sample_size:
+                round_end = min(round_end, sample_size)
+            round_ids = sample_ids[num_sampled:round_end]
+            with tracing.span('sampling_round', rows=len(round_ids)):
+                clean_sampled_df, base_stats = \
+                    self.clean_data_and_get_base_stats(
+                        df_series.iloc[round_ids], len(round_ids))
+                self._update_base_stats(base_stats)
+                self.update_column_profilers(clean_sampled_df, pool)
+            num_sampled += len(round_ids)
+            num_true_samples += len(clean_sampled_df)
+
+            if num_true_samples >= min_true_samples \
+                    and (num_sampled >= sample_size or self._has_converged()):
+                break
+            round_size *= 2
+
+    def _has_converged(self):
+        """
+        Whether the margins of error of the statistics of the column are
+        within the tolerances of the adaptive sampling options: those of the
+        null ratio, data type ratios and data label ratios, then those of the
+        mean and variance of the data type, relative to its scale. The margin
+        of error of the variance assumes normally distributed values.
+
+        :return: whether the statistics converged
+        :rtype: bool
+        """
+        adaptive_options = self.options.adaptive_sampling
+        z_value = adaptive_options.z_values[adaptive_options.confidence_level]
+        if not self.sample_size:
+            return False
+
+        if adaptive_options.ratio_tolerance is not None:
+            ratios = [(self.null_count / self.sample_size, self.sample_size)]
+            for compiler_name in ['data_type_profile', 'data_label_profile']:
+                if compiler_name not in self.profiles:
+                    continue
+                for profiler in self.profiles[compiler_name]._profiles.values():
+                    if not profiler.sample_size:
+                        continue
+                    if compiler_name == 'data_type_profile':
+                        profiler_ratios = [profiler.data_type_ratio]
+                    else:
+                        profiler_ratios = \
+                            profiler.label_representation.values()
+                    ratios += [(ratio, profiler.sample_size)
+                               for ratio in profiler_ratios]
+            for ratio, count in ratios:
+                if utils.get_ratio_margin_of_error(ratio, count, z_value) \
+                        > adaptive_options.ratio_tolerance:
+                    return False
+
+        if adaptive_options.stats_tolerance is not None \
+                and 'data_type_profile' in self.profiles:
+            tolerance = adaptive_options.stats_tolerance
+            for profiler in \
+                    self.profiles['data_type_profile']._profiles.values():
+                if profiler.data_type_ratio != 1.0:
+                    continue
+                if not isinstance(profiler, NumericStatsMixin) \
+                        or np.isnan(profiler.stddev):
+                    break
+                count = profiler.match_count
+                if count < 2:
+                    return False
+                scale = max(abs(profiler.mean), profiler.stddev)
+                if z_value * profiler.stddev / np.sqrt(count) \
+                        > tolerance * scale \
+                        or z_value * np.sqrt(2 / (count - 1)) > tolerance:
+                    return False
+                break
+        return True
+
     def _get_sample_size(self, df_series):
         """
         Determines the minimum sampling size for detecting column type.
@@ -274,13 +661,65 @@ class StructuredDataProfile(object):
         :rtype: int
         """
         len_df = len(df_series)
-        if len_df <= self._min_sample_size:
+        if self._reservoir_size is not None \
+                or len_df <= self._min_sample_size:
             return int(len_df)
         return max(int(self._sampling_ratio * len_df), self._min_sample_size)
 
     # TODO: flag column name with null values and potentially return row
     #  index number in the error as well
     @staticmethod
+    def _get_null_type_categories(df_series, null_type_codes):
+        """
+        Classify each cell of a column of strings as either a true value or
+        one of the null types. Only the distinct values of the column are
+        checked against the null values.
+
+        :param df_series: a given column of strings
+        :type df_series: pandas.core.series.Series
+        :param null_type_codes: code of each null type found so far, updated
+            with any new null types found in the column
+        :type null_type_codes: dict
+        :return: category code of each cell, 0 for true values
+        :rtype: numpy.ndarray
+        """
+        value_codes, values = pd.factorize(df_series.values)
+        value_categories = np.zeros(len(values), dtype=np.intp)
+        for i, value in enumerate(values):
+            code = null_type_codes.get(value)
+            if code is None:
+                if value.lower() not in StructuredDataProfile._null_values \
+                        and (value[0] not in
+                             StructuredDataProfile._null_repeated_chars
+                             or value.strip(value[0])):
+                    continue
+                code = null_type_codes[value] = len(null_type_codes) + 1
+            value_categories[i] = code
+        return value_categories[value_codes]
+
+    @staticmethod
+    def _get_native_null_type_categories(df_series, null_type_codes):
+        """
+        Classify each cell of a column of a native dtype as either a true value
+        or its null type, i.e. 'nan' for floats and 'NaT' for datetimes.
+
+        :param df_series: a given column of a native dtype
+        :type df_series: pandas.core.series.Series
+        :param null_type_codes: code of each null type found so far, updated
+            with any new null types found in the column
+        :type null_type_codes: dict
+        :return: category code of each cell, 0 for true values
+        :rtype: numpy.ndarray
+        """
+        is_null = df_series.isna().values
+        if not is_null.any():
+            return np.zeros(len(df_series), dtype=np.intp)
+        null_type = 'NaT' if df_series.dtype.kind == 'M' else 'nan'
+        code = null_type_codes.setdefault(null_type, len(null_type_codes) + 1)
+        return np.where(is_null, code, 0)
+
+    @staticmethod
+    @tracing.traced()
     def clean_data_and_get_base_stats(df_series, sample_size,
                                       min_true_samples=None,
                                       sample_ids=None):
@@ -301,17 +740,6 @@ class StructuredDataProfile(object):
             parameters
         :rtype: pd.Series, dict
         """
-        NO_FLAG = 0
-        null_values_and_flags = {
-            "": NO_FLAG,
-            "nan": re.IGNORECASE,
-            "none": re.IGNORECASE,
-            "null": re.IGNORECASE,
-            "  *": NO_FLAG,
-            "--*": NO_FLAG,
-            "__*": NO_FLAG,
-        }
-        
         if min_true_samples is None:
             min_true_samples = 0
         
@@ -322,8 +750,11 @@ class StructuredDataProfile(object):
                 "null_types": dict(), "sample": []
             }
 
-        # Pandas reads empty values in the csv files as nan
-        df_series = df_series.apply(str)
+        # Native values are kept as is, their nulls being NaN or NaT
+        is_native = utils.is_native_series(df_series)
+        if not is_native:
+            # Pandas reads empty values in the csv files as nan
+            df_series = df_series.apply(str)
 
         # Select generator depending if sample_ids availability
         if sample_ids is None:
@@ -334,25 +765,32 @@ class StructuredDataProfile(object):
                 sample_ids[0], chunk_size=sample_size)
             
         na_columns = dict()
+        null_type_codes = dict()
         true_sample_list = set()
         total_sample_size = 0
-        query = '|'.join(null_values_and_flags.keys())
-        regex = f"^(?:{(query)})$"
         for chunked_sample_ids in sample_ind_generator:
             total_sample_size += len(chunked_sample_ids)
             
             # Find subset of series based on randomly selected ids
             df_subset = df_series.iloc[chunked_sample_ids]
 
-            # Query should search entire cell for all elements at once
-            matches = df_subset.str.match(regex, flags=re.IGNORECASE)
+            # Category of each cell, 0 for true values otherwise a null type
+            if is_native:
+                categories = StructuredDataProfile.\
+                    _get_native_null_type_categories(df_subset, null_type_codes)
+            else:
+                categories = StructuredDataProfile._get_null_type_categories(
+                    df_subset, null_type_codes)
             
             # Split series into None samples and true samples
-            true_sample_list.update(df_subset[~matches].index)
-
-            # Iterate over all the Nones
-            for index, cell in df_subset[matches].items():
-                na_columns.setdefault(cell, list()).append(index)
+            true_sample_list.update(df_subset.index[categories == 0])
+
+            # Gather the indices of each null type
+            for null_type, code in null_type_codes.items():
+                null_rows = np.flatnonzero(categories == code)
+                if len(null_rows):
+                    na_columns.setdefault(null_type, list()).extend(
+                        df_subset.index[null_rows].tolist())
             
             # Ensure minimum number of true samples met
             # and if total_sample_size >= sample size, exit
@@ -372,19 +810,205 @@ class StructuredDataProfile(object):
         df_series = df_series.loc[true_sample_list]
         total_na = total_sample_size - len(true_sample_list)
 
+        sample = random.sample(list(df_series), min(len(df_series), 5))
         base_stats = {
             "sample_size": total_sample_size,
             "null_count": total_na,
             "null_types": na_columns,
-            "sample": random.sample(list(df_series.values),
-                                    min(len(df_series), 5))
+            "sample": [str(value) for value in sample] if is_native else sample
         }
 
         return df_series, base_stats
 
 
+def _clean_shared_data_and_get_base_stats(series_desc, sample_size,
+                                          min_true_samples, sample_ids_desc):
+    """
+    Worker side of `StructuredDataProfile.clean_data_and_get_base_stats` for a
+    column and sample ids published to shared memory.
+
+    :param series_desc: descriptor of the shared column
+    :type series_desc: dict
+    :param sample_size: Number of samples to use in generating the profile
+    :type sample_size: int
+    :param min_true_samples: Minimum number of samples required for the
+        profiler
+    :type min_true_samples: int
+    :param sample_ids_desc: descriptor of the shared sample ids
+    :type sample_ids_desc: tuple
+    :return: updated column with null removed and dictionary of null
+        parameters
+    :rtype: pd.Series, dict
+    """
+    series_blocks, df_series = utils.attach_series(series_desc)
+    sample_ids_block, sample_ids = utils.attach_array(sample_ids_desc)
+    try:
+        return StructuredDataProfile.clean_data_and_get_base_stats(
+            df_series, sample_size, min_true_samples, sample_ids)
+    finally:
+        del df_series, sample_ids
+        utils.release_shared_memory(series_blocks + [sample_ids_block])
+
+
+# Saved profiles start with the magic bytes, the file format version and the
+# offset and length of the header locating each column within the file
+_PROFILE_FILE_MAGIC = b'DPROFILE'
+_PROFILE_FILE_VERSION = 1
+_PROFILE_FILE_PREFIX = struct.Struct('<8sIQQ')
+_PROFILE_FILE_ALIGNMENT = 64
+
+
+class _ProfilePickler(pickle.Pickler):
+
+    def __init__(self, file, structured_options=None, buffer_callback=None):
+        """
+        Pickles parts of a profile. Data labelers are not pickled and the
+        profiler's structured options are referenced rather than copied into
+        each of the columns. NumPy arrays are handed to the `buffer_callback`
+        to be stored raw, where supported.
+
+        :param file: file to pickle to
+        :type file: BinaryIO
+        :param structured_options: options referenced by the columns
+        :type structured_options: StructuredOptions
+        :param buffer_callback: called with the buffer of each array
+        :type buffer_callback: Callable
+        """
+        kwargs = dict()
+        if pickle.HIGHEST_PROTOCOL >= 5:
+            kwargs = dict(protocol=5, buffer_callback=buffer_callback)
+        super().__init__(file, **kwargs)
+        self._structured_options = structured_options
+
+    def persistent_id(self, obj):
+        if isinstance(obj, BaseDataLabeler):
+            return 'data_labeler'
+        if self._structured_options is not None \
+                and obj is self._structured_options:
+            return 'structured_options'
+        return None
+
+
+class _ProfileUnpickler(pickle.Unpickler):
+
+    def __init__(self, file, structured_options=None, buffers=None):
+        """
+        Unpickles parts of a profile pickled by `_ProfilePickler`. Data
+        labelers are loaded as None, to be restored when they are needed.
+
+        :param file: file to unpickle from
+        :type file: BinaryIO
+        :param structured_options: options referenced by the columns
+        :type structured_options: StructuredOptions
+        :param buffers: buffers of the arrays stored raw
+        :type buffers: list(memoryview)
+        """
+        kwargs = dict(buffers=buffers) if buffers else dict()
+        super().__init__(file, **kwargs)
+        self._structured_options = structured_options
+
+    def persistent_load(self, pid):
+        if pid == 'data_labeler':
+            return None
+        elif pid == 'structured_options':
+            return self._structured_options
+        raise pickle.UnpicklingError(
+            "Unsupported persistent object: {}".format(pid))
+
+
+def _write_profile_block(outfile, obj, structured_options=None):
+    """
+    Pickles the object into the file followed by its arrays stored raw.
+
+    :param outfile: file to write to
+    :type outfile: BinaryIO
+    :param obj: object to pickle
+    :type obj: object
+    :param structured_options: options referenced by the object
+    :type structured_options: StructuredOptions
+    :return: location of the pickle and of each array in the file
+    :rtype: tuple(tuple(int, int), list(tuple(int, int)))
+    """
+    buffers = []
+    pickled_obj = io.BytesIO()
+    _ProfilePickler(pickled_obj, structured_options, buffers.append).dump(obj)
+    block = (outfile.tell(), pickled_obj.tell())
+    outfile.write(pickled_obj.getbuffer())
+
+    buffer_blocks = []
+    for buffer in buffers:
+        raw_buffer = buffer.raw()
+        outfile.write(b'\0' * (-outfile.tell() % _PROFILE_FILE_ALIGNMENT))
+        buffer_blocks.append((outfile.tell(), raw_buffer.nbytes))
+        outfile.write(raw_buffer)
+    return block, buffer_blocks
+
+
+def _read_profile_bytes(infile, file_map, offset, length):
+    """
+    Reads bytes from the file, without copying them if the file is mapped.
+
+    :param infile: file to read from
+    :type infile: BinaryIO
+    :param file_map: copy-on-write memory map of the file, if available
+    :type file_map: mmap.mmap
+    :param offset: position of the bytes in the file
+    :type offset: int
+    :param length: number of bytes
+    :type length: int
+    :return: writable bytes
+    :rtype: Union[memoryview, bytearray]
+    """
+    if file_map is not None:
+        return memoryview(file_map)[offset:offset + length]
+    infile.seek(offset)
+    return bytearray(infile.read(length))
+
+
+def _read_profile_block(infile, file_map, block, buffer_blocks,
+                        structured_options=None):
+    """
+    Unpickles an object written by `_write_profile_block`.
+
+    :param infile: file to read from
+    :type infile: BinaryIO
+    :param file_map: copy-on-write memory map of the file, if available
+    :type file_map: mmap.mmap
+    :param block: location of the pickle in the file
+    :type block: tuple(int, int)
+    :param buffer_blocks: location of each array in the file
+    :type buffer_blocks: list(tuple(int, int))
+    :param structured_options: options referenced by the object
+    :type structured_options: StructuredOptions
+    :return: the unpickled object
+    :rtype: object
+    """
+    buffers = [_read_profile_bytes(infile, file_map, *buffer_block)
+               for buffer_block in buffer_blocks]
+    pickled_obj = _read_profile_bytes(infile, file_map, *block)
+    return _ProfileUnpickler(io.BytesIO(pickled_obj), structured_options,
+                             buffers).load()
+
+
 class Profiler(object):
 
+    # approximate memory used to profile a column, relative to the memory of
+    # its sampled values, e.g. for its cleaned copy and type conversions
+    _column_memory_factor = 10
+
+    # fraction of the memory budget a streamed chunk may take
+    _chunk_memory_ratio = 0.25
+
+    # fraction of the memory budget the exact unique row hashes may take
+    # before the unique rows are estimated with a sketch instead
+    _hashed_rows_memory_ratio = 0.1
+
+    # approximate memory of each exact unique row hash
+    _hashed_row_bytes = 100
+
+    # the sample size is not reduced below this to fit the memory budget
+    _min_budget_sample_size = 100
+
     def __init__(self, data, samples_per_update=None, min_true_samples=0, 
                  profiler_options=None):
         """
@@ -417,10 +1041,29 @@ class Profiler(object):
         self.row_has_null_count = 0
         self.row_is_null_count = 0
         self.hashed_row_dict = dict()
+        self.hashed_row_sketch = None
         self._samples_per_update = samples_per_update
         self._min_true_samples = min_true_samples
         self._profile = dict()
 
+        # data labelers of loaded profiles are restored when first needed
+        self._data_labelers_restored = True
+
+        # distinct rows are estimated by a sketch instead of exactly kept
+        unique_rows_options = self.options.structured_options.unique_rows
+        if unique_rows_options.method == 'hll':
+            self.hashed_row_sketch = HyperLogLog(unique_rows_options.precision)
+
+        # multiprocessing pool shared by the chunks of an update, and by all
+        # updates within a `with` block, created on first use
+        self._pool = None
+        self._pool_size = None
+        self._pool_finalizer = None
+        self._keep_pool = False
+
+        # metrics of the stages of the last pipelined stream
+        self.stream_metrics = None
+
         # matches structured data profile
         # TODO: allow set via options
         self._sampling_ratio = 0.2
@@ -458,40 +1101,296 @@ class Profiler(object):
         :type other: Profiler
         :return: merger of the two profiles
         """
+        return Profiler.merge_many([self, other])
+
+    def _assert_can_merge(self, other, align_schema=False):
+        """
+        Raises an error if the other profile cannot be merged with this one.
+
+        :param other: profile to be merged with this one
+        :type other: Profiler
+        :param align_schema: whether the profiles may have different columns
+        :type align_schema: bool
+        :return: None
+        """
         if type(other) is not type(self):
             raise TypeError('`{}` and `{}` are not of the same profiler type.'.
                             format(type(self).__name__, type(other).__name__))
-        elif set(self._profile) != set(other._profile):
+        elif not align_schema and set(self._profile) != set(other._profile):
             raise ValueError('Profiles do not have the same schema.')
         elif not all([isinstance(other._profile[p_name],
                                  type(self._profile[p_name]))
-                      for p_name in self._profile]):  # options check
+                      for p_name in self._profile
+                      if p_name in other._profile]):  # options check
             raise ValueError('The two profilers were not setup with the same '
                              'options, hence they do not calculate the same '
                              'profiles and cannot be added together.')
+
+    @staticmethod
+    @tracing.traced()
+    def merge_many(profiles, executor=None, align_schema=False):
+        """
+        Merges many profiles together, equivalent to adding them all with the
+        `+` operator. Each column is merged independently as a balanced binary
+        tree of pairwise merges. The merges at a level of the trees are
+        executed together for all the columns, in parallel if an executor is
+        given. Column profiles are sent to process executors, e.g. a
+        multiprocessing.Pool, hence they must be picklable, i.e. profiled
+        without the data labeler.
+
+        :param profiles: profiles to merge
+        :type profiles: list(Profiler)
+        :param executor: executor whose `map` executes the column merges
+        :type executor: Union[concurrent.futures.Executor, multiprocessing.Pool]
+        :param align_schema: whether profiles with different columns can be
+            merged, in which case each column is merged from the profiles
+            which have it
+        :type align_schema: bool
+        :return: merger of the profiles
+        :rtype: Profiler
+        """
+        profiles = list(profiles)
+        if not profiles:
+            raise ValueError("At least one profile is required to merge.")
+        first_profile = profiles[0]
+        for other in profiles[1:]:
+            first_profile._assert_can_merge(other, align_schema)
+            if align_schema:
+                other._assert_can_merge(first_profile, align_schema)
+
+        # loaded profiles share the data labelers restored for the first
+        data_labelers = dict()
+        for profile in profiles:
+            profile._ensure_data_labelers(data_labelers)
+
+        # without data, the merged profile never creates a pool
         merged_profile = Profiler(
-            data=pd.DataFrame([]), samples_per_update=self._samples_per_update,
-            min_true_samples=self._min_true_samples,
-            profiler_options=self.options
+            data=None,
+            samples_per_update=first_profile._samples_per_update,
+            min_true_samples=first_profile._min_true_samples,
+            profiler_options=first_profile.options
         )
-        merged_profile.encoding = self.encoding \
-            if self.encoding == other.encoding else 'multiple files'
-        merged_profile.file_type = self.file_type \
-            if self.file_type == other.file_type else 'multiple files'
-        merged_profile.row_has_null_count = \
-            self.row_has_null_count + other.row_has_null_count
-        merged_profile.row_is_null_count = \
-            self.row_is_null_count + other.row_is_null_count
-        merged_profile.total_samples = self.total_samples + other.total_samples
-        merged_profile.hashed_row_dict.update(self.hashed_row_dict)
-        merged_profile.hashed_row_dict.update(other.hashed_row_dict)
-
-        for profile_name in self._profile:
-            merged_profile._profile[profile_name] = (
-                self._profile[profile_name] + other._profile[profile_name]
-            )
+        merged_profile.encoding = first_profile.encoding \
+            if len({profile.encoding for profile in profiles}) == 1 \
+            else 'multiple files'
+        merged_profile.file_type = first_profile.file_type \
+            if len({profile.file_type for profile in profiles}) == 1 \
+            else 'multiple files'
+        for profile in profiles:
+            merged_profile.row_has_null_count += profile.row_has_null_count
+            merged_profile.row_is_null_count += profile.row_is_null_count
+            merged_profile.total_samples += profile.total_samples
+            merged_profile._merge_hashed_rows(profile)
+
+        profile_names = OrderedDict()
+        for profile in profiles:
+            profile_names.update(dict.fromkeys(profile._profile))
+        merged_profile._profile = dict(utils.merge_in_trees(
+            OrderedDict(
+                (profile_name, [profile._profile[profile_name]
+                                for profile in profiles
+                                if profile_name in profile._profile])
+                for profile_name in profile_names),
+            executor))
         return merged_profile
 
+    def _merge_hashed_rows(self, other):
+        """
+        Merges the hashed rows of another profiler into this one. If either
+        estimates the distinct rows with a sketch, the merge does as well.
+
+        :param other: profiler whose hashed rows are merged
+        :type other: Profiler
+        :return: None
+        """
+        if self.hashed_row_sketch is None \
+                and other.hashed_row_sketch is not None:
+            self.hashed_row_sketch = HyperLogLog(
+                other.hashed_row_sketch.precision)
+            self.hashed_row_sketch.update(list(self.hashed_row_dict))
+            self.hashed_row_dict = dict()
+
+        if self.hashed_row_sketch is None:
+            self.hashed_row_dict.update(other.hashed_row_dict)
+            return
+        if other.hashed_row_sketch is not None:
+            self.hashed_row_sketch.merge(other.hashed_row_sketch)
+        self.hashed_row_sketch.update(list(other.hashed_row_dict))
+
+    def __enter__(self):
+        # the pool is kept between the updates of the block
+        self._keep_pool = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._keep_pool = False
+        self.close()
+
+    def close(self):
+        """
+        Closes the multiprocessing pool owned by the profiler, if one was
+        created. The profiler can still be updated afterwards, in which case a
+        new pool is created when needed.
+
+        :return: None
+        """
+        if self._pool_finalizer is not None:
+            self._pool_finalizer()
+        self._pool = None
+        self._pool_size = None
+        self._pool_finalizer = None
+
+    def _release_pool(self):
+        """
+        Closes the pool once an update is finished, unless the profiler is
+        used as a context manager, in which case the pool is kept until the
+        end of the `with` block.
+
+        :return: None
+        """
+        if not self._keep_pool:
+            self.close()
+
+    def _get_pool(self, data_size=None, cols=None, max_pool_size=None):
+        """
+        Returns the multiprocessing pool of the profiler. The pool is created
+        lazily on the first call and reused for the chunks of the update, and
+        for all subsequent updates within a `with` block, until the profiler
+        is closed, or until a smaller pool is required.
+
+        :param data_size: estimated size of the dataset
+        :type data_size: int
+        :param cols: number of columns in the dataset
+        :type cols: int
+        :param max_pool_size: maximum size of the pool, e.g. to fit the
+            memory budget, unlimited if None
+        :type max_pool_size: int
+        :return: the pool (or None if multiprocessing is not possible) and
+            its size
+        :rtype: tuple(Union[multiprocessing.Pool, utils.AutoPool], int)
+        """
+        backend = self.options.structured_options.multiprocess.backend
+        if max_pool_size is not None and self._pool is not None \
+                and self._pool_size > max_pool_size:
+            self.close()
+        if self._pool is None:
+            if max_pool_size is not None:
+                if backend == 'thread':
+                    suggested_pool_size = utils.suggest_thread_pool_size(cols)
+                else:
+                    suggested_pool_size = utils.suggest_pool_size(
+                        data_size, cols)
+                max_pool_size = int(min(suggested_pool_size or 1,
+                                        max_pool_size))
+            self._pool, self._pool_size = utils.generate_pool(
+                max_pool_size=max_pool_size, data_size=data_size, cols=cols,
+                backend=backend)
+            if self._pool is not None:
+                # workers of a profiler never closed are stopped once it is
+                # garbage collected
+                self._pool_finalizer = weakref.finalize(
+                    self, _close_pool, self._pool)
+        return self._pool, self._pool_size
+
+    @property
+    def _max_memory_bytes(self):
+        """
+        Memory budget of the profiler in bytes, None if unlimited.
+        """
+        memory_budget = self.options.structured_options.memory_budget
+        if not memory_budget.is_enabled:
+            return None
+        return memory_budget.max_memory_bytes
+
+    @property
+    def _is_sampled_adaptively(self):
+        """
+        Whether the columns are sampled until their statistics converge.
+        """
+        adaptive_sampling = self.options.structured_options.adaptive_sampling
+        return adaptive_sampling.is_enabled \
+            and (adaptive_sampling.ratio_tolerance is not None
+                 or adaptive_sampling.stats_tolerance is not None)
+
+    def _get_hashed_rows_memory(self):
+        return len(self.hashed_row_dict) * self._hashed_row_bytes
+
+    def _apply_memory_budget(self, df, sample_size):
+        """
+        Reduces the sample size of each column and the number of columns
+        profiled in parallel to stay within the memory budget. Each column
+        profiled at once is estimated to use `_column_memory_factor` times the
+        memory of its sampled values, on top of the memory of the data.
+
+        :param df: a dataset
+        :type df: pandas.DataFrame
+        :param sample_size: number of samples for df to use for profiling
+        :type sample_size: int
+        :return: sample size and maximum pool size within the memory budget,
+            the pool size being None if the memory is unlimited
+        :rtype: tuple(int, int)
+        """
+        max_memory_bytes = self._max_memory_bytes
+        if max_memory_bytes is None or not len(df.columns):
+            return sample_size, None
+        if not sample_size:
+            sample_size = len(df)
+
+        row_memory = utils.estimate_row_memory(df)
+        column_sample_memory = max(row_memory.max(), 1) \
+            * self._column_memory_factor
+        available_memory = max(
+            max_memory_bytes - row_memory.sum() * len(df)
+            - self._get_hashed_rows_memory(), 0)
+
+        budget_sample_size = max(int(available_memory // column_sample_memory),
+                                 self._min_budget_sample_size)
+        if budget_sample_size < sample_size:
+            warnings.warn("The sample size was reduced from {} to {} to "
+                          "profile within the memory budget of {} bytes."
+                          .format(sample_size, budget_sample_size,
+                                  max_memory_bytes))
+            sample_size = budget_sample_size
+
+        max_pool_size = max(
+            int(available_memory // (sample_size * column_sample_memory)), 1)
+        return sample_size, max_pool_size
+
+    def _get_budgeted_chunk_size(self, data, chunk_size, chunks_in_memory=1):
+        """
+        Reduces the number of rows streamed at once so the chunks held in
+        memory take at most `_chunk_memory_ratio` of the memory budget. The
+        memory of a row is estimated from the first rows of the data.
+
+        :param data: data to be streamed
+        :type data: Union[data_readers.base_data.BaseData, pandas.DataFrame]
+        :param chunk_size: maximum number of rows to profile at once
+        :type chunk_size: int
+        :param chunks_in_memory: number of chunks held in memory at once
+        :type chunks_in_memory: int
+        :return: chunk size within the memory budget
+        :rtype: int
+        """
+        max_memory_bytes = self._max_memory_bytes
+        if max_memory_bytes is None:
+            return chunk_size
+
+        num_rows = min(chunk_size, 1000)
+        if isinstance(data, pd.DataFrame):
+            first_rows = data.iloc[:num_rows]
+        else:
+            chunks = data.get_chunk_generator(num_rows)
+            first_rows = next(chunks, None)
+            chunks.close()
+        if first_rows is None or not len(first_rows.columns):
+            return chunk_size
+
+        row_memory = max(utils.estimate_row_memory(first_rows).sum(), 1)
+        budget_chunk_size = max(
+            int(max_memory_bytes * self._chunk_memory_ratio
+                / chunks_in_memory // row_memory), 1)
+        return min(chunk_size, budget_chunk_size)
+
     @property
     def profile(self):
         return self._profile
@@ -505,6 +1404,11 @@ class Profiler(object):
         :return: integer sampling size
         :rtype: int
         """
+        # Every row is cleaned when the columns are sampled by reservoirs
+        if self.options.structured_options.reservoir.is_enabled \
+                and self.options.structured_options.reservoir.size is not None:
+            return len(data)
+
         if self._samples_per_update:
             return self._samples_per_update
 
@@ -534,7 +1438,25 @@ class Profiler(object):
         return min([self._profile[col].sample_size
                     for col in self._profile], default=0)
 
-    def report(self, report_options=None):
+    def report(self, report_options=None, columns=None, keys=None):
+        """
+        Returns the report of the profile. Only the requested columns and keys
+        are computed, and the profile of each column is cached until the
+        column is updated, hence polling the report of a few columns of a
+        wide profile is cheap.
+
+        :param report_options: options of the report, i.e. its
+            `output_format`, `omit_keys` and `num_quantile_groups`
+        :type report_options: dict
+        :param columns: columns to report in the data stats, all if None
+        :type columns: list
+        :param keys: keys to report, all if None, where a '.' represents a
+            level of recursion and '*' matches any key, example:
+            keys=['global_stats.row_count', 'data_stats.*.statistics.mean']
+        :type keys: list(str)
+        :return: report of the profile
+        :rtype: dict
+        """
         if not report_options:
             report_options = {
                 "output_format": None,
@@ -545,11 +1467,20 @@ class Profiler(object):
         omit_keys = report_options.get("omit_keys", [])
         num_quantile_groups = report_options.get("num_quantile_groups", 4)
 
-        columns = list(self._profile.values())
-        report = OrderedDict([
-            ("global_stats", {
+        if columns is None:
+            columns = list(self._profile.keys())
+        else:
+            missing_columns = [col for col in columns
+                               if col not in self._profile]
+            if missing_columns:
+                raise ValueError("Columns are not in the profile: {}"
+                                 .format(missing_columns))
+
+        report = OrderedDict()
+        if keys is None or _get_selected_keys("global_stats", keys) is not None:
+            report["global_stats"] = {
                 "samples_used": self._max_col_samples_used,
-                "column_count": len(columns),
+                "column_count": len(self._profile),
                 "row_count": self.total_samples,
                 "row_has_null_ratio": self._get_row_has_null_ratio(),
                 "row_is_null_ratio": self._get_row_is_null_ratio(),
@@ -557,21 +1488,47 @@ class Profiler(object):
                 "duplicate_row_count": self._get_duplicate_row_count(),
                 "file_type": self.file_type,
                 "encoding": self.encoding
-            }),
-            ("data_stats", OrderedDict()),
-        ])
-        for key in self._profile.keys():
-            report["data_stats"][key] = self._profile[key].profile
-            quantiles = report["data_stats"][key]["statistics"].get(
-                'quantiles')
-            if quantiles:
-                quantiles = calculate_quantiles(num_quantile_groups, quantiles)
-                report["data_stats"][key]["statistics"]["quantiles"] = quantiles
+            }
 
+        data_stats_keys = None
+        if keys is not None:
+            data_stats_keys = _get_selected_keys("data_stats", keys)
+        if keys is None or data_stats_keys is not None:
+            report["data_stats"] = OrderedDict()
+            for key in columns:
+                col_keys = None
+                if data_stats_keys:
+                    col_keys = _get_selected_keys(key, data_stats_keys)
+                    if col_keys is None:
+                        continue
+                # the cached profile is copied where the report differs
+                col_report = self._profile[key].get_profile(col_keys or None)
+                quantiles = (col_report.get("statistics") or {}).get(
+                    'quantiles')
+                if quantiles:
+                    quantiles = calculate_quantiles(
+                        num_quantile_groups, quantiles)
+                    col_report = OrderedDict(col_report, statistics=dict(
+                        col_report["statistics"], quantiles=quantiles))
+                report["data_stats"][key] = col_report
+
+        if keys is not None:
+            report = _select_keys(report, keys)
         return _prepare_report(report, output_format, omit_keys)
 
+    def _get_unique_row_count(self):
+        if not self.options.structured_options.unique_rows.is_enabled:
+            return None
+        if self.hashed_row_sketch is not None:
+            return min(int(round(self.hashed_row_sketch.count())),
+                       self.total_samples)
+        return len(self.hashed_row_dict)
+
     def _get_unique_row_ratio(self):
-        return len(self.hashed_row_dict) / self.total_samples
+        unique_row_count = self._get_unique_row_count()
+        if unique_row_count is None:
+            return None
+        return unique_row_count / self.total_samples
 
     def _get_row_is_null_ratio(self):
         return 0 if self._min_col_samples_used in {0, None} \
@@ -582,8 +1539,34 @@ class Profiler(object):
             else self.row_has_null_count / self._min_col_samples_used
 
     def _get_duplicate_row_count(self):
-        return self.total_samples - len(self.hashed_row_dict)
+        unique_row_count = self._get_unique_row_count()
+        if unique_row_count is None:
+            return None
+        return self.total_samples - unique_row_count
+
+    def _limit_hashed_rows_memory(self):
+        """
+        Estimates the unique rows with a sketch, instead of exactly, once
+        their hashes take more than `_hashed_rows_memory_ratio` of the memory
+        budget.
+
+        :return: None
+        """
+        max_memory_bytes = self._max_memory_bytes
+        if max_memory_bytes is None or self._get_hashed_rows_memory() \
+                <= max_memory_bytes * self._hashed_rows_memory_ratio:
+            return
+        warnings.warn("The unique rows are estimated from now on, rather than "
+                      "counted exactly, to profile within the memory budget "
+                      "of {} bytes.".format(max_memory_bytes))
+        self.hashed_row_sketch = HyperLogLog(
+            self.options.structured_options.unique_rows.precision)
+        self.hashed_row_sketch.update(np.fromiter(
+            self.hashed_row_dict, dtype=np.uint64,
+            count=len(self.hashed_row_dict)))
+        self.hashed_row_dict = dict()
 
+    @tracing.traced()
     def _update_row_statistics(self, data, sample_ids=None):
         """
         Iterate over the provided dataset row by row and calculate
@@ -602,25 +1585,33 @@ class Profiler(object):
                              "not a DataFrame")
         
         self.total_samples += len(data)
-        self.hashed_row_dict.update(dict.fromkeys(
-            pd.util.hash_pandas_object(data, index=False), True
-        ))
+        if self.options.structured_options.unique_rows.is_enabled:
+            hashed_rows = pd.util.hash_pandas_object(data, index=False)
+            if self.hashed_row_sketch is not None:
+                self.hashed_row_sketch.update(hashed_rows.values)
+            else:
+                self.hashed_row_dict.update(dict.fromkeys(hashed_rows, True))
+                self._limit_hashed_rows_memory()
+
+        # If sample ids provided, only consider nulls in rows that
+        # were fully sampled
+        sampled_rows = None
+        if sample_ids is not None:
+            sampled_rows = to_row_index(
+                data.index[sample_ids[:self._min_col_samples_used]])
 
         # Calculate Null Column Count
-        null_rows = set()
-        null_in_row_count = set()
+        null_rows = RoaringBitmap()
+        null_in_row_count = RoaringBitmap()
         first_col_flag = True
         for column in self._profile:
             null_type_dict = self._profile[column].null_types_index
-            null_row_indices = set()
-            if null_type_dict:
-                null_row_indices = set.union(*null_type_dict.values())
+            null_row_indices = RoaringBitmap()
+            for null_type_rows in null_type_dict.values():
+                null_row_indices = null_row_indices | null_type_rows
 
-            if sample_ids is not None:
-                # If sample ids provided, only consider nulls in rows that
-                # were fully sampled
-                null_row_indices = null_row_indices.intersection(
-                    data.index[sample_ids[:self._min_col_samples_used]])
+            if sampled_rows is not None:
+                null_row_indices = null_row_indices & sampled_rows
 
             # Find the common null indices between the columns
             if first_col_flag:
@@ -628,29 +1619,38 @@ class Profiler(object):
                 null_in_row_count = null_row_indices
                 first_col_flag = False
             else:
-                null_rows = null_rows.intersection(null_row_indices)
-                null_in_row_count = null_in_row_count.union(null_row_indices)
+                null_rows = null_rows & null_row_indices
+                null_in_row_count = null_in_row_count | null_row_indices
 
         self.row_has_null_count = len(null_in_row_count)
         self.row_is_null_count = len(null_rows)
 
-    def update_profile(self, data, sample_size=None, min_true_samples=None):
+    def update_profile(self, data, sample_size=None, min_true_samples=None,
+                       columns=None):
         """
         Update the profile for data provided. User can specify the sample
         size to profile the data with. Additionally, the user can specify the
         minimum number of non-null samples to profile.
 
+        When only some columns are profiled, the selection is pushed down to
+        the data reader, hence the other columns of a file not yet loaded
+        are never parsed nor held in memory.
+
         :param data: data to be profiled
         :type data: Union[data_readers.base_data.BaseData, pandas.DataFrame]
         :param sample_size: number of samples to profile from the data
         :type sample_size: int
         :param min_true_samples: minimum number of non-null samples to profile
         :type min_true_samples
+        :param columns: columns to profile, every column if None
+        :type columns: list
         :return: None
         """
         if isinstance(data, data_readers.base_data.BaseData):
             self.encoding = data.file_encoding
             self.file_type = data.data_type
+            if columns is not None:
+                data = data.project_columns(columns)
             data = data.data
         elif isinstance(data, pd.DataFrame):
             self.file_type = str(data.__class__)
@@ -660,6 +1660,8 @@ class Profiler(object):
                 "pd.DataFrame."
             )
 
+        if columns is not None:
+            data = self._select_chunk_columns(data, columns)
         if not len(data):
             return
         if not min_true_samples:
@@ -667,11 +1669,340 @@ class Profiler(object):
         if not sample_size:
             sample_size = self._get_sample_size(data)
 
-        self._update_profile_from_chunk(
-            data, sample_size, min_true_samples, self.options)
+        try:
+            self._update_profile_from_chunk(
+                data, sample_size, min_true_samples, self.options)
+        finally:
+            self._release_pool()
+
+    def profile_stream(self, data, chunk_size=100000, sample_size=None,
+                       min_true_samples=None, pipeline_depth=None,
+                       columns=None):
+        """
+        Update the profile by streaming the data through the profiler in
+        chunks of at most `chunk_size` rows. Data readers which support it
+        read the chunks directly from their file, hence memory usage is bound
+        by the chunk size rather than the size of the dataset. Rows are
+        indexed globally, continuing from the rows previously profiled.
+
+        With a `pipeline_depth`, reading, null cleaning and profiling run as
+        stages in threads of their own, so the next chunk is read while the
+        current one is cleaned and the previous one profiled. At most
+        `pipeline_depth` chunks wait between two stages, and the throughput
+        of the stages and the occupancy of their queues are saved to
+        `stream_metrics`. Nothing is printed while pipelined.
+
+        :param data: data to be profiled
+        :type data: Union[data_readers.base_data.BaseData, pandas.DataFrame]
+        :param chunk_size: maximum number of rows to profile at once
+        :type chunk_size: int
+        :param sample_size: number of samples to profile from each chunk
+        :type sample_size: int
+        :param min_true_samples: minimum number of non-null samples to profile
+            from each chunk
+        :type min_true_samples: int
+        :param pipeline_depth: maximum number of chunks waiting between two
+            stages of the pipeline, the stages run one after another if None
+        :type pipeline_depth: int
+        :param columns: columns to profile, every column if None, the
+            selection being pushed down to the data reader
+        :type columns: list
+        :return: None
+        """
+        chunks_in_memory = 1
+        if pipeline_depth is not None:
+            if not isinstance(pipeline_depth, int) or pipeline_depth <= 0:
+                raise ValueError(
+                    "`pipeline_depth` must be a positive integer.")
+            # chunks waiting in both queues and processed by the 3 stages
+            chunks_in_memory = 2 * pipeline_depth + 3
+        file_type, chunks = self._get_stream_chunks(
+            data, chunk_size, chunks_in_memory, columns)
+        if not min_true_samples:
+            min_true_samples = self._min_true_samples
+        chunks = self._offset_stream_chunks(chunks, self.total_samples)
+
+        def get_chunk_sample_size(chunk):
+            if sample_size:
+                return sample_size
+            return self._get_sample_size(chunk)
+
+        try:
+            if pipeline_depth is None:
+                for chunk in chunks:
+                    self._update_profile_from_chunk(
+                        chunk, get_chunk_sample_size(chunk), min_true_samples,
+                        self.options)
+            else:
+                self._profile_stream_pipelined(
+                    chunks, get_chunk_sample_size, min_true_samples,
+                    pipeline_depth)
+        finally:
+            self._release_pool()
+
+        self.file_type = file_type
+        if isinstance(data, data_readers.base_data.BaseData):
+            self.encoding = data.file_encoding
+
+    def _profile_stream_pipelined(self, chunks, get_chunk_sample_size,
+                                  min_true_samples, pipeline_depth):
+        """
+        Profiles the streamed chunks with the read, clean and profile stages
+        running in threads of their own, saving the metrics of the stages to
+        `stream_metrics`.
+
+        :param chunks: chunks of the streamed data
+        :type chunks: Iterable[pandas.DataFrame]
+        :param get_chunk_sample_size: returns the sample size of a chunk
+        :type get_chunk_sample_size: Callable[[pandas.DataFrame], int]
+        :param min_true_samples: minimum number of non-null samples to profile
+            from each chunk
+        :type min_true_samples: int
+        :param pipeline_depth: maximum number of chunks waiting between two
+            stages of the pipeline
+        :type pipeline_depth: int
+        :return: None
+        """
+        def clean(chunk):
+            return self._clean_chunk(
+                chunk, get_chunk_sample_size(chunk), min_true_samples,
+                self.options, show_progress=False, resize_pool=False)
+
+        def profile(cleaned_chunk):
+            self._profile_cleaned_chunk(cleaned_chunk, show_progress=False)
+
+        stream_pipeline = Pipeline(
+            [('clean', clean), ('profile', profile)], depth=pipeline_depth)
+        try:
+            stream_pipeline.run(chunks)
+        finally:
+            self.stream_metrics = stream_pipeline.metrics
+
+    async def update_profile_async(self, data, chunk_size=100000,
+                                   sample_size=None, min_true_samples=None,
+                                   progress_callback=None, executor=None):
+        """
+        Update the profile without blocking the event loop. The data is read
+        and profiled in chunks of at most `chunk_size` rows within the
+        executor, the next chunk being read while the current one is
+        profiled. Nothing is printed, instead the progress is reported after
+        each chunk by awaiting `progress_callback(rows_profiled, total_rows)`,
+        where `total_rows` is None when unknown prior to reading the data.
+
+        If cancelled, the chunk being profiled is completed before the
+        cancellation is raised and no further chunk is profiled, hence the
+        profile contains every chunk profiled so far.
+
+        :param data: data to be profiled
+        :type data: Union[data_readers.base_data.BaseData, pandas.DataFrame]
+        :param chunk_size: maximum number of rows to profile at once
+        :type chunk_size: int
+        :param sample_size: number of samples to profile from each chunk
+        :type sample_size: int
+        :param min_true_samples: minimum number of non-null samples to profile
+            from each chunk
+        :type min_true_samples: int
+        :param progress_callback: coroutine function called with the number
+            of rows profiled and the total number of rows after each chunk
+        :type progress_callback: Callable[[int, Optional[int]], Awaitable]
+        :param executor: executor in which the data is read and profiled, the
+            loop's default executor if None
+        :type executor: concurrent.futures.Executor
+        :return: None
+        """
+        # the running loop, get_running_loop requires python 3.7+
+        loop = asyncio.get_event_loop()
+        file_type, chunks = await loop.run_in_executor(
+            executor, self._get_stream_chunks, data, chunk_size)
+        if not min_true_samples:
+            min_true_samples = self._min_true_samples
+        total_rows = len(data) if isinstance(data, pd.DataFrame) else None
+
+        self.file_type = file_type
+        if isinstance(data, data_readers.base_data.BaseData):
+            self.encoding = data.file_encoding
+
+        rows_profiled = 0
+        chunks = self._offset_stream_chunks(chunks, self.total_samples)
+        next_chunk = loop.run_in_executor(executor, next, chunks, None)
+        try:
+            while True:
+                chunk = await asyncio.shield(next_chunk)
+                if chunk is None:
+                    break
+                next_chunk = loop.run_in_executor(executor, next, chunks, None)
+
+                chunk_sample_size = sample_size
+                if not chunk_sample_size:
+                    chunk_sample_size = self._get_sample_size(chunk)
+                profile_future = loop.run_in_executor(
+                    executor, functools.partial(
+                        self._update_profile_from_chunk, chunk,
+                        chunk_sample_size, min_true_samples, self.options,
+                        show_progress=False))
+                try:
+                    await asyncio.shield(profile_future)
+                except asyncio.CancelledError:
+                    # the chunk cannot be interrupted, let it complete so
+                    # the profile is left consistent
+                    await asyncio.wait([profile_future])
+                    raise
+
+                rows_profiled += len(chunk)
+                if progress_callback is not None:
+                    await progress_callback(rows_profiled, total_rows)
+                # yield between chunks so a cancellation takes effect
+                # before the next chunk is profiled
+                await asyncio.sleep(0)
+        finally:
+            # the generator cannot be closed while the next chunk is read
+            if not next_chunk.done():
+                await asyncio.wait([next_chunk])
+            chunks.close()
+            # joining the workers would block the event loop
+            await loop.run_in_executor(executor, self._release_pool)
+
+    def _get_stream_chunks(self, data, chunk_size, chunks_in_memory=1,
+                           columns=None):
+        """
+        Validates the data to be streamed and creates the generator of its
+        chunks, sized to fit the memory budget.
+
+        :param data: data to be profiled
+        :type data: Union[data_readers.base_data.BaseData, pandas.DataFrame]
+        :param chunk_size: maximum number of rows per chunk
+        :type chunk_size: int
+        :param chunks_in_memory: number of chunks held in memory at once
+        :type chunks_in_memory: int
+        :param columns: columns streamed, every column if None
+        :type columns: list
+        :return: file type of the data and the generator of its chunks
+        :rtype: tuple(str, generator)
+        """
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError("`chunk_size` must be a positive integer.")
+
+        if isinstance(data, data_readers.base_data.BaseData):
+            file_type = data.data_type
+        elif isinstance(data, pd.DataFrame):
+            file_type = str(data.__class__)
+        else:
+            raise ValueError(
+                "Data must either be imported using the data_readers or "
+                "pd.DataFrame."
+            )
+
+        if columns is not None:
+            if isinstance(data, data_readers.base_data.BaseData):
+                data = data.project_columns(columns)
+            else:
+                data = self._select_chunk_columns(data, columns)
+
+        chunk_size = self._get_budgeted_chunk_size(
+            data, chunk_size, chunks_in_memory)
+        if isinstance(data, data_readers.base_data.BaseData):
+            chunks = data.get_chunk_generator(chunk_size)
+            if columns is not None:
+                # data already loaded is streamed with all its columns
+                chunks = self._select_stream_columns(chunks, columns)
+        else:
+            chunks = utils.partition(data, chunk_size)
+        return file_type, chunks
+
+    @staticmethod
+    def _select_chunk_columns(chunk, columns):
+        """
+        Selects the columns of a chunk, validating they all exist.
+
+        :param chunk: chunk of the data
+        :type chunk: pandas.DataFrame
+        :param columns: columns selected
+        :type columns: list
+        :return: the chunk with only the selected columns
+        :rtype: pandas.DataFrame
+        """
+        if not isinstance(chunk, pd.DataFrame):
+            return chunk
+        missing_columns = [column for column in columns
+                           if column not in chunk.columns]
+        if missing_columns:
+            raise ValueError('Columns {} are not in the data.'
+                             .format(missing_columns))
+        return chunk[list(columns)]
+
+    @staticmethod
+    def _select_stream_columns(chunks, columns):
+        """
+        Selects the columns of each streamed chunk.
+
+        :param chunks: chunks of the streamed data
+        :type chunks: Iterable[pandas.DataFrame]
+        :param columns: columns selected
+        :type columns: list
+        :return: the chunks with only the selected columns
+        :rtype: generator
+        """
+        try:
+            for chunk in chunks:
+                yield Profiler._select_chunk_columns(chunk, columns)
+        finally:
+            if hasattr(chunks, 'close'):
+                chunks.close()
+
+    @staticmethod
+    def _offset_stream_chunks(chunks, row_offset):
+        """
+        Validates the streamed chunks, skipping empty ones, and offsets their
+        rows so null indices are global to the stream.
+
+        :param chunks: chunks of the streamed data
+        :type chunks: Iterable[pandas.DataFrame]
+        :param row_offset: number of rows streamed before the chunks
+        :type row_offset: int
+        :return: the chunks with their rows offset
+        :rtype: generator
+        """
+        try:
+            for chunk in chunks:
+                if not isinstance(chunk, pd.DataFrame):
+                    raise ValueError("Streamed data must be in the form of "
+                                     "pd.DataFrame chunks.")
+                if not len(chunk):
+                    continue
+                chunk.index = pd.RangeIndex(row_offset, row_offset + len(chunk))
+                row_offset += len(chunk)
+                yield chunk
+        finally:
+            if hasattr(chunks, 'close'):
+                chunks.close()
+
+    @staticmethod
+    def _get_progress_bar(show_progress=True):
+        """
+        Returns the function wrapping an iterable to display its progress.
 
+        :param show_progress: whether the progress is displayed
+        :type show_progress: bool
+        :return: progress bar function
+        :rtype: Callable
+        """
+        if not show_progress:
+            def tqdm(l):
+                return l
+            return tqdm
+        try:
+            from tqdm import tqdm
+        except:
+            def tqdm(l):
+                for i, e in enumerate(l):
+                    print("Processing Column {}/{}".format(i+1, len(l)))
+                    yield e
+        return tqdm
+
+    @tracing.traced()
     def _update_profile_from_chunk(self, df, sample_size=None,
-                                   min_true_samples=None, options=None):
+                                   min_true_samples=None, options=None,
+                                   show_progress=True):
         """
         Iterate over the columns of a dataset and identify its parameters.
         
@@ -683,32 +2014,65 @@ class Profiler(object):
         :type min_true_samples: int
         :param options: Options for the profiler
         :type options: ProfilerOptions
-        :return: list of column profile base subclasses
-        :rtype: list(BaseColumnProfiler)
+        :param show_progress: whether the progress is printed to stdout
+        :type show_progress: bool
+        :return: None
         """
+        cleaned_chunk = self._clean_chunk(
+            df, sample_size, min_true_samples, options, show_progress)
+        self._profile_cleaned_chunk(cleaned_chunk, show_progress)
 
+    @tracing.traced()
+    def _clean_chunk(self, df, sample_size=None, min_true_samples=None,
+                     options=None, show_progress=True, resize_pool=True):
+        """
+        Creates the profiles of the new columns of a dataset, then removes
+        the nulls of each column and calculates its base statistics, without
+        updating the profiles yet.
+
+        :param df: a dataset
+        :type df: pandas.DataFrame
+        :param sample_size: number of samples for df to use for profiling
+        :type sample_size: int
+        :param min_true_samples: minimum number of true samples required
+        :type min_true_samples: int
+        :param options: Options for the profiler
+        :type options: ProfilerOptions
+        :param show_progress: whether the progress is printed to stdout
+        :type show_progress: bool
+        :param resize_pool: whether the pool may be replaced by a smaller one
+            to fit the memory budget, which must not happen while another
+            chunk is profiled with it
+        :type resize_pool: bool
+        :return: the cleaned chunk, to be profiled by `_profile_cleaned_chunk`
+        :rtype: _CleanedChunk
+        """
         if len(df.columns) != len(df.columns.unique()):
             raise ValueError('`Profiler` does not currently support data which '
                              'contains columns with duplicate names.')
 
-        try:
-            from tqdm import tqdm
-        except:
-            def tqdm(l):
-                for i, e in enumerate(l):
-                    print("Processing Column {}/{}".format(i+1, len(l)))
-                    yield e
-
-        # Shuffle indices once and share with columns
-        sample_ids = [*utils.shuffle_in_chunks(len(df), len(df))]
+        self._ensure_data_labelers()
+        sample_size, max_pool_size = self._apply_memory_budget(
+            df, sample_size)
+        if not resize_pool and self._pool is not None:
+            max_pool_size = None
+
+        tqdm = self._get_progress_bar(show_progress)
+
+        # Shuffle indices once and share with columns. Without minimum true
+        # samples, only the sample size of indices is needed
+        num_sample_ids = len(df)
+        if min_true_samples in [None, 0] and sample_size is not None:
+            num_sample_ids = min(sample_size, len(df))
+        sample_ids = [*itertools.islice(
+            utils.shuffle_in_chunks(len(df), num_sample_ids), 1)]
         
-        # If there are no minimum true samples, you can sort to save time
-        if min_true_samples in [None, 0]:
-            # If there's a sample size, truncate
-            if sample_size is not None:
-                sample_ids[0] = sample_ids[0][:sample_size]
+        # If there are no minimum true samples, you can sort to save time,
+        # unless the columns are sampled in rounds, which must be random
+        if min_true_samples in [None, 0] and sample_ids \
+                and not self._is_sampled_adaptively:
             # Sort the sample_ids and replace prior
-            sample_ids[0] = sorted(sample_ids[0])
+            sample_ids[0] = np.sort(sample_ids[0])
 
         # Numpy arrays allocate to heap and can be shared between processes
         # Non-locking multiprocessing fails on machines without POSIX (windows)
@@ -716,28 +2080,41 @@ class Profiler(object):
         # Newly introduced features (python3.8) improves the situation
         sample_ids = np.array(sample_ids)
 
-        # Create structured profile objects
-        new_cols = set()
+        # Create structured profile objects for the new columns. They are only
+        # added to the profile by `_profile_cleaned_chunk`, as the previous
+        # chunk may be profiled meanwhile on another thread
+        new_profiles = dict()
         for col in df.columns:
             if col not in self._profile:
                 structured_options = None
                 if options and options.structured_options:
                     structured_options = options.structured_options
-                self._profile[col] = StructuredDataProfile(
+                new_profiles[col] = StructuredDataProfile(
                     sample_size=sample_size,
                     min_true_samples=min_true_samples,
                     sample_ids=sample_ids,
                     options=structured_options
                 )
-                new_cols.add(col)
+        new_cols = set(new_profiles)
+        col_profiles = {col: new_profiles[col] if col in new_profiles
+                        else self._profile[col] for col in df.columns}
                 
-        # Generate pool and estimate datasize
+        # Retrieve the profiler's pool, creating it on first use
         pool = None
+        pool_size = None
         if options.structured_options.multiprocess.is_enabled:
             est_data_size = df[:50000].memory_usage(index=False, deep=True).sum()
             est_data_size = (est_data_size / min(50000, len(df))) * len(df)
-            pool, pool_size = utils.generate_pool(
-                max_pool_size=None, data_size=est_data_size, cols=len(df.columns))
+            pool, pool_size = self._get_pool(
+                data_size=est_data_size, cols=len(df.columns),
+                max_pool_size=max_pool_size)
+
+        if not sample_size: sample_size = len(df)
+        if self._is_sampled_adaptively:
+            samples_for_row_stats = sample_ids[0] if len(sample_ids) else None
+            return _CleanedChunk(df, None, None, samples_for_row_stats, pool,
+                                 pool_size, sample_ids, sample_size,
+                                 min_true_samples, new_profiles)
 
         # Format the data
         notification_str = "Finding the Null values in the columns..."        
@@ -745,121 +2122,144 @@ class Profiler(object):
             notification_str += " (with " + str(pool_size) + " processes)"
         
         clean_sampled_dict = {}
+        base_stats_dict = {}
         multi_process_dict = {}
         single_process_list = set()
-        if not sample_size: sample_size = len(df)
         if sample_size < len(df):
             warnings.warn("The data will be profiled with a sample size of {}. "
                           "All statistics will be based on this subsample and "
                           "not the whole dataset.".format(sample_size))
 
-        if pool is not None:
+        # Null cleaning is executed on processes when the backend is 'auto'
+        clean_pool = utils.select_pool(pool)
+        if clean_pool is not None:
+            # Publish the sample ids and the numeric and datetime columns once
+            # to shared memory, so workers attach to them instead of
+            # unpickling copies. String and object columns are still pickled
+            shared_blocks = []
+            sample_ids_desc = None
+            if utils.can_share_memory(clean_pool):
+                shm, sample_ids_desc = utils.share_array(sample_ids)
+                shared_blocks.append(shm)
+
             # Create a bunch of simultaneous column conversions
             for col in df.columns:
                 if min_true_samples is None:
-                    min_true_samples = self._profile[col]._min_true_samples
+                    min_true_samples = col_profiles[col]._min_true_samples
                 try:
-                    multi_process_dict[col] = pool.apply_async(
-                        self._profile[col].clean_data_and_get_base_stats,
-                        (df[col], sample_size, min_true_samples, sample_ids))
+                    series_desc = None
+                    if sample_ids_desc is not None:
+                        col_blocks, series_desc = utils.share_series(df[col])
+                        shared_blocks += col_blocks
+                    if series_desc is not None:
+                        multi_process_dict[col] = utils.apply_async(
+                            clean_pool, _clean_shared_data_and_get_base_stats,
+                            (series_desc, sample_size, min_true_samples,
+                             sample_ids_desc))
+                    else:
+                        multi_process_dict[col] = utils.apply_async(
+                            clean_pool,
+                            col_profiles[col].clean_data_and_get_base_stats,
+                            (df[col], sample_size, min_true_samples,
+                             sample_ids))
                 except Exception as e:
                     print(e)
                     single_process_list.add(col)
                 
             # Iterate through multiprocessed columns collecting results
-            print(notification_str)
+            if show_progress:
+                print(notification_str)
             for col in tqdm(multi_process_dict.keys()):
                 try:
-                    clean_sampled_dict[col], base_stats = \
-                        multi_process_dict[col].get()
-                    self._profile[col]._update_base_stats(base_stats)
+                    with tracing.span('pool_wait', column=str(col)):
+                        clean_sampled_dict[col], base_stats_dict[col] = \
+                            utils.get_async_result(
+                                clean_pool, multi_process_dict[col])
                 except Exception as e:
                     print(e)
                     single_process_list.add(col)
 
+            # All workers are done with the shared data
+            utils.release_shared_memory(shared_blocks, unlink=True)
+
             # Clean up any columns which errored
             if len(single_process_list) > 0:
                 print("Errors in multiprocessing occured:",
                       len(single_process_list), "errors, reprocessing...")
                 for col in tqdm(single_process_list):
                     if min_true_samples is None:
-                        min_true_samples = self._profile[col]._min_true_samples
-                    clean_sampled_dict[col], base_stats = \
-                        self._profile[col].clean_data_and_get_base_stats(
+                        min_true_samples = col_profiles[col]._min_true_samples
+                    clean_sampled_dict[col], base_stats_dict[col] = \
+                        col_profiles[col].clean_data_and_get_base_stats(
                             df[col], sample_size, min_true_samples, sample_ids)
-                    self._profile[col]._update_base_stats(base_stats)
-            
-            pool.close()  # Close pool for new tasks
-            pool.join()  # Wait for all workers to complete
 
         else:  # No pool
-            print(notification_str)
+            if show_progress:
+                print(notification_str)
             for col in tqdm(df.columns):
                 if min_true_samples is None:
-                    min_true_samples = self._profile[col]._min_true_samples
-                clean_sampled_dict[col], base_stats = \
-                    self._profile[col].clean_data_and_get_base_stats(
+                    min_true_samples = col_profiles[col]._min_true_samples
+                clean_sampled_dict[col], base_stats_dict[col] = \
+                    col_profiles[col].clean_data_and_get_base_stats(
                         df_series=df[col], sample_size=sample_size,
                         min_true_samples=min_true_samples, sample_ids=sample_ids
                     )
-                self._profile[col]._update_base_stats(base_stats)
-            
-        # Process and label the data
-        notification_str = "Calculating the statistics... "
-        pool = None
-        if options.structured_options.multiprocess.is_enabled:
-            pool, pool_size = utils.generate_pool(4, est_data_size)
-            if pool:
-                notification_str += " (with " + str(pool_size) + " processes)"
-        print(notification_str)
-        
-        for col in tqdm(df.columns):
-            self._profile[col].update_column_profilers(
-                clean_sampled_dict[col], pool)
-
-        if pool is not None:
-            pool.close()  # Close pool for new tasks
-            pool.join()  # Wait for all workers to complete
 
         # Only pass along sample ids if necessary
         samples_for_row_stats = None
         if min_true_samples not in [None, 0]:
             samples_for_row_stats = np.concatenate(sample_ids)
 
-        self._update_row_statistics(df, samples_for_row_stats)
+        return _CleanedChunk(df, clean_sampled_dict, base_stats_dict,
+                             samples_for_row_stats, pool, pool_size,
+                             None, sample_size, min_true_samples,
+                             new_profiles)
 
-    def _remove_data_labelers(self):
+    @tracing.traced()
+    def _profile_cleaned_chunk(self, cleaned_chunk, show_progress=True):
         """
-        Helper method for removing all data labelers before saving to disk.
+        Updates the profile of each column with a cleaned chunk, then the row
+        statistics.
 
-        :return: dictionary of removed data labeler objects
-        :rtype: dict (string -> data labeler object) 
+        :param cleaned_chunk: chunk returned by `_clean_chunk`
+        :type cleaned_chunk: _CleanedChunk
+        :param show_progress: whether the progress is printed to stdout
+        :type show_progress: bool
+        :return: None
         """
-        data_labelers = {}
-
-        # Delete data labeler for profiler
-        data_labeler_options = self.options.structured_options.data_labeler
-        if data_labeler_options.is_enabled \
-                and data_labeler_options.data_labeler_object is not None:
-            data_labelers["data_labeler"] = data_labeler_options \
-                                            .data_labeler_object
-            data_labeler_options.data_labeler_object = None
-                
-        # Delete data labelers for all columns
-        for key in self._profile:
+        tqdm = self._get_progress_bar(show_progress)
+        df = cleaned_chunk.df
+        pool = cleaned_chunk.pool
 
-            val = self._profile[key]
-            use_data_labeler = True
-            if val.options and isinstance(val.options, StructuredOptions):
-                use_data_labeler = val.options.data_labeler.is_enabled
+        # Process and label the data, reusing the same pool
+        notification_str = "Calculating the statistics... "
+        if pool:
+            notification_str += " (with " + str(cleaned_chunk.pool_size) \
+                + " processes)"
+        if show_progress:
+            print(notification_str)
 
-            if use_data_labeler:
-                data_labelers[key] = val.profiles['data_label_profile'] \
-                                        ._profiles['data_labeler'].data_labeler
-                val.profiles['data_label_profile']._profiles['data_labeler'] \
-                   .data_labeler = None
+        # Add the columns first seen in this chunk, unless a previous chunk
+        # cleaned before this one was profiled already added them
+        for col, profile in cleaned_chunk.new_profiles.items():
+            if col not in self._profile:
+                self._profile[col] = profile
 
-        return data_labelers
+        for col in tqdm(df.columns):
+            with tracing.span('column', column=str(col)):
+                if cleaned_chunk.clean_sampled_dict is None:
+                    self._profile[col].update_profile(
+                        df[col], cleaned_chunk.sample_size,
+                        cleaned_chunk.min_true_samples,
+                        cleaned_chunk.sample_ids, pool)
+                    continue
+                self._profile[col]._update_base_stats(
+                    cleaned_chunk.base_stats[col])
+                self._profile[col].update_column_profilers(
+                    cleaned_chunk.clean_sampled_dict[col], pool)
+
+        self._update_row_statistics(
+            df, cleaned_chunk.samples_for_row_stats)
 
     def _restore_data_labelers(self, data_labelers={}):
         """
@@ -919,6 +2319,25 @@ class Profiler(object):
                             dirpath=data_labeler_dirpath,
                             load_options=None)
 
+    def _ensure_data_labelers(self, data_labelers=None):
+        """
+        Restores the data labelers of a loaded profile, which are not saved
+        with it, prior to them being required to profile or merge.
+
+        :param data_labelers: data labelers to restore, to which the data
+            labeler loaded for the profiler is added, if any
+        :type data_labelers: dict (string -> data labeler object)
+        """
+        if not self._data_labelers_restored:
+            if data_labelers is None:
+                data_labelers = dict()
+            self._restore_data_labelers(data_labelers)
+            data_labeler = self.options.structured_options.data_labeler \
+                .data_labeler_object
+            if data_labeler is not None:
+                data_labelers.setdefault("data_labeler", data_labeler)
+            self._data_labelers_restored = True
+
     def save(self, filepath=None):
         """
         Save profiler to disk
@@ -932,60 +2351,314 @@ class Profiler(object):
             filepath = "profile-{}.pkl".format(
                         datetime.now().strftime("%d-%b-%Y-%H:%M:%S.%f"))
 
-        # Remove data labelers as they can't be pickled
-        data_labelers = self._remove_data_labelers()
-
-        # Create dictionary for all metadata, options, and profile 
-        data = { 
-                "total_samples": self.total_samples,
-                "encoding": self.encoding,
-                "file_type": self.file_type,
-                "row_has_null_count": self.row_has_null_count,
-                "row_is_null_count": self.row_is_null_count,
-                "hashed_row_dict": self.hashed_row_dict,
-                "_samples_per_update": self._samples_per_update,
-                "_min_true_samples": self._min_true_samples,
-                "options": self.options,
-                "_profile": self.profile
-               } 
-
-        # Pickle and save profile to disk
         with open(filepath, "wb") as outfile:
-            pickle.dump(data, outfile)
+            self._save_to_file(outfile)
+
+    @tracing.traced()
+    def _save_to_file(self, outfile):
+        """
+        Writes the profile to a binary file object open for writing.
+
+        :param outfile: file to write to
+        :type outfile: BinaryIO
+        :return: None
+        """
+        # Column profiles and arrays are written ahead of the header, which
+        # holds the metadata, options and the location of each column
+        outfile.write(b'\0' * _PROFILE_FILE_PREFIX.size)
+        structured_options = self.options.structured_options
+        columns = [
+            (name,) + _write_profile_block(
+                outfile, col_profile, structured_options)
+            for name, col_profile in self._profile.items()
+        ]
+        hashed_rows = np.fromiter(self.hashed_row_dict, dtype=np.uint64,
+                                  count=len(self.hashed_row_dict))
+
+        header = {
+            "total_samples": self.total_samples,
+            "encoding": self.encoding,
+            "file_type": self.file_type,
+            "row_has_null_count": self.row_has_null_count,
+            "row_is_null_count": self.row_is_null_count,
+            "hashed_row_dict": _write_profile_block(outfile, hashed_rows),
+            "hashed_row_sketch": self.hashed_row_sketch,
+            "_samples_per_update": self._samples_per_update,
+            "_min_true_samples": self._min_true_samples,
+            "options": self.options,
+            "columns": columns
+        }
+        header_offset = outfile.tell()
+        _ProfilePickler(outfile).dump(header)
+        header_length = outfile.tell() - header_offset
 
-        # Restore all data labelers
-        self._restore_data_labelers(data_labelers)
+        outfile.seek(0)
+        outfile.write(_PROFILE_FILE_PREFIX.pack(
+            _PROFILE_FILE_MAGIC, _PROFILE_FILE_VERSION,
+            header_offset, header_length))
 
     @staticmethod
-    def load(filepath):
+    def load(filepath, columns=None):
         """
-        Load profiler from disk
+        Load profiler from disk. Only the requested columns are read from the
+        file and the data labelers are only loaded once the profile is
+        updated or merged.
         
         :param filepath: Path of file to load from
         :type filepath: String
-        :return: None
+        :param columns: columns to load, all columns if None
+        :type columns: list
+        :return: Profiler
+        """
+        with open(filepath, "rb") as infile:
+            return Profiler._load_from_file(infile, columns)
+
+    @staticmethod
+    @tracing.traced()
+    def _load_from_file(infile, columns=None):
+        """
+        Reads a profile from a binary file object open for reading.
+
+        :param infile: file to read from
+        :type infile: BinaryIO
+        :param columns: columns to load, all columns if None
+        :type columns: list
+        :return: Profiler
         """
         # Create Empty Profile
         profile_options = ProfilerOptions()
         profile_options.structured_options.data_labeler.is_enabled = False
         profile = Profiler(pd.DataFrame([]), profiler_options=profile_options)
 
-        # Load profile from disk
-        with open(filepath, "rb") as infile:
+        prefix = infile.read(_PROFILE_FILE_PREFIX.size)
+        if not prefix.startswith(_PROFILE_FILE_MAGIC):
+            # Profiles saved prior to the versioned format are a pickle
+            infile.seek(0)
             data = pickle.load(infile)
+            saved_columns = list(data["_profile"])
+        else:
+            _, version, header_offset, header_length = \
+                _PROFILE_FILE_PREFIX.unpack(prefix)
+            if version > _PROFILE_FILE_VERSION:
+                raise ValueError("Profile file version {} is not supported"
+                                 ", update the DataProfiler to load it."
+                                 .format(version))
+            try:
+                file_map = mmap.mmap(infile.fileno(), 0,
+                                     access=mmap.ACCESS_COPY)
+            except (AttributeError, OSError, ValueError):
+                file_map = None
+
+            data = _read_profile_block(
+                infile, file_map, (header_offset, header_length), [])
+            data["hashed_row_dict"] = dict.fromkeys(_read_profile_block(
+                infile, file_map, *data["hashed_row_dict"]).tolist(), True)
+            column_blocks = OrderedDict(
+                (name, blocks) for name, *blocks in data["columns"])
+            saved_columns = list(column_blocks)
+
+        if columns is None:
+            columns = saved_columns
+        missing_columns = [col for col in columns
+                           if col not in saved_columns]
+        if missing_columns:
+            raise ValueError("Columns {} are not in the saved profile."
+                             .format(missing_columns))
+
+        if "_profile" in data:
+            data["_profile"] = {col: data["_profile"][col]
+                                for col in columns}
+        else:
+            structured_options = data["options"].structured_options
+            data["_profile"] = {
+                col: _read_profile_block(
+                    infile, file_map, *column_blocks[col],
+                    structured_options=structured_options)
+                for col in columns
+            }
 
-            profile.total_samples = data["total_samples"]
-            profile.encoding = data["encoding"]
-            profile.file_type = data["file_type"]
-            profile.row_has_null_count = data["row_has_null_count"]
-            profile.row_is_null_count = data["row_is_null_count"]
-            profile.hashed_row_dict = data["hashed_row_dict"]
-            profile._samples_per_update = data["_samples_per_update"]
-            profile._min_true_samples = data["_min_true_samples"]
-            profile._profile = data["_profile"]
-            profile.options = data["options"]
-
-        # Restore all data labelers
-        profile._restore_data_labelers()
+        profile.total_samples = data["total_samples"]
+        profile.encoding = data["encoding"]
+        profile.file_type = data["file_type"]
+        profile.row_has_null_count = data["row_has_null_count"]
+        profile.row_is_null_count = data["row_is_null_count"]
+        profile.hashed_row_dict = data["hashed_row_dict"]
+        profile.hashed_row_sketch = data.get("hashed_row_sketch")
+        profile._samples_per_update = data["_samples_per_update"]
+        profile._min_true_samples = data["_min_true_samples"]
+        profile._profile = data["_profile"]
+        profile.options = data["options"]
+
+        # Data labelers are restored when required
+        profile._data_labelers_restored = False
 
         return profile
+
+
+def _close_pool(pool):
+    """
+    Closes a pool of a profiler and waits for its workers to exit.
+
+    :param pool: pool to close
+    :type pool: Union[multiprocessing.Pool, utils.AutoPool]
+    :return: None
+    """
+    pool.close()  # Close pool for new tasks
+    pool.join()  # Wait for all workers to complete
+
+
+# options shared by the partitions profiled in a `profile_dataset` worker
+_partition_worker_options = None
+
+
+def _init_partition_worker(pickled_options, is_tracing_enabled=False):
+    """
+    Loads the profiler options in a `profile_dataset` worker process. The data
+    labeler is loaded once per worker, by the first partition it profiles.
+
+    :param pickled_options: options pickled by `_ProfilePickler`
+    :type pickled_options: bytes
+    :param is_tracing_enabled: whether spans are recorded in the worker
+    :type is_tracing_enabled: bool
+    :return: None
+    """
+    global _partition_worker_options
+    _partition_worker_options = _ProfileUnpickler(
+        io.BytesIO(pickled_options)).load()
+    tracing.clear()
+    if is_tracing_enabled:
+        tracing.enable()
+
+
+def _profile_partition(args):
+    """
+    Profiles a partition of a dataset in a `profile_dataset` worker process.
+
+    :param args: path of the partition, options of its Data object, samples
+        per update and minimum true samples of the profile
+    :type args: tuple(str, dict, int, int)
+    :return: the profile of the partition, saved, and the spans recorded
+    :rtype: tuple(bytes, list(dict))
+    """
+    path, data_options, samples_per_update, min_true_samples = args
+    options = _partition_worker_options
+
+    # workers of a pool cannot create a pool of their own
+    multiprocess_enabled = options.structured_options.multiprocess.is_enabled
+    options.set({'multiprocess.is_enabled': False})
+    try:
+        profile = Profiler(
+            data_readers.data.Data(path, options=data_options),
+            samples_per_update=samples_per_update,
+            min_true_samples=min_true_samples,
+            profiler_options=options)
+    finally:
+        options.set({'multiprocess.is_enabled': multiprocess_enabled})
+
+    outfile = io.BytesIO()
+    profile._save_to_file(outfile)
+    events = tracing.get_events()
+    tracing.clear()
+    return outfile.getvalue(), events
+
+
+def _get_dataset_paths(paths_or_glob):
+    """
+    Lists the files of a partitioned dataset.
+
+    :param paths_or_glob: paths of the files, a glob pattern matching them or
+        the directory holding them
+    :type paths_or_glob: Union[str, list(str)]
+    :return: paths of the files
+    :rtype: list(str)
+    """
+    if not isinstance(paths_or_glob, str):
+        return list(paths_or_glob)
+    if os.path.isdir(paths_or_glob):
+        return sorted(
+            os.path.join(paths_or_glob, filename)
+            for filename in os.listdir(paths_or_glob)
+            if not filename.startswith(('.', '_'))
+            and os.path.isfile(os.path.join(paths_or_glob, filename)))
+    return sorted(glob.glob(paths_or_glob))
+
+
+def profile_dataset(paths_or_glob, workers=None, profiler_options=None,
+                    data_options=None, samples_per_update=None,
+                    min_true_samples=0):
+    """
+    Profiles a dataset partitioned into many files, e.g. the part files of a
+    Parquet or CSV dataset. Each partition is profiled with the same options
+    in a worker process and the partial profiles are merged into one. Columns
+    missing from some of the partitions are profiled from the partitions
+    which have them.
+
+    :param paths_or_glob: paths of the partitions, a glob pattern matching
+        them or the directory holding them
+    :type paths_or_glob: Union[str, list(str)]
+    :param workers: number of worker processes, the suggested pool size if
+        None, the partitions are profiled in this process if 1
+    :type workers: int
+    :param profiler_options: Options for the profiler of each partition.
+    :type profiler_options: ProfilerOptions Object
+    :param data_options: Options for the Data object of each partition.
+    :type data_options: dict
+    :param samples_per_update: Number of samples to use in generating
+        the profile of each partition
+    :type samples_per_update: int
+    :param min_true_samples: Minimum number of samples required for the
+        profiler
+    :type min_true_samples: int
+    :return: profile of the dataset
+    :rtype: Profiler
+    """
+    paths = _get_dataset_paths(paths_or_glob)
+    if not paths:
+        raise ValueError("No files found to profile for {}."
+                         .format(paths_or_glob))
+
+    if not profiler_options:
+        profiler_options = ProfilerOptions()
+    elif not isinstance(profiler_options, ProfilerOptions):
+        raise ValueError("The profile options must be passed as a "
+                         "ProfileOptions object.")
+    profiler_options.validate()
+
+    if workers is None:
+        workers = utils.suggest_pool_size(cols=len(paths)) or 1
+    workers = min(workers, len(paths))
+
+    if workers <= 1:
+        profiles = []
+        for path in paths:
+            # the pool of each partition is closed once it is profiled
+            with Profiler(data_readers.data.Data(path, options=data_options),
+                          samples_per_update=samples_per_update,
+                          min_true_samples=min_true_samples,
+                          profiler_options=profiler_options) as profile:
+                profiles.append(profile)
+        return Profiler.merge_many(profiles, align_schema=True)
+
+    # the data labeler is not sent to the workers, each loads its own
+    pickled_options = io.BytesIO()
+    _ProfilePickler(pickled_options).dump(profiler_options)
+    partitions = [(path, data_options, samples_per_update, min_true_samples)
+                  for path in paths]
+    with mp.Pool(workers, initializer=_init_partition_worker,
+                 initargs=(pickled_options.getvalue(),
+                           tracing.is_enabled())) as pool:
+        profiles = []
+        for saved_profile, events in pool.imap(_profile_partition,
+                                               partitions):
+            tracing.add_events(events)
+            profiles.append(
+                Profiler._load_from_file(io.BytesIO(saved_profile)))
+
+    data_labelers = dict()
+    data_labeler = profiler_options.structured_options.data_labeler \
+        .data_labeler_object
+    if data_labeler is not None:
+        data_labelers["data_labeler"] = data_labeler
+    for profile in profiles:
+        profile._ensure_data_labelers(data_labelers)
+    return Profiler.merge_many(profiles, align_schema=True)
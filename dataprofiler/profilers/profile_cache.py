@@ -0,0 +1,290 @@
+"""
+coding=utf-8
+
+Cache of the profiles of files, which are only re-profiled when the file or
+the profiler options change. Rows appended to a delimited file are profiled on
+their own and merged into the cached profile.
+"""
+import hashlib
+import io
+import json
+import os
+
+import pandas as pd
+
+from .. import data_readers
+from ..labelers.base_data_labeler import BaseDataLabeler
+from .profile_builder import Profiler
+from .profiler_options import BaseOption, ProfilerOptions
+
+
+def _hash_bytes(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def get_file_fingerprint(filepath, block_size=65536):
+    """
+    Fingerprints a file by its size, modification time and the hashes of its
+    first and last blocks, without reading the rest of the file.
+
+    :param filepath: path of the file
+    :type filepath: str
+    :param block_size: number of bytes hashed at the head and tail
+    :type block_size: int
+    :return: fingerprint of the file
+    :rtype: dict
+    """
+    stat = os.stat(filepath)
+    with open(filepath, "rb") as infile:
+        head = infile.read(block_size)
+        infile.seek(max(stat.st_size - block_size, 0))
+        tail = infile.read(block_size)
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "head_hash": _hash_bytes(head),
+        "tail_hash": _hash_bytes(tail),
+        "block_size": block_size,
+    }
+
+
+def _is_appended(filepath, fingerprint):
+    """
+    Whether the file only had bytes appended since it was fingerprinted,
+    i.e. the fingerprinted head and tail blocks are unchanged.
+
+    :param filepath: path of the file
+    :type filepath: str
+    :param fingerprint: earlier fingerprint of the file
+    :type fingerprint: dict
+    :return: whether the file was appended to
+    :rtype: bool
+    """
+    size = fingerprint["size"]
+    block_size = fingerprint["block_size"]
+    if os.stat(filepath).st_size <= size:
+        return False
+    with open(filepath, "rb") as infile:
+        head = infile.read(min(block_size, size))
+        infile.seek(max(size - block_size, 0))
+        tail = infile.read(min(block_size, size))
+    return _hash_bytes(head) == fingerprint["head_hash"] \
+        and _hash_bytes(tail) == fingerprint["tail_hash"] \
+        and tail.endswith(b"\n")
+
+
+def _get_option_values(option):
+    """
+    Values of the options which affect the profile, in a form which can be
+    serialized deterministically.
+
+    :param option: options of the profiler
+    :type option: BaseOption
+    :return: values of the options
+    :rtype: Union[dict, list, str, int, float, bool, None]
+    """
+    if isinstance(option, BaseOption):
+        # the multiprocess options change how, not what, is profiled
+        return {name: _get_option_values(value)
+                for name, value in vars(option).items()
+                if name != "multiprocess"}
+    elif isinstance(option, (list, tuple)):
+        return [_get_option_values(value) for value in option]
+    elif isinstance(option, (set, frozenset)):
+        return sorted(map(repr, option))
+    elif isinstance(option, BaseDataLabeler):
+        return type(option).__name__
+    elif option is None or isinstance(option, (str, int, float, bool)):
+        return option
+    return repr(option)
+
+
+def get_options_hash(options):
+    """
+    Hashes the profiler options which affect the profile.
+
+    :param options: options of the profiler
+    :type options: ProfilerOptions
+    :return: hash of the options
+    :rtype: str
+    """
+    values = json.dumps(_get_option_values(options), sort_keys=True)
+    return _hash_bytes(values.encode("utf-8"))
+
+
+def get_data_options_hash(data_options=None, data_type=None):
+    """
+    Hashes the options of the Data object of a file and the type of its data
+    reader, which select what is read from the file. No options and empty
+    options are hashed alike.
+
+    :param data_options: options of the Data object
+    :type data_options: dict
+    :param data_type: type of the data reader, guessed from the file if None
+    :type data_type: str
+    :return: hash of the options
+    :rtype: str
+    """
+    values = {
+        "data_options": {str(key): _get_option_values(value)
+                         for key, value in (data_options or {}).items()},
+        "data_type": data_type.lower() if data_type else None,
+    }
+    values = json.dumps(values, sort_keys=True)
+    return _hash_bytes(values.encode("utf-8"))
+
+
+class ProfileCache(object):
+
+    def __init__(self, cache_dir):
+        """
+        Initialization of a cache of profiles saved in a directory. Each file
+        profiled with the same profiler and data options has one entry,
+        holding its saved profile and the fingerprint of the file when it was
+        profiled.
+
+        :param cache_dir: directory in which profiles are saved
+        :type cache_dir: str
+        """
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _get_entry_paths(self, filepath, options_hash, data_options_hash):
+        """
+        Paths of the metadata and the saved profile of a cache entry.
+
+        :param filepath: path of the profiled file
+        :type filepath: str
+        :param options_hash: hash of the profiler options
+        :type options_hash: str
+        :param data_options_hash: hash of the data options and data type
+        :type data_options_hash: str
+        :return: paths of the metadata and the profile
+        :rtype: tuple(str, str)
+        """
+        key = _hash_bytes("{}\0{}\0{}".format(
+            os.path.abspath(filepath), options_hash,
+            data_options_hash).encode("utf-8"))
+        entry_path = os.path.join(self.cache_dir, key)
+        return entry_path + ".json", entry_path + ".pkl"
+
+    def _read_entry(self, metadata_path):
+        try:
+            with open(metadata_path, "r") as infile:
+                return json.load(infile)
+        except (OSError, ValueError):
+            return None
+
+    def _write_entry(self, metadata_path, profile_path, metadata, profile):
+        """
+        Saves a profile and its metadata, replacing any previous entry only
+        once both are written.
+        """
+        profile.save(profile_path + ".tmp")
+        with open(metadata_path + ".tmp", "w") as outfile:
+            json.dump(metadata, outfile)
+        os.replace(profile_path + ".tmp", profile_path)
+        os.replace(metadata_path + ".tmp", metadata_path)
+
+    @staticmethod
+    def _read_appended_rows(filepath, metadata):
+        """
+        Reads the rows appended to a delimited file since it was profiled.
+
+        :param filepath: path of the file
+        :type filepath: str
+        :param metadata: metadata of the cache entry of the file
+        :type metadata: dict
+        :return: the appended rows, indexed after the rows profiled
+        :rtype: pandas.DataFrame
+        """
+        with open(filepath, "rb") as infile:
+            infile.seek(metadata["fingerprint"]["size"])
+            appended_bytes = infile.read()
+        appended_rows = pd.read_csv(
+            io.BytesIO(appended_bytes),
+            delimiter=metadata["delimiter"],
+            quotechar=metadata["quotechar"] or '"',
+            header=None,
+            names=metadata["columns"],
+            dtype=str,
+            keep_default_na=False,
+            encoding=metadata["encoding"])
+        appended_rows.index = pd.RangeIndex(
+            metadata["row_count"], metadata["row_count"] + len(appended_rows))
+        return appended_rows
+
+    def profile(self, filepath, profiler_options=None, data_options=None,
+                data_type=None):
+        """
+        Profiles the file, unless it is unchanged since it was last profiled
+        with the same options, in which case the cached profile is returned.
+        If rows were only appended to a delimited file, the appended rows are
+        profiled and merged into the cached profile.
+
+        :param filepath: path of the file to profile
+        :type filepath: str
+        :param profiler_options: Options for the profiler.
+        :type profiler_options: ProfilerOptions Object
+        :param data_options: Options for the Data object of the file.
+        :type data_options: dict
+        :param data_type: type of the data reader of the file, guessed from
+            the file if None
+        :type data_type: str
+        :return: profile of the file
+        :rtype: Profiler
+        """
+        if not profiler_options:
+            profiler_options = ProfilerOptions()
+        elif not isinstance(profiler_options, ProfilerOptions):
+            raise ValueError("The profile options must be passed as a "
+                             "ProfileOptions object.")
+        options_hash = get_options_hash(profiler_options)
+        data_options_hash = get_data_options_hash(data_options, data_type)
+        metadata_path, profile_path = self._get_entry_paths(
+            filepath, options_hash, data_options_hash)
+        metadata = self._read_entry(metadata_path)
+
+        fingerprint = get_file_fingerprint(filepath)
+        if metadata is not None and os.path.isfile(profile_path):
+            if metadata["fingerprint"] == fingerprint:
+                return Profiler.load(profile_path)
+
+            if metadata.get("columns") is not None \
+                    and _is_appended(filepath, metadata["fingerprint"]):
+                profile = Profiler.load(profile_path)
+                data_labeler = profiler_options.structured_options \
+                    .data_labeler.data_labeler_object
+                profile._ensure_data_labelers(
+                    {"data_labeler": data_labeler} if data_labeler else None)
+                appended_rows = self._read_appended_rows(filepath, metadata)
+                appended_profile = Profiler(
+                    appended_rows,
+                    samples_per_update=profile._samples_per_update,
+                    min_true_samples=profile._min_true_samples,
+                    profiler_options=profile.options)
+                appended_profile.encoding = profile.encoding
+                appended_profile.file_type = profile.file_type
+                profile = profile + appended_profile
+
+                metadata["fingerprint"] = fingerprint
+                metadata["row_count"] += len(appended_rows)
+                self._write_entry(metadata_path, profile_path, metadata,
+                                  profile)
+                return profile
+
+        data = data_readers.data.Data(filepath, data_type=data_type,
+                                      options=data_options)
+        profile = Profiler(data, profiler_options=profiler_options)
+
+        metadata = {"fingerprint": fingerprint, "columns": None}
+        if data.data_type == "csv" and not data.selected_columns:
+            metadata.update({
+                "columns": data.data.columns.tolist(),
+                "row_count": len(data.data),
+                "delimiter": data.delimiter,
+                "quotechar": data.quotechar,
+                "encoding": data.file_encoding,
+            })
+        self._write_entry(metadata_path, profile_path, metadata, profile)
+        return profile
@@ -184,6 +184,222 @@ class HistogramOption(BooleanOption):
         return errors
 
 
+class MultiprocessOption(BooleanOption):
+
+    def __init__(self, is_enabled=True, backend='process'):
+        """
+        Options for multiprocessing
+
+        :ivar is_enabled: boolean option to enable/disable the option.
+        :vartype is_enabled: bool
+        :ivar backend: pool the profiling work is executed on. Either
+            'process' for a process pool, 'thread' for a thread pool or 'auto'
+            to select threads or processes per profiler depending on whether
+            its calculations release the GIL.
+        :vartype backend: str
+        """
+        self.backend = backend
+        super().__init__(is_enabled=is_enabled)
+
+    def _validate_helper(self, variable_path='MultiprocessOption'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+
+        valid_backends = ['process', 'thread', 'auto']
+        if self.backend not in valid_backends:
+            errors.append("{}.backend must be one of the following: {}."
+                          .format(variable_path, valid_backends))
+        return errors
+
+
+class UniqueRowsOption(BooleanOption):
+
+    def __init__(self, is_enabled=True, method='exact', precision=14):
+        """
+        Options for the unique and duplicate row statistics
+
+        :ivar is_enabled: boolean option to enable/disable the option.
+        :vartype is_enabled: bool
+        :ivar method: either 'exact' to keep the hash of every distinct row or
+            'hll' to estimate the distinct rows with a HyperLogLog sketch of
+            bounded memory.
+        :vartype method: str
+        :ivar precision: number of bits indexing the registers of the sketch,
+            the sketch takes `2 ** precision` bytes.
+        :vartype precision: int
+        """
+        self.method = method
+        self.precision = precision
+        super().__init__(is_enabled=is_enabled)
+
+    def _validate_helper(self, variable_path='UniqueRowsOption'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+
+        valid_methods = ['exact', 'hll']
+        if self.method not in valid_methods:
+            errors.append("{}.method must be one of the following: {}."
+                          .format(variable_path, valid_methods))
+        if not isinstance(self.precision, int) \
+                or isinstance(self.precision, bool) \
+                or not 4 <= self.precision <= 18:
+            errors.append("{}.precision must be an integer from 4 to 18."
+                          .format(variable_path))
+        return errors
+
+
+class MemoryBudgetOption(BooleanOption):
+
+    def __init__(self, is_enabled=True, max_memory_bytes=None):
+        """
+        Options for limiting the memory used to profile
+
+        :ivar is_enabled: boolean option to enable/disable the option.
+        :vartype is_enabled: bool
+        :ivar max_memory_bytes: approximate memory the profiler may use, in
+            bytes. The sample size, chunk size and pool size are reduced and
+            the unique rows are estimated by a sketch to stay within it.
+            Unlimited if None.
+        :vartype max_memory_bytes: int
+        """
+        self.max_memory_bytes = max_memory_bytes
+        super().__init__(is_enabled=is_enabled)
+
+    def _validate_helper(self, variable_path='MemoryBudgetOption'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+
+        if self.max_memory_bytes is not None \
+                and (not isinstance(self.max_memory_bytes, int)
+                     or isinstance(self.max_memory_bytes, bool)
+                     or self.max_memory_bytes <= 0):
+            errors.append("{}.max_memory_bytes must be a positive integer or "
+                          "None.".format(variable_path))
+        return errors
+
+
+class ReservoirOption(BooleanOption):
+
+    def __init__(self, is_enabled=True, size=None):
+        """
+        Options for sampling each column with a reservoir
+
+        :ivar is_enabled: boolean option to enable/disable the option.
+        :vartype is_enabled: bool
+        :ivar size: number of values kept in the reservoir of each column. The
+            data labels, datetimes, histograms, quantiles and precision are
+            then profiled from a uniform sample of this size over every row
+            profiled, while the null, order, category and other numeric
+            statistics are profiled from every row. If None, each update is
+            sampled on its own instead.
+        :vartype size: int
+        """
+        self.size = size
+        super().__init__(is_enabled=is_enabled)
+
+    def _validate_helper(self, variable_path='ReservoirOption'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+
+        if self.size is not None \
+                and (not isinstance(self.size, int)
+                     or isinstance(self.size, bool) or self.size <= 0):
+            errors.append("{}.size must be a positive integer or None."
+                          .format(variable_path))
+        return errors
+
+
+class AdaptiveSamplingOption(BooleanOption):
+
+    # z-values of the supported confidence levels
+    z_values = {0.9: 1.645, 0.95: 1.96, 0.99: 2.576, 0.999: 3.291}
+
+    def __init__(self, is_enabled=True, ratio_tolerance=None,
+                 stats_tolerance=None, confidence_level=0.95,
+                 initial_sample_size=1000):
+        """
+        Options for sampling each column in rounds of growing size, until its
+        statistics converge or the sample size is reached
+
+        :ivar is_enabled: boolean option to enable/disable the option.
+        :vartype is_enabled: bool
+        :ivar ratio_tolerance: maximum margin of error of the null ratio, the
+            data type ratios and the data label ratios. Not checked if None.
+        :vartype ratio_tolerance: float
+        :ivar stats_tolerance: maximum margin of error of the mean and
+            variance of the data type, relative to their scale. Not checked if
+            None.
+        :vartype stats_tolerance: float
+        :ivar confidence_level: confidence level of the margins of error,
+            one of 0.9, 0.95, 0.99 or 0.999.
+        :vartype confidence_level: float
+        :ivar initial_sample_size: number of rows of the first round, each
+            round doubling the rows sampled.
+        :vartype initial_sample_size: int
+        """
+        self.ratio_tolerance = ratio_tolerance
+        self.stats_tolerance = stats_tolerance
+        self.confidence_level = confidence_level
+        self.initial_sample_size = initial_sample_size
+        super().__init__(is_enabled=is_enabled)
+
+    def _validate_helper(self, variable_path='AdaptiveSamplingOption'):
+        """
+        Validates the options do not conflict and cause errors.
+
+        :param variable_path: current path to variable set.
+        :type variable_path: str
+        :return: list of errors (if raise_error is false)
+        :rtype: list(str)
+        """
+        errors = super()._validate_helper(variable_path=variable_path)
+
+        for tolerance in ['ratio_tolerance', 'stats_tolerance']:
+            value = getattr(self, tolerance)
+            if value is not None \
+                    and (not isinstance(value, (int, float))
+                         or isinstance(value, bool) or value <= 0):
+                errors.append("{}.{} must be a positive number or None."
+                              .format(variable_path, tolerance))
+        if self.confidence_level not in self.z_values:
+            errors.append("{}.confidence_level must be one of the following: "
+                          "{}.".format(variable_path, list(self.z_values)))
+        if not isinstance(self.initial_sample_size, int) \
+                or isinstance(self.initial_sample_size, bool) \
+                or self.initial_sample_size <= 0:
+            errors.append("{}.initial_sample_size must be a positive integer."
+                          .format(variable_path))
+        return errors
+
+
 class BaseColumnOptions(BooleanOption):
 
     def __init__(self):
@@ -216,7 +432,8 @@ class BaseColumnOptions(BooleanOption):
         :rtype: Boolean
         """
         is_enabled = True
-        if prop not in self.properties:
+        # the properties are only copied for those which are not attributes
+        if prop not in self.__dict__ and prop not in self.properties:
             raise AttributeError("Property \"{}\" does not exist in {}."
                                  .format(prop, self.__class__.__name__))
         option_prop = getattr(self, prop)
@@ -675,8 +892,23 @@ class StructuredOptions(BaseOption):
         :vartype category: CategoricalOptions
         :ivar data_labeler: option set for data_labeler profiling.
         :vartype data_labeler: DataLabelerOptions
-        """
-        self.multiprocess = BooleanOption()
+        :ivar multiprocess: option set for multiprocessing.
+        :vartype multiprocess: MultiprocessOption
+        :ivar unique_rows: option set for unique and duplicate row statistics.
+        :vartype unique_rows: UniqueRowsOption
+        :ivar memory_budget: option set for limiting the memory used.
+        :vartype memory_budget: MemoryBudgetOption
+        :ivar reservoir: option set for sampling each column with a reservoir.
+        :vartype reservoir: ReservoirOption
+        :ivar adaptive_sampling: option set for sampling each column until its
+            statistics converge.
+        :vartype adaptive_sampling: AdaptiveSamplingOption
+        """
+        self.multiprocess = MultiprocessOption()
+        self.unique_rows = UniqueRowsOption()
+        self.memory_budget = MemoryBudgetOption()
+        self.reservoir = ReservoirOption()
+        self.adaptive_sampling = AdaptiveSamplingOption()
         self.int = IntOptions()
         self.float = FloatOptions()
         self.datetime = DateTimeOptions()
@@ -689,7 +921,7 @@ class StructuredOptions(BaseOption):
     def enabled_columns(self):
         """Returns a list of the enabled profiler columns."""
         enabled_columns = list()
-        for key, value in self.properties.items():
+        for key, value in self.__dict__.items():
             if value.is_enabled:
                 enabled_columns.append(key)
         return enabled_columns
@@ -709,7 +941,11 @@ class StructuredOptions(BaseOption):
         errors = []
 
         prop_check = dict([
-            ('multiprocess', BooleanOption),
+            ('multiprocess', MultiprocessOption),
+            ('unique_rows', UniqueRowsOption),
+            ('memory_budget', MemoryBudgetOption),
+            ('reservoir', ReservoirOption),
+            ('adaptive_sampling', AdaptiveSamplingOption),
             ('int', IntOptions),
             ('float', FloatOptions),
             ('datetime', DateTimeOptions),
@@ -0,0 +1,109 @@
+"""
+coding=utf-8
+
+Reservoir keeping a uniform random sample of a fixed size over a stream of
+values, however long the stream.
+"""
+import math
+
+from . import utils
+
+
+class Reservoir(object):
+
+    def __init__(self, size=5000):
+        """
+        Initialization of the reservoir. The values are sampled with Algorithm
+        L (Li, 1994), which draws the number of values to skip before the next
+        one sampled, rather than a random number for each value streamed.
+
+        :param size: maximum number of values sampled
+        :type size: int
+        """
+        if not isinstance(size, int) or isinstance(size, bool) or size <= 0:
+            raise ValueError("Reservoir size must be a positive integer.")
+        self.size = size
+        self.count = 0
+        self.values = []
+        self._rng = utils.get_random_number_generator()
+        # largest random key of the sampled values, the sample being the
+        # values of the smallest keys
+        self._max_key = None
+        # stream index of the next value sampled
+        self._next_index = None
+
+    def __add__(self, other):
+        """
+        Merges two reservoirs together overriding the `+` operator. The merged
+        reservoir is a uniform sample of both streams, of the smaller size of
+        the two.
+
+        :param other: reservoir being added to this one
+        :type other: Reservoir
+        :return: sample of the union of the two streams
+        :rtype: Reservoir
+        """
+        if not isinstance(other, Reservoir):
+            raise TypeError('`{}` and `{}` are not of the same sample type.'
+                            .format(type(self).__name__, type(other).__name__))
+        merged_reservoir = Reservoir(min(self.size, other.size))
+        rng = merged_reservoir._rng
+        count = self.count + other.count
+        num_values = min(merged_reservoir.size, count)
+        # values of a uniform sample of both streams coming from this one
+        num_self_values = int(rng.hypergeometric(
+            self.count, other.count, num_values)) if num_values else 0
+        merged_reservoir.values = \
+            self._sample_values(self.values, num_self_values, rng) \
+            + self._sample_values(
+                other.values, num_values - num_self_values, rng)
+        merged_reservoir.count = count
+        if num_values == merged_reservoir.size:
+            # largest of the `size` smallest keys of `count` random keys
+            merged_reservoir._max_key = rng.beta(
+                merged_reservoir.size, count - merged_reservoir.size + 1)
+            merged_reservoir._next_index = \
+                count - 1 + merged_reservoir._draw_skip()
+        return merged_reservoir
+
+    @staticmethod
+    def _sample_values(values, num_values, rng):
+        indices = rng.choice(len(values), size=num_values, replace=False)
+        return [values[i] for i in indices]
+
+    def _draw_key_factor(self):
+        return math.exp(math.log(1. - self._rng.random()) / self.size)
+
+    def _draw_skip(self):
+        skip = math.log(1. - self._rng.random()) \
+            / math.log1p(-self._max_key)
+        return int(math.floor(skip)) + 1
+
+    def update(self, values):
+        """
+        Streams values through the reservoir.
+
+        :param values: values streamed, in order
+        :type values: Union[list, numpy.ndarray]
+        :return: whether the sample changed
+        :rtype: bool
+        """
+        start = self.count
+        end = start + len(values)
+        position = 0
+        if len(self.values) < self.size:
+            position = min(self.size - len(self.values), len(values))
+            self.values.extend(values[:position])
+            if len(self.values) == self.size:
+                self._max_key = self._draw_key_factor()
+                self._next_index = start + position - 1 + self._draw_skip()
+
+        changed = position > 0
+        while self._next_index is not None and self._next_index < end:
+            self.values[self._rng.integers(self.size)] = \
+                values[self._next_index - start]
+            self._max_key *= self._draw_key_factor()
+            self._next_index += self._draw_skip()
+            changed = True
+        self.count = end
+        return changed
@@ -2,6 +2,7 @@ from .numerical_column_stats import NumericStatsMixin
 from .base_column_profilers import BaseColumnProfiler, \
     BaseColumnPrimitiveTypeProfiler
 from .profiler_options import TextOptions
+from .helpers.report_helpers import _select_keys
 from . import utils
 import itertools
 
@@ -61,21 +62,31 @@ class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
     def profile(self):
         """
         Property for profile. Returns the profile of the column.
-        
-        :return:
         """
+        return self.get_profile()
+
+    def get_profile(self, keys=None):
+        """
+        Returns the profile of the column, computing the histogram and
+        quantiles only if selected by the given keys.
 
+        :param keys: keys of the profile to select, all if None
+        :type keys: list(str)
+        :return: profile of the column
+        :rtype: dict
+        """
         profile = dict(
             min=self.min,
             max=self.max,
             mean=self.mean,
             variance=self.variance,
             stddev=self.stddev,
-            histogram=self._get_best_histogram_for_profile(),
-            quantiles=self.quantiles,
-            vocab=self.vocab,
-            times=self.times
         )
+        profile.update(self._get_histogram_profile(keys))
+        profile.update(vocab=self.vocab, times=self.times)
+
+        if keys is not None:
+            profile = _select_keys(profile, keys)
         return profile
 
     @property
@@ -129,12 +140,15 @@ class TextColumn(NumericStatsMixin, BaseColumnPrimitiveTypeProfiler):
         if self.max:
             self.col_type = 'string' if self.max <= 255 else 'text'
 
-    def update(self, df_series):
+    def update(self, df_series, typed_view=None):
         """
         Updates the column profile.
         
         :param df_series: df series
         :type df_series: pandas.core.series.Series
+        :param typed_view: values of df_series already parsed, unused as text
+            is not parsed
+        :type typed_view: utils.TypedView
         :return: None
         """
         len_df = len(df_series)
@@ -1,12 +1,22 @@
 
 import os
 import collections
+import functools
 import random
-import math
 import warnings
 import psutil
 import numpy as np
+import pandas as pd
 import multiprocessing as mp
+import multiprocessing.pool
+import concurrent.futures
+
+from .. import tracing
+
+try:
+    from multiprocessing import shared_memory, resource_tracker
+except ImportError:  # python < 3.8
+    shared_memory = None
 
 def dict_merge(dct, merge_dct):
     # Recursive dictionary merge
@@ -41,17 +51,6 @@ def dict_merge(dct, merge_dct):
             dct[k] = merge_dct[k]
 
 
-class KeyDict(collections.defaultdict):
-    """
-    Helper class for sample_in_chunks. Allows keys that are missing to become
-    the values for that key.
-    From:
-    https://www.drmaciver.com/2018/01/lazy-fisher-yates-shuffling-for-precise-rejection-sampling/
-    """
-    def __missing__(self, key):
-        return key
-
-
 def _combine_unique_sets(a, b):
     """
     Method to union two lists.
@@ -70,59 +69,97 @@ def _combine_unique_sets(a, b):
         combined_list = set().union(a,b)
     return list(combined_list)
 
-    
+
+def get_random_number_generator():
+    """
+    Creates a random number generator, seeded by the `DATAPROFILER_SEED`
+    environment variable if it is set.
+
+    :return: random number generator
+    :rtype: numpy.random.Generator
+    """
+    rng = np.random.default_rng()
+    if 'DATAPROFILER_SEED' in os.environ:
+        try:
+            seed_value = int(os.environ.get('DATAPROFILER_SEED'))
+            rng = np.random.default_rng(seed_value)
+        except ValueError as e:
+            warnings.warn("Seed should be an integer", RuntimeWarning)
+    return rng
+
+
 def shuffle_in_chunks(data_length, chunk_size):
     """
     A generator for creating shuffled indexes in chunks. This reduces the cost
     of having to create all indexes, but only of that what is needed.
-    Initial Code idea from:
-    https://www.drmaciver.com/2018/01/lazy-fisher-yates-shuffling-for-precise-rejection-sampling/
-    
+
+    While few of the indexes have been drawn, each chunk is drawn by rejecting
+    the random indexes already drawn. Once the chunks cover most of the data,
+    the remaining indexes are permuted at once.
+
     :param data_length: length of data to be shuffled
     :param chunk_size: size of shuffled chunks
-    :return: list of shuffled indices of chunk size
+    :return: array of shuffled indices of chunk size
     """
 
     if not data_length or data_length == 0 \
        or not chunk_size or chunk_size == 0:
         return []
     
-    rng = np.random.default_rng()
-    if 'DATAPROFILER_SEED' in os.environ:
-        try:
-            seed_value = int(os.environ.get('DATAPROFILER_SEED'))
-            rng = np.random.default_rng(seed_value)
-        except ValueError as e:
-            warnings.warn("Seed should be an integer", RuntimeWarning)
+    rng = get_random_number_generator()
 
-    indices = KeyDict()
-    j = 0
-    
-    # loop through all chunks
-    for chunk_ind in range(max(math.ceil(data_length / chunk_size), 1)):
+    # sorted indexes which have already been drawn
+    drawn = np.empty(0, dtype=np.int64)
+    while len(drawn) < data_length:
+        true_chunk_size = min(chunk_size, data_length - len(drawn))
 
-        # determine the chunk size and preallocate an array
-        true_chunk_size = min(chunk_size, data_length - chunk_size * chunk_ind)
-        values = [-1] * true_chunk_size
-        
-        # Generate random list of indices
-        lower_bound_list = np.array(range(j, j + true_chunk_size))
-        random_list = rng.integers(lower_bound_list, data_length)
+        # Permute all the remaining indexes once rejection becomes costly
+        if 2 * (len(drawn) + true_chunk_size) > data_length:
+            remaining = np.arange(data_length, dtype=np.int64)
+            if len(drawn):
+                remaining = np.delete(remaining, drawn)
+            rng.shuffle(remaining)
+            for ind in range(0, len(remaining), chunk_size):
+                yield remaining[ind:ind + chunk_size]
+            return
 
-        # shuffle the indexes
-        for count in range(true_chunk_size):
+        # Otherwise, draw random indexes rejecting those previously drawn
+        values = np.empty(0, dtype=np.int64)
+        while len(values) < true_chunk_size:
+            random_list = rng.integers(
+                data_length, size=2 * (true_chunk_size - len(values)))
+            _, first_ind = np.unique(random_list, return_index=True)
+            random_list = random_list[np.sort(first_ind)]
+            random_list = random_list[
+                ~np.isin(random_list, drawn, assume_unique=True)
+                & ~np.isin(random_list, values, assume_unique=True)]
+            values = np.concatenate(
+                [values, random_list[:true_chunk_size - len(values)]])
 
-            # get a random index to swap and swap it with j
-            k = random_list[count]
-            indices[j], indices[k] = indices[k], indices[j]
+        drawn = np.union1d(drawn, values)
+        yield values
 
-            # set the swapped value to the output
-            values[count] = indices[j]
 
-            # increment so as not to include values already swapped
-            j += 1
-            
-        yield values
+def get_ratio_margin_of_error(ratio, count, z_value):
+    """
+    Margin of error of a ratio observed in a sample, i.e. the half width of
+    its Wilson score interval, which unlike the normal approximation does not
+    collapse to zero when the ratio is 0 or 1.
+
+    :param ratio: ratio observed in the sample
+    :type ratio: float
+    :param count: size of the sample
+    :type count: int
+    :param z_value: z-value of the confidence level
+    :type z_value: float
+    :return: margin of error of the ratio
+    :rtype: float
+    """
+    if not count:
+        return float('inf')
+    z_squared = z_value ** 2
+    return z_value / (1 + z_squared / count) * np.sqrt(
+        ratio * (1 - ratio) / count + z_squared / (4 * count ** 2))
 
 
 def warn_on_profile(col_profile, e):
@@ -147,6 +184,67 @@ def warn_on_profile(col_profile, e):
     warnings.warn(warning_msg, RuntimeWarning, stacklevel=2)
 
 
+def _add_pair(pair):
+    """
+    Merges a pair of profiles with the `+` operator.
+
+    :param pair: profiles to merge
+    :type pair: tuple
+    :return: merged profile
+    """
+    return pair[0] + pair[1]
+
+
+def merge_in_trees(groups, executor=None):
+    """
+    Merges each group of profiles with the `+` operator as a balanced binary
+    tree of pairwise merges. The merges at a level of the trees are executed
+    together for every group, in parallel if an executor is given.
+
+    :param groups: profiles to merge in each group
+    :type groups: dict(Hashable, list)
+    :param executor: executor whose `map` executes the merges, e.g. a
+        concurrent.futures.Executor or a multiprocessing.Pool
+    :type executor: Union[concurrent.futures.Executor, multiprocessing.Pool]
+    :return: merged profile of each group
+    :rtype: dict
+    """
+    groups = collections.OrderedDict((key, list(profiles))
+                         for key, profiles in groups.items())
+    for key, profiles in groups.items():
+        if not profiles:
+            raise ValueError("No profiles to merge for {}.".format(key))
+
+    mapper = map if executor is None else executor.map
+    add_pair = _add_pair
+    if is_process_pool(executor):
+        # the spans of the merges in the workers are added to this process
+        add_pair = functools.partial(
+            tracing.run_traced, tracing.is_enabled(), _add_pair)
+    while any(len(profiles) > 1 for profiles in groups.values()):
+        pairs = []
+        pair_keys = []
+        for key, profiles in groups.items():
+            for ind in range(0, len(profiles) - 1, 2):
+                pairs.append((profiles[ind], profiles[ind + 1]))
+                pair_keys.append(key)
+
+        # merged pairs keep their order, with any unpaired profile last
+        merged_groups = collections.OrderedDict(
+            (key, []) for key in groups)
+        for key, merged_profile in zip(pair_keys, mapper(add_pair, pairs)):
+            if add_pair is not _add_pair:
+                merged_profile = tracing.collect_traced(merged_profile)
+            merged_groups[key].append(merged_profile)
+        for key, profiles in groups.items():
+            if len(profiles) % 2:
+                merged_groups[key].append(profiles[-1])
+        groups = merged_groups
+
+    return collections.OrderedDict(
+        (key, profiles[0]) for key, profiles in groups.items())
+
+
 def partition(data, chunk_size):
     """
     Creates a generator which returns the data
@@ -161,6 +259,117 @@ def partition(data, chunk_size):
         yield data[idx:idx+chunk_size]
 
 
+def estimate_row_memory(df, num_rows=1000):
+    """
+    Estimates the memory of a row of each column of the dataset in bytes,
+    from the memory of its first rows, including the contents of its objects.
+
+    :param df: a dataset
+    :type df: pandas.DataFrame
+    :param num_rows: number of rows the estimate is computed from
+    :type num_rows: int
+    :return: memory of a row of each column
+    :rtype: pandas.Series
+    """
+    first_rows = df.iloc[:num_rows]
+    return first_rows.memory_usage(index=False, deep=True) \
+        / max(len(first_rows), 1)
+
+
+# integer value of NaT, the native datetime of rows which are not one
+NAT_VALUE = np.iinfo(np.int64).min
+
+TypedView = collections.namedtuple(
+    'TypedView', ['floats', 'is_float', 'is_int', 'is_datetime_candidate',
+                  'datetimes'])
+TypedView.__doc__ = """
+Values of a column parsed once for all primitive type profilers.
+
+:ivar floats: value of each row as a float, NaN if it is not a float
+:vartype floats: numpy.ndarray
+:ivar is_float: whether each row is a float, as `float(x)` succeeds
+:vartype is_float: numpy.ndarray
+:ivar is_int: whether each row is a float with an integer value
+:vartype is_int: numpy.ndarray
+:ivar is_datetime_candidate: whether each row contains a digit, which all
+    datetime formats require, and is not a number unless of 6 to 8 digits
+:vartype is_datetime_candidate: numpy.ndarray
+:ivar datetimes: nanoseconds since the epoch of each row of a native datetime
+    column, `NAT_VALUE` for the rows of other columns
+:vartype datetimes: numpy.ndarray
+"""
+
+
+def is_native_series(df_series):
+    """
+    Determines if a column holds native int, float or datetime values, which
+    the profilers use directly rather than as strings.
+
+    :param df_series: a given column
+    :type df_series: pandas.core.series.Series
+    :return: whether the column has a native numpy dtype
+    :rtype: bool
+    """
+    return isinstance(df_series.dtype, np.dtype) \
+        and df_series.dtype.kind in 'iufM'
+
+
+def get_typed_view(df_series):
+    """
+    Parses each value of a column once into a view shared by the primitive
+    type profilers. The values are converted at once where all are floats,
+    otherwise value by value. Native columns are not parsed: their values are
+    used as is and their type is known rather than guessed, hence native
+    numbers are never datetimes and native datetimes never numbers.
+
+    :param df_series: a given column, assume df_series in str unless native
+    :type df_series: pandas.core.series.Series
+    :return: typed view of the column
+    :rtype: TypedView
+    """
+    if is_native_series(df_series):
+        is_datetime = df_series.dtype.kind == 'M'
+        if is_datetime:
+            floats = np.full(len(df_series), np.nan)
+            datetimes = df_series.to_numpy(
+                dtype='datetime64[ns]').view(np.int64)
+        else:
+            floats = df_series.to_numpy(dtype=float)
+            datetimes = np.full(len(df_series), NAT_VALUE)
+        with np.errstate(invalid='ignore'):
+            is_int = np.isfinite(floats) & (floats == np.floor(floats))
+        return TypedView(floats, np.full(len(df_series), not is_datetime),
+                         is_int, np.full(len(df_series), is_datetime),
+                         datetimes)
+
+    values = df_series.to_numpy(dtype=object)
+    try:
+        floats = values.astype(float)
+        is_float = np.ones(len(values), dtype=bool)
+    except (ValueError, TypeError):
+        floats = np.full(len(values), np.nan)
+        is_float = np.zeros(len(values), dtype=bool)
+        for ind, value in enumerate(values):
+            try:
+                floats[ind] = float(value)
+                is_float[ind] = True
+            except (ValueError, TypeError):
+                pass
+
+    with np.errstate(invalid='ignore'):
+        is_int = np.isfinite(floats) & (floats == np.floor(floats))
+    # Every datetime format requires a digit, and the only one matching a
+    # number is '%m%d%Y', i.e. 6 to 8 digits
+    strings = df_series.astype(str).str
+    is_datetime_candidate = strings.contains(
+        r'\d', regex=True).to_numpy(dtype=bool)
+    if is_float.any():
+        is_datetime_candidate &= ~is_float | strings.fullmatch(
+            r'\d{6,8}').to_numpy(dtype=bool)
+    return TypedView(floats, is_float, is_int, is_datetime_candidate,
+                     np.full(len(values), NAT_VALUE))
+
+
 def suggest_pool_size(data_size=None, cols=None):
     """
     Suggest the pool size based on resources
@@ -199,7 +408,75 @@ def suggest_pool_size(data_size=None, cols=None):
     return suggested_pool_size
 
         
-def generate_pool(max_pool_size=None, data_size=None, cols=None):
+def suggest_thread_pool_size(cols=None):
+    """
+    Suggest the thread pool size based on resources. Unlike processes, threads
+    share the memory of the dataset, hence only the CPUs are considered.
+
+    :param cols: columns of the dataset
+    :type cols: int
+    :return suggested_pool_size: suggested pool size
+    :rtype suggested_pool_size: int
+    """
+    try:
+        suggested_pool_size = psutil.cpu_count() or 1
+    except NotImplementedError:
+        suggested_pool_size = 1
+
+    if cols is not None:
+        suggested_pool_size = min(suggested_pool_size, cols)
+    return suggested_pool_size
+
+
+class AutoPool(object):
+    """
+    Pair of a process pool and a thread pool. Tasks are dispatched to either
+    pool per profiler via `select_pool`.
+    """
+
+    def __init__(self, process_pool=None, thread_pool=None):
+        """
+        :param process_pool: pool for the profilers which hold the GIL
+        :type process_pool: multiprocessing.Pool
+        :param thread_pool: pool for the profilers which release the GIL
+        :type thread_pool: multiprocessing.pool.ThreadPool
+        """
+        self.process_pool = process_pool
+        self.thread_pool = thread_pool
+
+    def close(self):
+        for pool in [self.process_pool, self.thread_pool]:
+            if pool is not None:
+                pool.close()
+
+    def join(self):
+        for pool in [self.process_pool, self.thread_pool]:
+            if pool is not None:
+                pool.join()
+
+
+def select_pool(pool, profiler=None):
+    """
+    Selects the pool a profiler's work is executed on. For an `AutoPool`,
+    profilers declaring their work releases the GIL are sent to threads, all
+    other work is sent to processes.
+
+    :param pool: pool utilized for multiprocessing
+    :type pool: Union[multiprocessing.Pool, AutoPool]
+    :param profiler: profiler to execute, None for generic work
+    :type profiler: BaseColumnProfiler
+    :return: the pool to use or None if the work should run in this process
+    :rtype: multiprocessing.Pool
+    """
+    if not isinstance(pool, AutoPool):
+        return pool
+    if getattr(profiler, 'releases_gil', False):
+        return pool.thread_pool
+    return pool.process_pool
+
+
+def generate_pool(max_pool_size=None, data_size=None, cols=None,
+                  backend='process'):
     """
     Generate a multiprocessing pool to allocate functions too
 
@@ -209,11 +486,31 @@ def generate_pool(max_pool_size=None, data_size=None, cols=None):
     :type data_size: int
     :param cols: columns of the dataset
     :type cols: int
+    :param backend: type of pool to generate, either 'process', 'thread' or
+        'auto' for both
+    :type backend: str
     :return pool: Multiprocessing pool to allocate processes to
-    :rtype pool: Multiproessing.Pool
+    :rtype pool: Union[Multiproessing.Pool, ThreadPool, AutoPool]
     :return cpu_count: Number of processes (cpu bound) to utilize
     :rtype cpu_count: int
     """
+    if backend == 'auto':
+        process_pool, process_pool_size = generate_pool(
+            max_pool_size, data_size, cols, backend='process')
+        thread_pool, thread_pool_size = generate_pool(
+            max_pool_size, data_size, cols, backend='thread')
+        if process_pool is None and thread_pool is None:
+            return None, process_pool_size
+        return AutoPool(process_pool, thread_pool), \
+            max(process_pool_size or 0, thread_pool_size or 0)
+
+    if backend == 'thread':
+        if max_pool_size is None:
+            max_pool_size = suggest_thread_pool_size(cols)
+        pool = None
+        if max_pool_size > 1:
+            pool = mp.pool.ThreadPool(max_pool_size)
+        return pool, max_pool_size
 
     suggested_pool_size = suggest_pool_size(data_size, cols)
     if max_pool_size is None or suggested_pool_size is None: 
@@ -223,6 +520,10 @@ def generate_pool(max_pool_size=None, data_size=None, cols=None):
     pool = None
     if max_pool_size is not None and max_pool_size > 2:        
         try:
+            # Workers must share the resource tracker of this process to
+            # attach to the shared memory it creates, hence start it first
+            if shared_memory is not None and os.name == 'posix':
+                resource_tracker.ensure_running()
             pool = mp.Pool(max_pool_size)
         except Exception as e:
             pool = None
@@ -233,3 +534,268 @@ def generate_pool(max_pool_size=None, data_size=None, cols=None):
             )            
 
     return pool, max_pool_size
+
+
+def is_process_pool(pool):
+    """
+    Determines if the tasks of the given pool or executor run in other
+    processes, rather than in threads of this process.
+
+    :param pool: pool utilized for multiprocessing
+    :type pool: Union[multiprocessing.Pool, concurrent.futures.Executor]
+    :return: whether the pool is a process pool
+    :rtype: bool
+    """
+    return (isinstance(pool, mp.pool.Pool)
+            and not isinstance(pool, mp.pool.ThreadPool)) \
+        or isinstance(pool, concurrent.futures.ProcessPoolExecutor)
+
+
+def apply_async(pool, function, args=()):
+    """
+    Submits a task to the given pool. On a process pool, the spans the task
+    records while tracing are sent back with its result, to be added to the
+    trace of this process by `get_async_result`.
+
+    :param pool: pool utilized for multiprocessing
+    :type pool: multiprocessing.Pool
+    :param function: function to call
+    :type function: Callable
+    :param args: arguments of the function
+    :type args: tuple
+    :return: the pending result of the task
+    :rtype: multiprocessing.pool.AsyncResult
+    """
+    if is_process_pool(pool):
+        return pool.apply_async(
+            tracing.run_traced,
+            (tracing.is_enabled(), function) + tuple(args))
+    return pool.apply_async(function, args)
+
+
+def get_async_result(pool, async_result):
+    """
+    Waits for the result of a task submitted with `apply_async`, adding the
+    spans it recorded in a worker process to the trace of this process.
+
+    :param pool: pool the task was submitted to
+    :type pool: multiprocessing.Pool
+    :param async_result: the pending result of the task
+    :type async_result: multiprocessing.pool.AsyncResult
+    :return: the result of the task
+    :rtype: Any
+    """
+    result = async_result.get()
+    if is_process_pool(pool):
+        result = tracing.collect_traced(result)
+    return result
+
+
+def can_share_memory(pool):
+    """
+    Determines if data can be handed off to the workers of the given pool via
+    shared memory, i.e. the pool is a process pool and shared memory is
+    supported by the python version. Pools must be created after the
+    resource tracker is running, as is done by `generate_pool`.
+
+    :param pool: pool utilized for multiprocessing
+    :type pool: multiprocessing.Pool
+    :return: whether shared memory can be utilized with the pool
+    :rtype: bool
+    """
+    return shared_memory is not None \
+        and isinstance(pool, mp.pool.Pool) and is_process_pool(pool)
+
+
+def share_array(array):
+    """
+    Copies a numpy array once into shared memory such that worker processes
+    can attach to it by name instead of receiving a pickled copy.
+
+    :param array: array to share, must not be of object dtype
+    :type array: numpy.ndarray
+    :return: shared memory block holding the array and the descriptor used
+        to attach to it
+    :rtype: tuple(SharedMemory, tuple)
+    """
+    array = np.ascontiguousarray(array)
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    shared_array = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    shared_array[...] = array
+    del shared_array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def attach_array(descriptor):
+    """
+    Attaches to an array previously shared via `share_array` without copying.
+
+    :param descriptor: descriptor returned by `share_array`
+    :type descriptor: tuple
+    :return: attached shared memory block and the array view into it
+    :rtype: tuple(SharedMemory, numpy.ndarray)
+    """
+    name, shape, dtype = descriptor
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def share_series(df_series):
+    """
+    Copies a series once into shared memory such that worker processes can
+    attach to it by name instead of receiving a pickled copy. Only series of
+    fixed-width numpy dtypes are shared, as their values are attached without
+    copying. Series which cannot be shared (e.g. strings, objects or a
+    non-numeric index) return no descriptor, in which case the caller should
+    fall back to pickling the series.
+
+    :param df_series: series to share
+    :type df_series: pandas.core.series.Series
+    :return: shared memory blocks created and the descriptor of the series
+    :rtype: tuple(list(SharedMemory), dict)
+    """
+    if shared_memory is None:
+        return [], None
+
+    index = df_series.index
+    if not isinstance(index, pd.RangeIndex) and index.dtype.kind not in 'iu':
+        return [], None
+
+    values = df_series.values
+    if not isinstance(values, np.ndarray) or values.dtype.kind not in 'biufmM':
+        return [], None
+
+    shared_blocks = []
+    try:
+        if isinstance(index, pd.RangeIndex):
+            index_desc = ('range', index.start, index.stop, index.step)
+        else:
+            shm, index_desc = share_array(index.values)
+            shared_blocks.append(shm)
+            index_desc = ('numpy', index_desc)
+
+        shm, values_desc = share_array(values)
+        shared_blocks.append(shm)
+    except Exception:
+        release_shared_memory(shared_blocks, unlink=True)
+        return [], None
+
+    return shared_blocks, dict(name=df_series.name, index=index_desc,
+                               values=values_desc)
+
+
+def attach_series(descriptor):
+    """
+    Attaches to a series previously shared via `share_series` without copying.
+
+    :param descriptor: descriptor returned by `share_series`
+    :type descriptor: dict
+    :return: attached shared memory blocks and the series
+    :rtype: tuple(list(SharedMemory), pandas.core.series.Series)
+    """
+    shared_blocks = []
+
+    index_desc = descriptor['index']
+    if index_desc[0] == 'range':
+        index = pd.RangeIndex(*index_desc[1:])
+    else:
+        shm, index = attach_array(index_desc[1])
+        shared_blocks.append(shm)
+
+    shm, values = attach_array(descriptor['values'])
+    shared_blocks.append(shm)
+
+    return shared_blocks, pd.Series(values, index=index,
+                                    name=descriptor['name'], copy=False)
+
+
+SharedArg = collections.namedtuple('SharedArg', ['kind', 'descriptor'])
+SharedArg.__doc__ = """
+Descriptor of an argument of a worker task published to shared memory.
+
+:ivar kind: kind of the argument, either 'series' or 'typed_view'
+:vartype kind: str
+:ivar descriptor: descriptor the argument is attached with
+:vartype descriptor: Union[dict, tuple]
+"""
+
+
+def share_args(args):
+    """
+    Copies the arguments of worker tasks which hold fixed-width arrays, i.e.
+    numeric series and typed views, once into shared memory. The other
+    arguments, e.g. string series, are left as is to be pickled.
+
+    :param args: arguments of the tasks
+    :type args: tuple
+    :return: shared memory blocks created and the arguments, with those shared
+        replaced by their `SharedArg`
+    :rtype: tuple(list(SharedMemory), tuple)
+    """
+    shared_blocks, shared_args = [], []
+    try:
+        for arg in args:
+            if isinstance(arg, pd.Series):
+                blocks, descriptor = share_series(arg)
+                if descriptor is not None:
+                    arg = SharedArg('series', descriptor)
+            elif isinstance(arg, TypedView) and shared_memory is not None:
+                blocks, descriptor = [], []
+                for array in arg:
+                    shm, array_desc = share_array(array)
+                    blocks.append(shm)
+                    descriptor.append(array_desc)
+                arg = SharedArg('typed_view', tuple(descriptor))
+            else:
+                blocks = []
+            shared_blocks.extend(blocks)
+            shared_args.append(arg)
+    except Exception:
+        release_shared_memory(shared_blocks, unlink=True)
+        return [], tuple(args)
+    return shared_blocks, tuple(shared_args)
+
+
+def attach_args(args):
+    """
+    Attaches to the arguments previously shared via `share_args`.
+
+    :param args: arguments returned by `share_args`
+    :type args: tuple
+    :return: attached shared memory blocks and the arguments
+    :rtype: tuple(list(SharedMemory), tuple)
+    """
+    shared_blocks, attached_args = [], []
+    for arg in args:
+        if isinstance(arg, SharedArg) and arg.kind == 'series':
+            blocks, arg = attach_series(arg.descriptor)
+            shared_blocks.extend(blocks)
+        elif isinstance(arg, SharedArg) and arg.kind == 'typed_view':
+            arrays = []
+            for array_desc in arg.descriptor:
+                shm, array = attach_array(array_desc)
+                shared_blocks.append(shm)
+                arrays.append(array)
+            arg = TypedView._make(arrays)
+        attached_args.append(arg)
+    return shared_blocks, tuple(attached_args)
+
+
+def release_shared_memory(shared_blocks, unlink=False):
+    """
+    Closes the given shared memory blocks and optionally unlinks them, which
+    should only be done by the process which created them.
+
+    :param shared_blocks: shared memory blocks to release
+    :type shared_blocks: list(SharedMemory)
+    :param unlink: whether to also destroy the underlying memory
+    :type unlink: bool
+    :return: None
+    """
+    for shm in shared_blocks:
+        try:
+            shm.close()
+        except BufferError:
+            pass  # views still exported, unmapped when garbage collected
+        if unlink:
+            shm.unlink()
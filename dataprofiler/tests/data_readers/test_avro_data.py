@@ -109,6 +109,18 @@ class TestAVRODataClass(unittest.TestCase):
         schema_avro = AVROData._get_schema_avro(nested_keys, schema_avro)
         self.assertIsNotNone(schema_avro)
 
+    def test_select_columns(self):
+        """
+        Validate only the selected keys are kept from the file.
+        """
+        input_file = os.path.join(test_root_path, 'data',
+                                  'avro/userdata1.avro')
+        data = Data(input_file)
+        data.select_columns(['first_name', 'salary'])
+        self.assertEqual(['first_name', 'salary'], list(data.data.columns))
+        self.assertEqual({'first_name', 'salary'}, set(data._data[0]))
+        self.assertEqual(1000, len(data))
+
     def test_len_data(self):
         """
         Validate that length called on JSONData is appropriately determining the
@@ -355,6 +355,58 @@ class TestCSVDataClass(unittest.TestCase):
                              data.length,
                              msg=input_file['path'])
 
+    def test_get_chunk_generator(self):
+        """
+        Validate the chunks read from the file match the fully loaded data
+        without loading the data into memory.
+        """
+        input_file = os.path.join(test_root_path, 'data', 'csv/iris.csv')
+        data = Data(input_file)
+        chunks = list(data.get_chunk_generator(chunk_size=40))
+        self.assertIsNone(data._data)
+        self.assertEqual([40, 40, 40, 30], [len(chunk) for chunk in chunks])
+
+        # chunks read from the file match the loaded data
+        pd.testing.assert_frame_equal(data.data, pd.concat(chunks))
+
+        # chunks are split from the data once loaded
+        chunks = list(data.get_chunk_generator(chunk_size=100))
+        self.assertEqual([100, 50], [len(chunk) for chunk in chunks])
+        pd.testing.assert_frame_equal(data.data, pd.concat(chunks))
+
+    def test_select_columns(self):
+        """
+        Validate only the selected columns are read from the file.
+        """
+        input_file = os.path.join(test_root_path, 'data', 'csv/iris.csv')
+        data = Data(input_file)
+        data.select_columns(['Species', 'Id'])
+        self.assertEqual(['Species', 'Id'], data.selected_columns)
+        chunk = next(data.get_chunk_generator(chunk_size=40))
+        self.assertEqual(['Id', 'Species'], list(chunk.columns))
+        self.assertEqual(['Id', 'Species'], list(data.data.columns))
+        self.assertEqual(150, len(data))
+
+    def test_project_columns(self):
+        """
+        Validate the projection reads the selected columns while the original
+        data keeps reading every column.
+        """
+        input_file = os.path.join(test_root_path, 'data', 'csv/iris.csv')
+        data = Data(input_file)
+        data.data_format = 'records'
+        projection = data.project_columns(['Species'])
+        self.assertEqual(['Species'], projection.selected_columns)
+        self.assertEqual([], data.selected_columns)
+
+        # each converts its own data to the selected format
+        projection_records = projection.data
+        self.assertEqual(['Species'], list(projection._data.columns))
+        self.assertIsNone(data._data)
+        data_records = data.data
+        self.assertEqual(6, len(data._data.columns))
+        self.assertNotEqual(data_records, projection_records)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -53,6 +53,26 @@ class TestDataReadingWriting(unittest.TestCase):
                                           content.decode(detected_encoding))
                 self.assertGreaterEqual(match_acc, .999)
         
+    def test_select_json_keys(self):
+        """
+        Tests only the keys which are, or hold, selected flattened keys are
+        kept from a JSON object.
+        """
+        json_obj = {'a': 1, 'b': {'c': 2, 'd': {'e': 3}}, 'f': {'g': 4}}
+        self.assertEqual(
+            {'a': 1, 'b': {'d': {'e': 3}}},
+            data_utils.select_json_keys(json_obj, ['a', 'b.d.e']))
+        self.assertEqual(
+            {'b': {'c': 2, 'd': {'e': 3}}},
+            data_utils.select_json_keys(json_obj, ['b']))
+        self.assertEqual({}, data_utils.select_json_keys(json_obj, ['x.y']))
+
+        df, original_df_dtypes = data_utils.json_to_dataframe(
+            [json_obj, json_obj], selected_columns=['b.d.e', 'a'])
+        self.assertEqual(['b.d.e', 'a'], list(df.columns))
+        self.assertEqual(['3', '3'], list(df['b.d.e']))
+        self.assertEqual(['b.d.e', 'a'], list(original_df_dtypes.index))
+
     def test_nth_loc_detection(self):
         """
         Tests the ability for the `data_utils.find_nth_location` to detect the
@@ -188,6 +188,15 @@ class TestJSONDataClass(unittest.TestCase):
         self.assertEqual(6, len(simple.data.columns))
         self.assertEqual(150, len(simple.data))
         
+    def test_select_columns(self):
+        test_dir = os.path.join(test_root_path, 'data')
+        input_file_name = os.path.join(test_dir, 'json/iris-utf-8.json')
+
+        data = Data(input_file_name)
+        data.select_columns(['Species', 'Id'])
+        self.assertEqual(['Species', 'Id'], list(data.data.columns))
+        self.assertEqual(150, len(data.data))
+
     def test_flattened_dataframe_format(self):
         test_dir = os.path.join(test_root_path, 'data')
         input_file_name = os.path.join(test_dir, 'json/math.json')
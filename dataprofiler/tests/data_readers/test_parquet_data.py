@@ -125,3 +125,50 @@ class TestParquetDataClass(unittest.TestCase):
             self.assertEqual(input_file['count'],
                              data.length,
                              msg=input_file['path'])
+
+    def test_get_chunk_generator(self):
+        """
+        Validate the chunks read from the file match the fully loaded data.
+        """
+        import pandas as pd
+
+        test_file = os.path.join(test_root_path, 'data', 'parquet',
+                                 'iris.parq')
+        data = Data(test_file)
+        chunks = list(data.get_chunk_generator(chunk_size=40))
+        self.assertIsNone(data._data)
+        self.assertTrue(all(len(chunk) <= 40 for chunk in chunks))
+        pd.testing.assert_frame_equal(
+            data.data.reset_index(drop=True),
+            pd.concat(chunks).reset_index(drop=True))
+
+    def test_select_columns(self):
+        """
+        Validate only the selected columns are read from the file.
+        """
+        test_file = os.path.join(test_root_path, 'data', 'parquet',
+                                 'iris.parq')
+        data = Data(test_file)
+        data.select_columns(['Name', 'SepalLength'])
+        chunk = next(data.get_chunk_generator(chunk_size=40))
+        self.assertEqual(['Name', 'SepalLength'], list(chunk.columns))
+        self.assertEqual(['Name', 'SepalLength'], list(data.data.columns))
+        self.assertEqual(150, len(data))
+
+    def test_native_dtypes(self):
+        """
+        Validate columns keep their native dtypes if requested.
+        """
+        test_file = os.path.join(test_root_path, 'data', 'parquet',
+                                 'iris.parq')
+        data = Data(test_file)
+        self.assertEqual(object, data.data['SepalLength'].dtype)
+
+        options = dict(native_dtypes=True)
+        data = ParquetData(test_file, options=options)
+        self.assertEqual('float64', data.data['SepalLength'].dtype)
+        self.assertEqual(object, data.data['Name'].dtype)
+
+        data = ParquetData(test_file, options=options)
+        chunk = next(data.get_chunk_generator(chunk_size=40))
+        self.assertEqual('float64', chunk['SepalLength'].dtype)
@@ -50,6 +50,18 @@ class TestTextDataClass(unittest.TestCase):
             input_data_obj.reload(input_file['path'])
             self.assertEqual(input_data_obj.data_type, 'text', input_file['path'])
 
+    def test_select_columns(self):
+        """
+        Determine if text files, which have no columns to push the selection
+        down to, are read whole
+        """
+        input_data_obj = Data(self.input_file_names[5]['path'])
+        input_data_obj.select_columns(['text'])
+        self.assertEqual(1, len(input_data_obj.data))
+        with self.assertRaisesRegex(ValueError, "`columns` must be a list of "
+                                                "columns."):
+            input_data_obj.select_columns('text')
+
 
 if __name__ == '__main__':
     unittest.main()
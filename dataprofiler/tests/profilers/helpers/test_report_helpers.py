@@ -3,7 +3,8 @@ import unittest
 import numpy as np
 import json
 
-from dataprofiler.profilers.helpers.report_helpers import _prepare_report
+from dataprofiler.profilers.helpers.report_helpers import _prepare_report, \
+    _select_keys
 
 
 class TestReportHelperClass(unittest.TestCase):
@@ -178,7 +179,31 @@ class TestReportHelperClass(unittest.TestCase):
 
         prepared_report = _prepare_report(report, output_format, omit_keys)
         self.assertDictEqual(prepared_report, wild_report3)
-        
-            
+
+    def test_select_keys_in_report(self):
+        report = {
+            "test0": 0,
+            "test1": {
+                "test2": 2,
+                "test3": {"test4": 4},
+            },
+            "test5": {
+                "test2": 2,
+                "test6": 6,
+            },
+        }
+        self.assertEqual({"test0": 0}, _select_keys(report, ["test0"]))
+        self.assertEqual({"test1": {"test3": {"test4": 4}}},
+                         _select_keys(report, ["test1.test3"]))
+        self.assertEqual({"test1": {"test2": 2}, "test5": {"test2": 2}},
+                         _select_keys(report, ["*.test2"]))
+        self.assertEqual({"test0": 0, "test5": {"test6": 6}},
+                         _select_keys(report, ["test0", "test5.test6"]))
+
+        # keys nested below values which are not dicts are not selected
+        self.assertEqual({}, _select_keys(report, ["test0.test1"]))
+        self.assertEqual({}, _select_keys(report, ["missing"]))
+
+
 if __name__ == '__main__':
     unittest.main()
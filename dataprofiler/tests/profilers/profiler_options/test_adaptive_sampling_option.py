@@ -0,0 +1,84 @@
+from dataprofiler.profilers.profiler_options import AdaptiveSamplingOption
+
+from .test_boolean_option import TestBooleanOption
+
+
+class TestAdaptiveSamplingOption(TestBooleanOption):
+
+    option_class = AdaptiveSamplingOption
+    keys = []
+
+    def test_init(self):
+        option = self.get_options()
+        self.assertTrue(option.is_enabled)
+        self.assertIsNone(option.ratio_tolerance)
+        self.assertIsNone(option.stats_tolerance)
+        self.assertEqual(0.95, option.confidence_level)
+        self.assertEqual(1000, option.initial_sample_size)
+
+    def test_set_helper(self):
+        option = self.get_options()
+
+        # validate, variable path being passed
+        expected_error = ("type object 'test.ratio_tolerance' has no "
+                          "attribute 'is_enabled'")
+        with self.assertRaisesRegex(AttributeError, expected_error):
+            option._set_helper({'ratio_tolerance.is_enabled': True}, 'test')
+
+    def test_set(self):
+        option = self.get_options()
+
+        option.set({'ratio_tolerance': 0.01, 'stats_tolerance': 0.05,
+                    'confidence_level': 0.99, 'initial_sample_size': 500})
+        self.assertEqual(0.01, option.ratio_tolerance)
+        self.assertEqual(0.05, option.stats_tolerance)
+        self.assertEqual(0.99, option.confidence_level)
+        self.assertEqual(500, option.initial_sample_size)
+
+        # Treat confidence_level as a BooleanOption
+        expected_error = ("type object 'confidence_level' has no attribute "
+                          "'is_enabled'")
+        with self.assertRaisesRegex(AttributeError, expected_error):
+            option.set({'confidence_level.is_enabled': True})
+
+    def test_validate_helper(self):
+        super(TestAdaptiveSamplingOption, self).test_validate_helper()
+
+    def test_validate(self):
+        super(TestAdaptiveSamplingOption, self).test_validate()
+
+        # Default configuration is valid
+        option = self.get_options()
+        self.assertIsNone(option.validate(raise_error=False))
+
+        option.set({'ratio_tolerance': 0.01, 'stats_tolerance': 1})
+        self.assertIsNone(option.validate(raise_error=False))
+
+        for tolerance in ['ratio_tolerance', 'stats_tolerance']:
+            expected_error = ("AdaptiveSamplingOption.{} must be a positive "
+                              "number or None.".format(tolerance))
+            for value in [0, -0.1, '0.1', True]:
+                option = self.get_options(**{tolerance: value})
+                self.assertListEqual([expected_error],
+                                     option.validate(raise_error=False))
+
+        option = self.get_options(confidence_level=0.5)
+        self.assertListEqual(
+            ["AdaptiveSamplingOption.confidence_level must be one of the "
+             "following: [0.9, 0.95, 0.99, 0.999]."],
+            option.validate(raise_error=False))
+
+        expected_error = ("AdaptiveSamplingOption.initial_sample_size must be "
+                          "a positive integer.")
+        for value in [0, -1, 1.5, None]:
+            option = self.get_options(initial_sample_size=value)
+            self.assertListEqual([expected_error],
+                                 option.validate(raise_error=False))
+
+        # this time testing raising an error
+        option = self.get_options(initial_sample_size=0)
+        with self.assertRaisesRegex(ValueError,
+                                    r"AdaptiveSamplingOption."
+                                    r"initial_sample_size must be a positive "
+                                    r"integer."):
+            option.validate()
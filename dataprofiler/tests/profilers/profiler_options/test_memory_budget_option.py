@@ -0,0 +1,62 @@
+from dataprofiler.profilers.profiler_options import MemoryBudgetOption
+
+from .test_boolean_option import TestBooleanOption
+
+
+class TestMemoryBudgetOption(TestBooleanOption):
+
+    option_class = MemoryBudgetOption
+    keys = []
+
+    def test_init(self):
+        option = self.get_options()
+        self.assertTrue(option.is_enabled)
+        self.assertIsNone(option.max_memory_bytes)
+
+    def test_set_helper(self):
+        option = self.get_options()
+
+        # validate, variable path being passed
+        expected_error = ("type object 'test.max_memory_bytes' has no "
+                          "attribute 'is_enabled'")
+        with self.assertRaisesRegex(AttributeError, expected_error):
+            option._set_helper({'max_memory_bytes.is_enabled': True}, 'test')
+
+    def test_set(self):
+        option = self.get_options()
+
+        option.set({'max_memory_bytes': 2 ** 30})
+        self.assertEqual(2 ** 30, option.max_memory_bytes)
+
+        # Treat max_memory_bytes as a BooleanOption
+        expected_error = ("type object 'max_memory_bytes' has no attribute "
+                          "'is_enabled'")
+        with self.assertRaisesRegex(AttributeError, expected_error):
+            option.set({'max_memory_bytes.is_enabled': True})
+
+    def test_validate_helper(self):
+        super(TestMemoryBudgetOption, self).test_validate_helper()
+
+    def test_validate(self):
+        super(TestMemoryBudgetOption, self).test_validate()
+
+        # Default configuration is valid
+        option = self.get_options()
+        self.assertIsNone(option.validate(raise_error=False))
+
+        option.max_memory_bytes = 1
+        self.assertIsNone(option.validate(raise_error=False))
+
+        expected_error = ("MemoryBudgetOption.max_memory_bytes must be a "
+                          "positive integer or None.")
+        for value in [0, -1, 1.5, '1', True]:
+            option.max_memory_bytes = value
+            self.assertListEqual([expected_error],
+                                 option.validate(raise_error=False))
+
+        # this time testing raising an error
+        option.max_memory_bytes = 0
+        with self.assertRaisesRegex(ValueError,
+                                    r"MemoryBudgetOption.max_memory_bytes "
+                                    r"must be a positive integer"):
+            option.validate()
@@ -0,0 +1,64 @@
+from dataprofiler.profilers.profiler_options import MultiprocessOption
+
+from .test_boolean_option import TestBooleanOption
+
+
+class TestMultiprocessOption(TestBooleanOption):
+
+    option_class = MultiprocessOption
+    keys = []
+
+    def test_init(self):
+        option = self.get_options()
+        self.assertTrue(option.is_enabled)
+        self.assertEqual(option.backend, 'process')
+
+    def test_set_helper(self):
+        option = self.get_options()
+
+        # validate, variable path being passed
+        expected_error = ("type object 'test.backend' has no attribute "
+                          "'is_enabled'")
+        with self.assertRaisesRegex(AttributeError, expected_error):
+            option._set_helper({'backend.is_enabled': True}, 'test')
+
+    def test_set(self):
+        option = self.get_options()
+
+        for value in ['process', 'thread', 'auto']:
+            option.set({'backend': value})
+            self.assertEqual(value, option.backend)
+
+        # Treat backend as a BooleanOption
+        expected_error = ("type object 'backend' has no attribute "
+                          "'is_enabled'")
+        with self.assertRaisesRegex(AttributeError, expected_error):
+            option.set({'backend.is_enabled': True})
+
+    def test_validate_helper(self):
+        super(TestMultiprocessOption, self).test_validate_helper()
+
+    def test_validate(self):
+        super(TestMultiprocessOption, self).test_validate()
+
+        # Default configuration is valid
+        option = self.get_options()
+        self.assertIsNone(option.validate(raise_error=False))
+
+        for value in ['process', 'thread', 'auto']:
+            option.backend = value
+            self.assertIsNone(option.validate(raise_error=False))
+
+        expected_error = ("MultiprocessOption.backend must be one of the "
+                          "following: ['process', 'thread', 'auto'].")
+        for value in ['threads', None, 1]:
+            option.backend = value
+            self.assertListEqual([expected_error],
+                                 option.validate(raise_error=False))
+
+        # this time testing raising an error
+        option.backend = 'fake backend'
+        with self.assertRaisesRegex(ValueError,
+                                    r"MultiprocessOption.backend must be one "
+                                    r"of the following"):
+            option.validate()
@@ -0,0 +1,61 @@
+from dataprofiler.profilers.profiler_options import ReservoirOption
+
+from .test_boolean_option import TestBooleanOption
+
+
+class TestReservoirOption(TestBooleanOption):
+
+    option_class = ReservoirOption
+    keys = []
+
+    def test_init(self):
+        option = self.get_options()
+        self.assertTrue(option.is_enabled)
+        self.assertIsNone(option.size)
+
+    def test_set_helper(self):
+        option = self.get_options()
+
+        # validate, variable path being passed
+        expected_error = ("type object 'test.size' has no attribute "
+                          "'is_enabled'")
+        with self.assertRaisesRegex(AttributeError, expected_error):
+            option._set_helper({'size.is_enabled': True}, 'test')
+
+    def test_set(self):
+        option = self.get_options()
+
+        option.set({'size': 100})
+        self.assertEqual(100, option.size)
+
+        # Treat size as a BooleanOption
+        expected_error = "type object 'size' has no attribute 'is_enabled'"
+        with self.assertRaisesRegex(AttributeError, expected_error):
+            option.set({'size.is_enabled': True})
+
+    def test_validate_helper(self):
+        super(TestReservoirOption, self).test_validate_helper()
+
+    def test_validate(self):
+        super(TestReservoirOption, self).test_validate()
+
+        # Default configuration is valid
+        option = self.get_options()
+        self.assertIsNone(option.validate(raise_error=False))
+
+        option.size = 1
+        self.assertIsNone(option.validate(raise_error=False))
+
+        expected_error = ("ReservoirOption.size must be a positive integer or "
+                          "None.")
+        for value in [0, -1, 1.5, '1', True]:
+            option.size = value
+            self.assertListEqual([expected_error],
+                                 option.validate(raise_error=False))
+
+        # this time testing raising an error
+        option.size = 0
+        with self.assertRaisesRegex(ValueError,
+                                    r"ReservoirOption.size must be a positive "
+                                    r"integer."):
+            option.validate()
@@ -7,7 +7,8 @@ class TestStructuredOptions(TestBaseOption):
     
     option_class = StructuredOptions
     keys = ["int", "float", "datetime", "text", "order", "category",
-            "data_labeler", "multiprocess"]
+            "data_labeler", "multiprocess", "unique_rows", "memory_budget",
+            "reservoir", "adaptive_sampling"]
 
     @classmethod
     def get_options(self, **params):
@@ -94,6 +95,10 @@ class TestStructuredOptions(TestBaseOption):
         option.category = StructuredOptions()
         option.data_labeler = StructuredOptions()
         option.multiprocess = StructuredOptions()
+        option.unique_rows = StructuredOptions()
+        option.memory_budget = StructuredOptions()
+        option.reservoir = StructuredOptions()
+        option.adaptive_sampling = StructuredOptions()
 
         expected_error = set()
         for key in self.keys:
@@ -102,8 +107,20 @@ class TestStructuredOptions(TestBaseOption):
             elif key == "category": ckey = "Categorical"
             elif key == "datetime": ckey = "DateTime"
             if key == "multiprocess":
-                expected_error.add('{}.{} must be a(n) BooleanOption.' \
+                expected_error.add('{}.{} must be a(n) MultiprocessOption.' \
                                    .format(optpth, key, ckey))
+            elif key == "unique_rows":
+                expected_error.add('{}.{} must be a(n) UniqueRowsOption.' \
+                                   .format(optpth, key))
+            elif key == "memory_budget":
+                expected_error.add('{}.{} must be a(n) MemoryBudgetOption.' \
+                                   .format(optpth, key))
+            elif key == "reservoir":
+                expected_error.add('{}.{} must be a(n) ReservoirOption.' \
+                                   .format(optpth, key))
+            elif key == "adaptive_sampling":
+                expected_error.add('{}.{} must be a(n) AdaptiveSamplingOption.' \
+                                   .format(optpth, key))
             else:
                 expected_error.add('{}.{} must be a(n) {}Options.' \
                                    .format(optpth, key, ckey))
@@ -147,6 +164,10 @@ class TestStructuredOptions(TestBaseOption):
         option.category = StructuredOptions()
         option.data_labeler = StructuredOptions()
         option.multiprocess = StructuredOptions()
+        option.unique_rows = StructuredOptions()
+        option.memory_budget = StructuredOptions()
+        option.reservoir = StructuredOptions()
+        option.adaptive_sampling = StructuredOptions()
 
         expected_error = set()
         for key in self.keys:
@@ -155,8 +176,20 @@ class TestStructuredOptions(TestBaseOption):
             elif key == "category": ckey = "Categorical"
             elif key == "datetime": ckey = "DateTime"
             if key == "multiprocess":
-                expected_error.add('{}.{} must be a(n) BooleanOption.' \
+                expected_error.add('{}.{} must be a(n) MultiprocessOption.' \
                                    .format(optpth, key, ckey))
+            elif key == "unique_rows":
+                expected_error.add('{}.{} must be a(n) UniqueRowsOption.' \
+                                   .format(optpth, key))
+            elif key == "memory_budget":
+                expected_error.add('{}.{} must be a(n) MemoryBudgetOption.' \
+                                   .format(optpth, key))
+            elif key == "reservoir":
+                expected_error.add('{}.{} must be a(n) ReservoirOption.' \
+                                   .format(optpth, key))
+            elif key == "adaptive_sampling":
+                expected_error.add('{}.{} must be a(n) AdaptiveSamplingOption.' \
+                                   .format(optpth, key))
             else:
                 expected_error.add('{}.{} must be a(n) {}Options.' \
                                    .format(optpth, key, ckey))
@@ -0,0 +1,74 @@
+from dataprofiler.profilers.profiler_options import UniqueRowsOption
+
+from .test_boolean_option import TestBooleanOption
+
+
+class TestUniqueRowsOption(TestBooleanOption):
+
+    option_class = UniqueRowsOption
+    keys = []
+
+    def test_init(self):
+        option = self.get_options()
+        self.assertTrue(option.is_enabled)
+        self.assertEqual(option.method, 'exact')
+        self.assertEqual(option.precision, 14)
+
+    def test_set_helper(self):
+        option = self.get_options()
+
+        # validate, variable path being passed
+        expected_error = ("type object 'test.method' has no attribute "
+                          "'is_enabled'")
+        with self.assertRaisesRegex(AttributeError, expected_error):
+            option._set_helper({'method.is_enabled': True}, 'test')
+
+    def test_set(self):
+        option = self.get_options()
+
+        option.set({'method': 'hll', 'precision': 10})
+        self.assertEqual('hll', option.method)
+        self.assertEqual(10, option.precision)
+
+        # Treat precision as a BooleanOption
+        expected_error = ("type object 'precision' has no attribute "
+                          "'is_enabled'")
+        with self.assertRaisesRegex(AttributeError, expected_error):
+            option.set({'precision.is_enabled': True})
+
+    def test_validate_helper(self):
+        super(TestUniqueRowsOption, self).test_validate_helper()
+
+    def test_validate(self):
+        super(TestUniqueRowsOption, self).test_validate()
+
+        # Default configuration is valid
+        option = self.get_options()
+        self.assertIsNone(option.validate(raise_error=False))
+
+        option.set({'method': 'hll', 'precision': 4})
+        self.assertIsNone(option.validate(raise_error=False))
+        option.precision = 18
+        self.assertIsNone(option.validate(raise_error=False))
+
+        expected_error = ("UniqueRowsOption.method must be one of the "
+                          "following: ['exact', 'hll'].")
+        for value in ['hyperloglog', None, 1]:
+            option.method = value
+            self.assertListEqual([expected_error],
+                                 option.validate(raise_error=False))
+
+        option.method = 'hll'
+        expected_error = ("UniqueRowsOption.precision must be an integer from "
+                          "4 to 18.")
+        for value in [3, 19, 14.0, '14', True]:
+            option.precision = value
+            self.assertListEqual([expected_error],
+                                 option.validate(raise_error=False))
+
+        # this time testing raising an error
+        option.precision = None
+        with self.assertRaisesRegex(ValueError,
+                                    r"UniqueRowsOption.precision must be an "
+                                    r"integer"):
+            option.validate()
@@ -44,7 +44,7 @@ class TestBaseColumnProfileClass(unittest.TestCase):
 
         # Array is popped twice per _timeit call start_time and end_time respectively
         time_array = [float(i) for i in range(10, -1, -1)]
-        with patch('time.time', side_effect=lambda: time_array.pop()):
+        with patch('time.perf_counter', side_effect=lambda: time_array.pop()):
             # add one entry to profile1.times
             test_time(profile1)
 
@@ -118,7 +118,7 @@ class TestBaseColumnProfileClass(unittest.TestCase):
 
         # Array is popped twice per _timeit call start_time and end_time respectively
         time_array = [12.0, 10.0, 9.0, 6.0, 5.0, 3.0, 2.0, 1.0]
-        with patch('time.time', side_effect=lambda: time_array.pop()):
+        with patch('time.perf_counter', side_effect=lambda: time_array.pop()):
             # key and value populated correctly
             test_time(profile1)
             expected = {"test_time": 1.0}
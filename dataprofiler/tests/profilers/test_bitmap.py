@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from dataprofiler.profilers.bitmap import RoaringBitmap, to_row_index
+
+
+class TestRoaringBitmap(unittest.TestCase):
+
+    def test_init(self):
+        bitmap = RoaringBitmap([5, 70000, 1, 5])
+        self.assertEqual(3, len(bitmap))
+        self.assertListEqual([1, 5, 70000], list(bitmap))
+        self.assertEqual({1, 5, 70000}, bitmap)
+        self.assertEqual(0, len(RoaringBitmap()))
+
+        with self.assertRaisesRegex(ValueError, "RoaringBitmap only stores "
+                                                "non-negative integer"):
+            RoaringBitmap([-1, 2])
+        with self.assertRaisesRegex(ValueError, "RoaringBitmap only stores "
+                                                "non-negative integer"):
+            RoaringBitmap(['a'])
+
+    def test_dense_containers(self):
+        # containers past the array size are stored as bitsets
+        values = np.arange(0, 20000, 2)
+        bitmap = RoaringBitmap(values)
+        self.assertEqual(np.uint8, bitmap._containers[0].dtype)
+        self.assertEqual(10000, len(bitmap))
+        np.testing.assert_array_equal(values, bitmap.to_array())
+        self.assertIn(19998, bitmap)
+        self.assertNotIn(19999, bitmap)
+        self.assertNotIn(-2, bitmap)
+
+        # intersection back to a sparse container becomes an array
+        intersected = bitmap & RoaringBitmap(np.arange(0, 20000, 3))
+        self.assertEqual(np.uint16, intersected._containers[0].dtype)
+        np.testing.assert_array_equal(np.arange(0, 20000, 6),
+                                      intersected.to_array())
+
+    def test_set_operations(self):
+        rng = np.random.default_rng(0)
+        for size in [10, 1000, 50000]:
+            values1 = rng.integers(0, 300000, size)
+            values2 = rng.integers(0, 300000, 2 * size)
+            set1, set2 = set(values1.tolist()), set(values2.tolist())
+            bitmap1, bitmap2 = RoaringBitmap(values1), RoaringBitmap(values2)
+            self.assertEqual(set1 | set2, bitmap1 | bitmap2)
+            self.assertEqual(set1 & set2, bitmap1 & bitmap2)
+            self.assertEqual(len(set1 | set2), len(bitmap1.union(bitmap2)))
+            self.assertEqual(len(set1 & set2),
+                             len(bitmap1.intersection(bitmap2)))
+
+            bitmap1.update(values2)
+            self.assertEqual(set1 | set2, bitmap1)
+
+        # operations with sets of labels return sets
+        self.assertEqual({1, 'a'}, RoaringBitmap([1]) | {'a'})
+        self.assertEqual({1}, {1, 'a'} & RoaringBitmap([1, 2]))
+
+    def test_to_row_index(self):
+        self.assertIsInstance(to_row_index([3, 1]), RoaringBitmap)
+        self.assertIsInstance(to_row_index(pd.RangeIndex(5)), RoaringBitmap)
+        self.assertIsInstance(to_row_index([]), RoaringBitmap)
+        self.assertEqual({'a', 'b'}, to_row_index(['b', 'a']))
+        self.assertEqual({-1, 2}, to_row_index([-1, 2]))
+        bitmap = RoaringBitmap([1])
+        self.assertIs(bitmap, to_row_index(bitmap))
@@ -48,7 +48,7 @@ class TestCategoricalColumn(unittest.TestCase):
         profile = CategoricalColumn(dataset.name)
 
         time_array = [float(x) for x in range(17, 0, -1)]
-        with patch('time.time', side_effect=lambda: time_array.pop()):
+        with patch('time.perf_counter', side_effect=lambda: time_array.pop()):
             # Validate the time in the column class is empty.
             self.assertEqual(defaultdict(float), profile.profile['times'])
 
@@ -4,8 +4,13 @@ import six
 import unittest
 from unittest import mock
 
+import pandas as pd
+from multiprocessing.pool import ThreadPool
+
 from dataprofiler.profilers import column_profile_compilers as \
     col_pro_compilers
+from dataprofiler.profilers import utils
+from dataprofiler.profilers.int_column_profile import IntColumn
 
 
 class TestBaseColumnProfileCompilerClass(unittest.TestCase):
@@ -84,5 +89,72 @@ class TestBaseColumnProfileCompilerClass(unittest.TestCase):
         )
 
 
+class TestColumnPrimitiveTypeProfileCompiler(unittest.TestCase):
+
+    def test_values_parsed_once(self):
+        data = pd.Series(['1', '2.5', '2021-01-01', 'a', '3', '03/04/2021'],
+                         name='test')
+        with mock.patch('dataprofiler.profilers.numerical_column_stats.'
+                        'NumericStatsMixin.is_float') as mock_is_float, \
+                mock.patch('dataprofiler.profilers.numerical_column_stats.'
+                           'NumericStatsMixin.is_int') as mock_is_int:
+            compiler = col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(
+                data)
+        mock_is_float.assert_not_called()
+        mock_is_int.assert_not_called()
+
+        # the profiles match those parsing the values themselves
+        profiles = compiler._profiles
+        for col_type in ['int', 'float', 'datetime', 'text']:
+            profile = profiles[col_type].__class__('test')
+            profile.update(data)
+            self.assertEqual(profile.match_count,
+                             profiles[col_type].match_count)
+            self.assertEqual(profile.sample_size,
+                             profiles[col_type].sample_size)
+        self.assertEqual(2, profiles['int'].match_count)
+        self.assertEqual(3, profiles['float'].match_count)
+        self.assertEqual(2, profiles['datetime'].match_count)
+        self.assertCountEqual(['%Y-%m-%d', '%m/%d/%Y'],
+                              profiles['datetime'].date_formats)
+        self.assertEqual(1, profiles['float'].min)
+        self.assertEqual(3, profiles['int'].max)
+
+    def test_auto_pool_selection(self):
+        data = pd.Series(['1', '2.5', '2021-01-01', 'a', '3'], name='test')
+        apply_async = utils.apply_async
+
+        def profile_with_auto_pool():
+            compiler = col_pro_compilers.ColumnPrimitiveTypeProfileCompiler(
+                data)
+            process_pool, thread_pool = ThreadPool(1), ThreadPool(1)
+            auto_pool = utils.AutoPool(process_pool, thread_pool)
+            selected_pools = dict()
+
+            def record_apply_async(pool, function, args=()):
+                selected_pools[args[0].col_type] = \
+                    'thread' if pool is thread_pool else 'process'
+                return apply_async(pool, function, args)
+
+            with mock.patch('dataprofiler.profilers.utils.apply_async',
+                            side_effect=record_apply_async):
+                compiler.update_profile(data, pool=auto_pool)
+            auto_pool.close()
+            auto_pool.join()
+            self.assertEqual(4, compiler._profiles['int'].match_count)
+            return selected_pools
+
+        # the type checks of the profilers hold the GIL, hence are run on
+        # processes
+        self.assertDictEqual(
+            {'int': 'process', 'float': 'process', 'datetime': 'process',
+             'string': 'process'}, profile_with_auto_pool())
+
+        # only profilers declaring that they release the GIL run on threads
+        with mock.patch.object(IntColumn, 'releases_gil', True):
+            self.assertDictEqual(
+                {'int': 'thread', 'float': 'process', 'datetime': 'process',
+                 'string': 'process'}, profile_with_auto_pool())
+
 if __name__ == '__main__':
     unittest.main()
@@ -40,7 +40,7 @@ class TestDataLabelerColumnProfiler(unittest.TestCase):
         profiler = DataLabelerColumn(data.name)
 
         time_array = [float(i) for i in range(4, 0, -1)]
-        with mock.patch('time.time', side_effect=lambda: time_array.pop()):
+        with mock.patch('time.perf_counter', side_effect=lambda: time_array.pop()):
             profiler.update(data)
 
             self.assertEqual(0, profiler.sample_size)
@@ -125,7 +125,7 @@ class TestDataLabelerColumnProfiler(unittest.TestCase):
         }
 
         time_array = [float(i) for i in range(4, 0, -1)]
-        with mock.patch('time.time', side_effect=lambda: time_array.pop()):
+        with mock.patch('time.perf_counter', side_effect=lambda: time_array.pop()):
             # Validate that the times dictionary is empty
             self.assertEqual(defaultdict(float), profiler.profile['times'])
             profiler.update(data)
@@ -175,7 +175,7 @@ class TestDataLabelerColumnProfiler(unittest.TestCase):
         expected_rank_distribution = {'a': 6, 'b': 5}
 
         time_array = [float(i) for i in range(4, 0, -1)]
-        with mock.patch('time.time', side_effect=lambda: time_array.pop()):
+        with mock.patch('time.perf_counter', side_effect=lambda: time_array.pop()):
             profiler = DataLabelerColumn(data.name)
             profiler.update(data)
 
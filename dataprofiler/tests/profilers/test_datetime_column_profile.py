@@ -14,6 +14,7 @@ from . import utils
 from .. import test_utils
 
 from dataprofiler.profilers import DateTimeColumn
+from dataprofiler.profilers import utils as profiler_utils
 from dataprofiler.profilers.profiler_options import DateTimeOptions
 
 
@@ -252,7 +253,7 @@ class TestDateTimeColumnProfiler(unittest.TestCase):
             times=defaultdict(float, {'datetime': 1.0})
         )
         time_array = [float(i) for i in range(4, 0, -1)]
-        with mock.patch('time.time', side_effect=lambda: time_array.pop()):
+        with mock.patch('time.perf_counter', side_effect=lambda: time_array.pop()):
             # Validate that the times dictionary is empty
             self.assertEqual(defaultdict(float), profiler.profile['times'])
 
@@ -366,6 +367,38 @@ class TestDateTimeColumnProfiler(unittest.TestCase):
         self.assertEqual("2014-12-18", merged_profile.min)
         self.assertEqual("2015-07-21", merged_profile.max)
 
+    def test_native_datetimes(self):
+        datetimes = pd.Series(pd.to_datetime([
+            '2020-01-01 10:00:00.123456', '2020-01-02 10:00:00.5',
+            '2019-12-31 23:59:59.000001']), name='date')
+        typed_view = profiler_utils.get_typed_view(datetimes)
+
+        # native datetimes are used as is, without guessing their format
+        profile = DateTimeColumn(name='date')
+        with mock.patch.object(DateTimeColumn, '_get_datetime_profile') \
+                as mock_get_datetime_profile:
+            profile.update(datetimes.map(str), typed_view)
+        mock_get_datetime_profile.assert_not_called()
+        self.assertEqual(1., profile.data_type_ratio)
+        self.assertEqual('2019-12-31 23:59:59.000001', profile.min)
+        self.assertEqual('2020-01-02 10:00:00.500000', profile.max)
+        self.assertEqual(['%Y-%m-%d %H:%M:%S.%f'], profile.date_formats)
+
+        # the fractions of a second are only formatted when there are any
+        profile = DateTimeColumn(name='date')
+        seconds = datetimes.dt.floor('s')
+        profile.update(seconds.map(str),
+                       profiler_utils.get_typed_view(seconds))
+        self.assertEqual('2019-12-31 23:59:59', profile.min)
+        self.assertEqual(['%Y-%m-%d %H:%M:%S'], profile.date_formats)
+
+        # and merge with the profiles of strings
+        str_profile = DateTimeColumn(name='date')
+        str_profile.update(pd.Series(['2021-03-04', '2020-06-07']))
+        merged_profile = profile + str_profile
+        self.assertEqual('2019-12-31 23:59:59', merged_profile.min)
+        self.assertEqual('2021-03-04', merged_profile.max)
+
     def test_datetime_column_with_wrong_options(self):
         with self.assertRaisesRegex(ValueError,
                                    "DateTimeColumn parameter 'options' must be"
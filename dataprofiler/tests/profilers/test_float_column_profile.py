@@ -695,7 +695,7 @@ class TestFloatColumn(unittest.TestCase):
         )
         
         time_array = [float(i) for i in range(100, 0, -1)]
-        with mock.patch('time.time', side_effect=lambda: time_array.pop()):
+        with mock.patch('time.perf_counter', side_effect=lambda: time_array.pop()):
             # Validate that the times dictionary is empty
             self.assertEqual(defaultdict(float), profiler.profile['times'])
             profiler.update(df)
@@ -761,7 +761,7 @@ class TestFloatColumn(unittest.TestCase):
         profiler = FloatColumn(df.name, options=options)
 
         time_array = [float(i) for i in range(100, 0, -1)]
-        with mock.patch('time.time', side_effect=lambda: time_array.pop()):
+        with mock.patch('time.perf_counter', side_effect=lambda: time_array.pop()):
             # Validate that the times dictionary is empty
             self.assertEqual(defaultdict(float), profiler.profile['times'])
             profiler.update(df)
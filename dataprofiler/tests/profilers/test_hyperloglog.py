@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from dataprofiler.profilers.hyperloglog import HyperLogLog
+
+
+def _hash_range(start, stop):
+    return pd.util.hash_pandas_object(
+        pd.Series(np.arange(start, stop)), index=False).values
+
+
+class TestHyperLogLog(unittest.TestCase):
+
+    def test_init(self):
+        sketch = HyperLogLog(precision=10)
+        self.assertEqual(10, sketch.precision)
+        self.assertEqual(1024, len(sketch.registers))
+        self.assertEqual(0, sketch.count())
+
+        for precision in [3, 19, 10.0, None]:
+            with self.assertRaisesRegex(ValueError, "HyperLogLog precision "
+                                                    "must be an integer"):
+                HyperLogLog(precision)
+
+    def test_count(self):
+        for num_hashes in [1, 100, 10000, 500000]:
+            sketch = HyperLogLog(precision=14)
+            hashes = _hash_range(0, num_hashes)
+            sketch.update(hashes)
+            # duplicates do not change the estimate
+            sketch.update(hashes[:num_hashes // 2])
+            self.assertAlmostEqual(1, sketch.count() / num_hashes, delta=0.03)
+
+        # empty updates are ignored
+        sketch.update(np.array([], dtype=np.uint64))
+        self.assertAlmostEqual(1, sketch.count() / 500000, delta=0.03)
+
+    def test_merge(self):
+        sketch1 = HyperLogLog(precision=12)
+        sketch1.update(_hash_range(0, 30000))
+        sketch2 = HyperLogLog(precision=12)
+        sketch2.update(_hash_range(20000, 50000))
+        expected_sketch = HyperLogLog(precision=12)
+        expected_sketch.update(_hash_range(0, 50000))
+
+        merged_sketch = sketch1 + sketch2
+        np.testing.assert_array_equal(expected_sketch.registers,
+                                      merged_sketch.registers)
+        self.assertAlmostEqual(1, merged_sketch.count() / 50000, delta=0.05)
+
+        with self.assertRaisesRegex(TypeError, '`HyperLogLog` and `int` are '
+                                               'not of the same sketch type.'):
+            sketch1 + 1
+
+    def test_merge_different_precisions(self):
+        sketch1 = HyperLogLog(precision=14)
+        sketch1.update(_hash_range(0, 30000))
+        sketch2 = HyperLogLog(precision=10)
+        sketch2.update(_hash_range(20000, 50000))
+        expected_sketch = HyperLogLog(precision=10)
+        expected_sketch.update(_hash_range(0, 50000))
+
+        # registers are folded into the lower precision without losing hashes
+        sketch1.merge(sketch2)
+        self.assertEqual(10, sketch1.precision)
+        np.testing.assert_array_equal(expected_sketch.registers,
+                                      sketch1.registers)
@@ -287,7 +287,7 @@ class TestIntColumn(unittest.TestCase):
             
         )
         time_array = [float(i) for i in range(100, 0, -1)]
-        with mock.patch('time.time', side_effect=lambda: time_array.pop()):
+        with mock.patch('time.perf_counter', side_effect=lambda: time_array.pop()):
             # Validate that the times dictionary is empty
             self.assertEqual(defaultdict(float), profiler.profile['times'])
             profiler.update(df)
@@ -334,7 +334,7 @@ class TestIntColumn(unittest.TestCase):
         profiler = IntColumn(df.name, options=options)
 
         time_array = [float(i) for i in range(100, 0, -1)]
-        with mock.patch('time.time', side_effect=lambda: time_array.pop()):
+        with mock.patch('time.perf_counter', side_effect=lambda: time_array.pop()):
             # Validate that the times dictionary is empty
             self.assertCountEqual(defaultdict(float), profiler.profile['times'])
             profiler.update(df)
@@ -6,7 +6,9 @@ from collections import defaultdict
 import pandas as pd
 import numpy as np
 
-from dataprofiler.profilers import NumericStatsMixin
+from dataprofiler.profilers import NumericStatsMixin, FloatColumn
+from dataprofiler.profilers.numerical_column_stats import \
+    _HistogramMethodState
 from dataprofiler.profilers.profiler_options import NumericalOptions
 
 
@@ -205,7 +207,7 @@ class TestNumericStatsMixin(unittest.TestCase):
         other1.histogram_selection = 'auto'
 
         time_array = [float(i) for i in range(2, 0, -1)]
-        with mock.patch('time.time', side_effect=lambda: time_array.pop()):
+        with mock.patch('time.perf_counter', side_effect=lambda: time_array.pop()):
             # Validate that the times dictionary is empty
             self.assertEqual(defaultdict(float), num_profiler.times)
 
@@ -228,7 +230,7 @@ class TestNumericStatsMixin(unittest.TestCase):
         subset_properties = {"min": 0, "match_count": 0}
 
         time_array = [float(i) for i in range(24, 0, -1)]
-        with mock.patch('time.time', side_effect=lambda: time_array.pop()):
+        with mock.patch('time.perf_counter', side_effect=lambda: time_array.pop()):
 
             # Validate that the times dictionary is empty
             self.assertEqual(defaultdict(float), num_profiler.times)
@@ -270,3 +272,48 @@ class TestNumericStatsMixin(unittest.TestCase):
             num_profiler._get_histogram_and_quantiles(
                 df_series, prev_dependent_properties, subset_properties)
             self.assertEqual(expected, num_profiler.times)
+
+    def test_quantiles(self):
+        num_profiler = TestColumn()
+        self.assertDictEqual(dict.fromkeys(range(999)), num_profiler.quantiles)
+
+        # the quantiles are derived from the stored histogram, not stored
+        num_profiler._stored_histogram['histogram'] = {
+            'bin_counts': np.array([1, 1, 1, 1]),
+            'bin_edges': np.array([2., 5.25, 8.5, 11.75, 15.])
+        }
+        quantiles = num_profiler.quantiles
+        self.assertEqual(999, len(quantiles))
+        self.assertAlmostEqual(2.013, quantiles[0])
+        self.assertAlmostEqual(8.5, quantiles[499])
+        self.assertNotIn('quantiles', vars(num_profiler))
+
+        # merging with an empty profile keeps the histogram of the other
+        profiler = FloatColumn('a')
+        profiler.update(pd.Series(['1.5', '2.5', '4', '8']))
+        for merged_profiler in [profiler + FloatColumn('a'),
+                                FloatColumn('a') + profiler]:
+            self.assertTrue(merged_profiler._has_histogram)
+            self.assertEqual(profiler.quantiles, merged_profiler.quantiles)
+            self.assertIsNot(profiler._stored_histogram,
+                             merged_profiler._stored_histogram)
+
+    def test_histogram_method_state(self):
+        state = _HistogramMethodState(suggested_bin_count=10)
+        self.assertEqual(0, state['total_loss'])
+        self.assertEqual(10, state['suggested_bin_count'])
+        self.assertDictEqual({'bin_counts': None, 'bin_edges': None},
+                             state['histogram'])
+
+        state['total_loss'] += 2
+        state['histogram'] = {'bin_counts': np.array([2]),
+                              'bin_edges': np.array([1., 1.])}
+        self.assertEqual(2, state['total_loss'])
+        np.testing.assert_array_equal([2], state['histogram']['bin_counts'])
+
+        # the state is slotted, without any other items
+        self.assertFalse(hasattr(state, '__dict__'))
+        with self.assertRaises(KeyError):
+            state['_histogram']
+        with self.assertRaises(KeyError):
+            state['bin_counts'] = None
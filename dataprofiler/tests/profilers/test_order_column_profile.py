@@ -103,7 +103,7 @@ class TestOrderColumn(unittest.TestCase):
             times={'order' : 2.0}
         )
         time_array = [float(x) for x in range(4, 0, -1)]
-        with mock.patch('time.time', side_effect = lambda: time_array.pop()):
+        with mock.patch('time.perf_counter', side_effect = lambda: time_array.pop()):
             profiler.update(df)
             profile = profiler.profile
 
@@ -297,7 +297,7 @@ class TestOrderColumn(unittest.TestCase):
         profiler2.times = dict(order=3.0)
 
         time_array = [float(i) for i in range(2, 0, -1)]
-        with mock.patch('time.time', side_effect=lambda: time_array.pop()):
+        with mock.patch('time.perf_counter', side_effect=lambda: time_array.pop()):
             profiler3 = profiler1 + profiler2
 
             # __add__() call adds 1 so expected is 6
@@ -0,0 +1,96 @@
+import threading
+import unittest
+
+from dataprofiler.profilers.pipeline import Pipeline
+
+
+class TestPipeline(unittest.TestCase):
+
+    def test_run(self):
+        outputs = []
+        thread_names = set()
+
+        def double(item):
+            thread_names.add(threading.current_thread().name)
+            return [value * 2 for value in item]
+
+        def collect(item):
+            thread_names.add(threading.current_thread().name)
+            outputs.append(item)
+
+        pipeline = Pipeline([('double', double), ('collect', collect)],
+                            depth=1)
+        pipeline.run([[1, 2], [3], [4, 5, 6]])
+        self.assertEqual([[2, 4], [6], [8, 10, 12]], outputs)
+        self.assertEqual({'double', 'collect'}, thread_names)
+
+        metrics = pipeline.metrics
+        self.assertEqual(['read', 'double', 'collect'],
+                         list(metrics['stages']))
+        for stage_metrics in metrics['stages'].values():
+            self.assertEqual(3, stage_metrics['items'])
+            self.assertEqual(6, stage_metrics['rows'])
+            self.assertGreaterEqual(stage_metrics['busy_seconds'], 0)
+            self.assertGreaterEqual(stage_metrics['idle_seconds'], 0)
+        self.assertEqual({'depth': 1, 'max_occupancy': 1},
+                         {key: metrics['queues']['read->double'][key]
+                          for key in ['depth', 'max_occupancy']})
+        self.assertGreaterEqual(metrics['seconds'], 0)
+
+    def test_backpressure(self):
+        # the source cannot get ahead of a blocked stage by more than the
+        # items the queue and the stage hold
+        read = []
+        release = threading.Event()
+
+        def source():
+            for i in range(10):
+                read.append(i)
+                yield [i]
+
+        def wait(item):
+            release.wait()
+
+        pipeline = Pipeline([('wait', wait)], depth=2)
+        thread = threading.Thread(target=pipeline.run, args=(source(),))
+        thread.start()
+        thread.join(0.5)
+        self.assertLessEqual(len(read), 4)
+        release.set()
+        thread.join()
+        self.assertEqual(10, len(read))
+        self.assertEqual(2, pipeline.metrics['queues']['read->wait']
+                                            ['max_occupancy'])
+
+    def test_error(self):
+        closed = []
+
+        def source():
+            try:
+                for i in range(100):
+                    yield [i]
+            finally:
+                closed.append(True)
+
+        def fail(item):
+            if item == [3]:
+                raise ValueError('test error')
+            return item
+
+        pipeline = Pipeline([('fail', fail), ('pass', lambda item: item)],
+                            depth=1)
+        with self.assertRaisesRegex(ValueError, 'test error'):
+            pipeline.run(source())
+        self.assertEqual([True], closed)
+
+    def test_invalid(self):
+        with self.assertRaisesRegex(ValueError, "`depth` must be a positive "
+                                                "integer."):
+            Pipeline([('pass', lambda item: item)], depth=0)
+        with self.assertRaisesRegex(ValueError, "A pipeline must have at "
+                                                "least one stage."):
+            Pipeline([])
+
+
+if __name__ == '__main__':
+    unittest.main()
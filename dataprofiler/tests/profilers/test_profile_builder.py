@@ -1,5 +1,6 @@
 from __future__ import print_function
 
+import asyncio
 import unittest
 from unittest import mock
 import builtins
@@ -7,6 +8,13 @@ import random
 import six
 import os
 import re
+import pickle
+import struct
+import tempfile
+import threading
+import warnings
+import multiprocessing as mp
+from multiprocessing import pool as mp_pool
 
 import numpy as np
 import pandas as pd
@@ -14,6 +22,7 @@ import pandas as pd
 from . import utils as test_utils
 
 import dataprofiler as dp
+from dataprofiler.profilers import utils
 from dataprofiler.profilers.profile_builder import StructuredDataProfile
 from dataprofiler.profilers.profiler_options import ProfilerOptions, \
     StructuredOptions
@@ -106,6 +115,116 @@ class TestProfiler(unittest.TestCase):
         self.assertEqual('multiple files', merged_profile.encoding)
         self.assertEqual('multiple files', merged_profile.file_type)
 
+    def test_merge_many(self):
+        from concurrent.futures import ThreadPoolExecutor
+        data = pd.DataFrame({'a': np.arange(100) / 7,
+                             'b': (['x', 'y', None, 'z'] * 25)})
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False,
+                              'multiprocess.is_enabled': False})
+        profiles = [dp.Profiler(data[i:i + 20],
+                                profiler_options=profiler_options)
+                    for i in range(0, 100, 20)]
+
+        sum_profile = profiles[0]
+        for profile in profiles[1:]:
+            sum_profile = sum_profile + profile
+        with ThreadPoolExecutor(2) as executor:
+            merged_profile = dp.Profiler.merge_many(profiles, executor)
+
+        self.assertEqual(100, merged_profile.total_samples)
+        self.assertEqual(100, merged_profile._get_unique_row_count())
+        self.assertEqual(sum_profile.row_has_null_count,
+                         merged_profile.row_has_null_count)
+        sum_report = sum_profile.report()
+        merged_report = merged_profile.report()
+        for col in ['a', 'b']:
+            for stat in ['sample_size', 'null_count', 'null_types_index',
+                         'min', 'max', 'unique_count']:
+                self.assertEqual(
+                    sum_report['data_stats'][col]['statistics'].get(stat),
+                    merged_report['data_stats'][col]['statistics'].get(stat))
+            # merge order only changes the float rounding
+            for stat in ['mean', 'variance']:
+                self.assertAlmostEqual(
+                    sum_report['data_stats'][col]['statistics'].get(stat, 0),
+                    merged_report['data_stats'][col]['statistics'].get(stat, 0))
+
+        with self.assertRaisesRegex(ValueError, "At least one profile is "
+                                                "required to merge."):
+            dp.Profiler.merge_many([])
+        with self.assertRaisesRegex(TypeError, '`Profiler` and `int` are not '
+                                               'of the same profiler type.'):
+            dp.Profiler.merge_many(profiles + [1])
+
+    def test_profile_dataset(self):
+        data = pd.DataFrame({'a': np.arange(90) / 7,
+                             'b': (['x', 'y', None] * 30)})
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False,
+                              'multiprocess.is_enabled': False})
+        full_profile = dp.Profiler(data, profiler_options=profiler_options)
+        full_report = full_profile.report()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(3):
+                data[i * 30:(i + 1) * 30].to_csv(
+                    os.path.join(tmpdir, 'part-{}.csv'.format(i)),
+                    index=False)
+
+            for workers in [1, 2]:
+                profile = dp.profile_dataset(
+                    os.path.join(tmpdir, '*.csv'), workers=workers,
+                    profiler_options=profiler_options)
+                self.assertIsNone(profile._pool)
+                report = profile.report()
+                self.assertEqual(90, profile.total_samples)
+                self.assertEqual(full_profile.row_has_null_count,
+                                 profile.row_has_null_count)
+                self.assertEqual('csv', profile.file_type)
+                for col in ['a', 'b']:
+                    for stat in ['sample_size', 'null_count', 'min', 'max',
+                                 'unique_count']:
+                        self.assertEqual(
+                            full_report['data_stats'][col]['statistics']
+                            .get(stat),
+                            report['data_stats'][col]['statistics'].get(stat))
+                    self.assertAlmostEqual(
+                        full_report['data_stats'][col]['statistics']
+                        .get('mean', 0),
+                        report['data_stats'][col]['statistics'].get('mean', 0))
+
+            # columns missing from a partition are profiled from the others
+            data[:30].rename(columns={'b': 'c'}).to_csv(
+                os.path.join(tmpdir, 'part-3.csv'), index=False)
+            profile = dp.profile_dataset(tmpdir, workers=2,
+                                         profiler_options=profiler_options)
+            self.assertEqual(120, profile.total_samples)
+            self.assertEqual(['a', 'b', 'c'], list(profile.profile))
+            self.assertEqual(120, profile.profile['a'].sample_size)
+            self.assertEqual(90, profile.profile['b'].sample_size)
+            self.assertEqual(30, profile.profile['c'].sample_size)
+
+            # no worker of the partitions profiled in process is left
+            children = set(mp.active_children())
+            multiprocess_options = ProfilerOptions()
+            multiprocess_options.set({'data_labeler.is_enabled': False})
+            with mock.patch('dataprofiler.profilers.utils.suggest_pool_size',
+                            return_value=3):
+                profile = dp.profile_dataset(
+                    tmpdir, workers=1, profiler_options=multiprocess_options)
+            self.assertEqual(120, profile.total_samples)
+            self.assertEqual(children, set(mp.active_children()))
+
+            with self.assertRaisesRegex(ValueError, 'No files found to '
+                                                    'profile for'):
+                dp.profile_dataset(os.path.join(tmpdir, '*.parquet'))
+
+        with self.assertRaisesRegex(ValueError, 'Profiles do not have the '
+                                                'same schema.'):
+            dp.Profiler.merge_many([full_profile, dp.Profiler(
+                data[['a']], profiler_options=profiler_options)])
+
     @mock.patch('dataprofiler.profilers.profile_builder.'
                 'ColumnPrimitiveTypeProfileCompiler')
     @mock.patch('dataprofiler.profilers.profile_builder.'
@@ -162,6 +281,42 @@ class TestProfiler(unittest.TestCase):
         self.assertEqual(2999, self.trained_schema.total_samples)
         self.assertEqual(0.0, self.trained_schema._get_duplicate_row_count())
 
+    def test_unique_row_sketch(self):
+        data = pd.DataFrame({'a': np.arange(3000) % 1000,
+                             'b': (np.arange(3000) % 1000).astype(str)})
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False,
+                              'multiprocess.is_enabled': False,
+                              'unique_rows.method': 'hll'})
+        sketch_profile = dp.Profiler(data, profiler_options=profiler_options)
+        self.assertEqual({}, sketch_profile.hashed_row_dict)
+        self.assertEqual(14, sketch_profile.hashed_row_sketch.precision)
+        self.assertAlmostEqual(1000 / 3000,
+                               sketch_profile._get_unique_row_ratio(),
+                               delta=0.01)
+        self.assertAlmostEqual(2000, sketch_profile._get_duplicate_row_count(),
+                               delta=20)
+
+        # merging with an exact profile estimates with the sketch
+        profiler_options.set({'unique_rows.method': 'exact'})
+        exact_data = data[:1500].copy()
+        exact_data['a'] += 1000
+        exact_profile = dp.Profiler(exact_data,
+                                    profiler_options=profiler_options)
+        self.assertIsNone(exact_profile.hashed_row_sketch)
+        self.assertEqual(1000, exact_profile._get_unique_row_count())
+        merged_profile = exact_profile + sketch_profile
+        self.assertEqual({}, merged_profile.hashed_row_dict)
+        self.assertAlmostEqual(2000, merged_profile._get_unique_row_count(),
+                               delta=20)
+
+        # disabled row statistics are not calculated
+        profiler_options.set({'unique_rows.is_enabled': False})
+        profile = dp.Profiler(data, profiler_options=profiler_options)
+        self.assertEqual({}, profile.hashed_row_dict)
+        self.assertIsNone(profile._get_unique_row_ratio())
+        self.assertIsNone(profile._get_duplicate_row_count())
+
     def test_correct_datatime_schema_test(self):
         profile = self.trained_schema.profile["datetime"]
         col_schema_info = \
@@ -248,6 +403,94 @@ class TestProfiler(unittest.TestCase):
             2: report2_1000_quant[749],
         })
 
+    def test_report_columns_and_keys(self):
+        report = self.trained_schema.report()
+        column_report = self.trained_schema.report(columns=['int_col'])
+        self.assertEqual(report['global_stats'], column_report['global_stats'])
+        self.assertEqual(['int_col'], list(column_report['data_stats']))
+        self.assertEqual(report['data_stats']['int_col'],
+                         column_report['data_stats']['int_col'])
+
+        keys_report = self.trained_schema.report(
+            columns=['int_col', 'host'],
+            keys=['global_stats.row_count', 'data_stats.*.data_type',
+                  'data_stats.int_col.statistics.mean'])
+        self.assertEqual({
+            'global_stats': {'row_count': 2999},
+            'data_stats': {
+                'int_col': {'data_type': 'int', 'statistics': {
+                    'mean': report['data_stats']['int_col']['statistics'][
+                        'mean']}},
+                'host': {'data_type': 'string'},
+            }}, keys_report)
+
+        # only the selected columns are computed
+        with mock.patch('dataprofiler.profilers.profile_builder.'
+                        'StructuredDataProfile.profile',
+                        new_callable=mock.PropertyMock) as mock_profile:
+            mock_profile.return_value = {'statistics': {}}
+            self.trained_schema.report(columns=['int_col'])
+            self.assertEqual(1, mock_profile.call_count)
+            self.trained_schema.report(keys=['global_stats'])
+            self.assertEqual(1, mock_profile.call_count)
+
+        with self.assertRaisesRegex(ValueError, r"Columns are not in the "
+                                                r"profile: \['missing'\]"):
+            self.trained_schema.report(columns=['missing'])
+
+    def test_report_keys_computed_lazily(self):
+        data = pd.DataFrame({'a': [1, 2, 3, 4], 'b': [1.5, 2.5, 3.5, 4.5]})
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False,
+                              'multiprocess.is_enabled': False})
+        profiler = dp.Profiler(data, profiler_options=profiler_options)
+
+        # the histogram is only computed if it or the whole column is selected
+        with mock.patch('dataprofiler.profilers.numerical_column_stats.'
+                        'NumericStatsMixin._get_best_histogram_for_profile',
+                        return_value={}) as mock_histogram:
+            report = profiler.report(keys=['data_stats.*.statistics.mean'])
+            self.assertEqual({'data_stats': {
+                'a': {'statistics': {'mean': 2.5}},
+                'b': {'statistics': {'mean': 3.0}},
+            }}, report)
+            mock_histogram.assert_not_called()
+
+            profiler.report(keys=['data_stats.a.statistics.histogram'])
+            self.assertEqual(1, mock_histogram.call_count)
+
+        # the partial reports match the full report
+        full_report = profiler.report()
+        self.assertEqual(
+            full_report['data_stats']['b']['statistics']['histogram'],
+            profiler.report(keys=['data_stats.b.statistics.histogram'])[
+                'data_stats']['b']['statistics']['histogram'])
+
+    def test_report_cached_until_update(self):
+        data = pd.DataFrame({'a': [1, 2, 3, 4], 'b': ['x', 'y', 'z', 'w']})
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False,
+                              'multiprocess.is_enabled': False})
+        profile = dp.Profiler(data, profiler_options=profiler_options)
+
+        col_profile = profile.profile['a'].profile
+        self.assertIs(col_profile, profile.profile['a'].profile)
+        report = profile.report(report_options={'num_quantile_groups': 2})
+        self.assertEqual(1, len(report['data_stats']['a']['statistics'][
+            'quantiles']))
+        # the report does not modify the cached profile
+        self.assertEqual(999, len(col_profile['statistics']['quantiles']))
+
+        profile.update_profile(pd.DataFrame({'a': [10], 'b': ['v']}))
+        self.assertIsNot(col_profile, profile.profile['a'].profile)
+        self.assertEqual(10, profile.report()['data_stats']['a'][
+            'statistics']['max'])
+
+        # the cache is not pickled
+        profile.profile['a'].profile
+        pickled_profile = pickle.loads(pickle.dumps(profile.profile['a']))
+        self.assertIsNone(pickled_profile._profile_cache)
+
     def test_report_omit_keys(self):
         omit_keys = ['global_stats', 'data_stats']
                 
@@ -375,6 +618,498 @@ class TestProfiler(unittest.TestCase):
                                      samples_per_update=1)
         self.assertEqual(2, sparse_profile._min_col_samples_used)
 
+    @mock.patch('dataprofiler.profilers.profile_builder.utils.generate_pool')
+    def test_pool_reused_across_updates(self, mock_generate_pool):
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(2)
+        mock_generate_pool.return_value = (pool, 2)
+
+        data = pd.DataFrame({'a': [1, 2, 3, None], 'b': ['x', 'y', 'z', 'w']})
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False})
+
+        with dp.Profiler(None, profiler_options=profiler_options) as profile:
+            profile.update_profile(data)
+            profile.update_profile(data)
+
+            # pool is created once and shared by both phases of all updates
+            mock_generate_pool.assert_called_once()
+            self.assertIs(pool, profile._pool)
+            self.assertEqual(8, profile.total_samples)
+            self.assertEqual(2, profile.profile['a'].null_count)
+
+        # pool is closed when exiting the context manager
+        self.assertIsNone(profile._pool)
+        with self.assertRaises(ValueError):
+            pool.apply_async(len, ([],))
+
+        # closing again is a no-op
+        profile.close()
+        self.assertIsNone(profile._pool)
+
+    @mock.patch('dataprofiler.profilers.profile_builder.utils.generate_pool')
+    def test_pool_closed_after_update(self, mock_generate_pool):
+        from multiprocessing.pool import ThreadPool
+        pools = []
+
+        def generate_pool(**kwargs):
+            pools.append(ThreadPool(2))
+            return pools[-1], 2
+        mock_generate_pool.side_effect = generate_pool
+
+        data = pd.DataFrame({'a': [1, 2, 3, None], 'b': ['x', 'y', 'z', 'w']})
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False})
+
+        # outside of a `with` block, the pool only lives during an update,
+        # the chunks of a stream sharing the same pool
+        profile = dp.Profiler(data, profiler_options=profiler_options)
+        self.assertIsNone(profile._pool)
+        profile.update_profile(data)
+        self.assertIsNone(profile._pool)
+        profile.profile_stream(data, chunk_size=2)
+        self.assertIsNone(profile._pool)
+
+        self.assertEqual(3, len(pools))
+        for pool in pools:
+            with self.assertRaises(ValueError):
+                pool.apply_async(len, ([],))
+
+    @mock.patch('dataprofiler.profilers.utils.suggest_pool_size',
+                return_value=3)
+    def test_no_workers_left_after_profiling(self, *mocks):
+        data = pd.DataFrame({'a': [1, 2, 3, None], 'b': ['x', 'y', 'z', 'w']})
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False})
+
+        children = set(mp.active_children())
+        profiles = [dp.Profiler(data, profiler_options=profiler_options)
+                    for _ in range(2)]
+        self.assertEqual(children, set(mp.active_children()))
+        self.assertEqual(8, sum(profile.total_samples for profile in profiles))
+
+        with dp.Profiler(data, profiler_options=profiler_options) as profile:
+            profile.update_profile(data)
+            self.assertIsNotNone(profile._pool)
+        self.assertEqual(children, set(mp.active_children()))
+
+        # the workers of a profiler which is never closed are stopped once
+        # it is garbage collected
+        profile = dp.Profiler(None, profiler_options=profiler_options)
+        profile.__enter__()
+        profile.update_profile(data)
+        self.assertIsNotNone(profile._pool)
+        del profile
+        self.assertEqual(children, set(mp.active_children()))
+
+    @unittest.skipIf(utils.shared_memory is None,
+                     "shared memory requires python 3.8+")
+    @mock.patch('dataprofiler.profilers.profile_builder.utils.generate_pool')
+    def test_shared_memory_multiprocessing(self, mock_generate_pool):
+        import multiprocessing as mp
+        from multiprocessing import resource_tracker
+        resource_tracker.ensure_running()
+        mock_generate_pool.return_value = (mp.Pool(2), 2)
+
+        data = pd.DataFrame({'str': [str(i) for i in range(100)],
+                             'float': np.arange(100) / 4,
+                             'mixed': ['a', None, 1, 'nan'] * 25})
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False})
+        shared_kinds = []
+        share_args = utils.share_args
+
+        def record_share_args(args):
+            shared_blocks, shared_args = share_args(args)
+            shared_kinds.extend(arg.kind for arg in shared_args
+                                if isinstance(arg, utils.SharedArg))
+            return shared_blocks, shared_args
+
+        with mock.patch('dataprofiler.profilers.profile_builder.utils.'
+                        'share_args', side_effect=record_share_args):
+            with dp.Profiler(data, profiler_options=profiler_options) as mp_profile:
+                mp_report = mp_profile.report()
+        # the string columns are pickled while their typed views are shared
+        self.assertIn('typed_view', shared_kinds)
+        self.assertNotIn('series', shared_kinds)
+
+        profiler_options.set({'multiprocess.is_enabled': False})
+        report = dp.Profiler(data, profiler_options=profiler_options).report()
+        for col in data.columns:
+            self.assertEqual(report['data_stats'][col]['data_type'],
+                             mp_report['data_stats'][col]['data_type'])
+            for stat in ['null_count', 'null_types_index', 'mean', 'max']:
+                self.assertEqual(
+                    report['data_stats'][col]['statistics'].get(stat),
+                    mp_report['data_stats'][col]['statistics'].get(stat))
+
+    @mock.patch('dataprofiler.profilers.profile_builder.utils.psutil.'
+                'cpu_count', return_value=2)
+    def test_thread_backend(self, *mocks):
+        data = pd.DataFrame({'str': [str(i) for i in range(100)],
+                             'float': np.arange(100) / 4,
+                             'mixed': ['a', None, 1, 'nan'] * 25})
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False,
+                              'multiprocess.backend': 'thread'})
+        with dp.Profiler(None, profiler_options=profiler_options) as profile:
+            profile.update_profile(data)
+            self.assertIsInstance(profile._pool, mp_pool.ThreadPool)
+            thread_report = profile.report()
+
+        profiler_options.set({'multiprocess.is_enabled': False})
+        report = dp.Profiler(data, profiler_options=profiler_options).report()
+        for col in data.columns:
+            self.assertEqual(report['data_stats'][col]['data_type'],
+                             thread_report['data_stats'][col]['data_type'])
+            for stat in ['null_count', 'null_types_index', 'mean', 'max']:
+                self.assertEqual(
+                    report['data_stats'][col]['statistics'].get(stat),
+                    thread_report['data_stats'][col]['statistics'].get(stat))
+
+    @mock.patch('dataprofiler.profilers.profile_builder.utils.generate_pool',
+                return_value=(None, 1))
+    def test_memory_budget(self, mock_generate_pool):
+        data = pd.DataFrame({'a': np.arange(2000) / 4,
+                             'b': [str(i) for i in range(2000)]})
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False,
+                              'memory_budget.max_memory_bytes': 500000})
+
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter('always')
+            profile = dp.Profiler(data, profiler_options=profiler_options)
+        messages = [str(warning.message) for warning in caught_warnings]
+
+        # the sample size is reduced and the pool limited to fit the budget
+        self.assertTrue(any(message.startswith(
+            "The sample size was reduced from 2000 to")
+            for message in messages))
+        self.assertEqual(2000, profile.total_samples)
+        self.assertLess(profile.profile['a'].sample_size, 2000)
+        self.assertLessEqual(100, profile.profile['a'].sample_size)
+        self.assertIsNotNone(
+            mock_generate_pool.call_args[1]['max_pool_size'])
+
+        # the exact unique rows are replaced by a sketch beyond the budget
+        self.assertTrue(any(message.startswith(
+            "The unique rows are estimated from now on")
+            for message in messages))
+        self.assertIsNotNone(profile.hashed_row_sketch)
+        self.assertEqual(dict(), profile.hashed_row_dict)
+        self.assertAlmostEqual(2000, profile._get_unique_row_count(),
+                               delta=100)
+
+        # chunks are limited to a fraction of the budget
+        self.assertEqual(100, profile._get_budgeted_chunk_size(data, 100))
+        chunk_size = profile._get_budgeted_chunk_size(data, 100000)
+        self.assertLess(chunk_size, 2000)
+        self.assertGreater(chunk_size, 100)
+
+        # the budget is ignored when disabled
+        profiler_options.set({'memory_budget.is_enabled': False})
+        profile = dp.Profiler(data, profiler_options=profiler_options)
+        self.assertEqual(2000, profile.profile['a'].sample_size)
+        self.assertIsNone(mock_generate_pool.call_args[1]['max_pool_size'])
+        self.assertIsNone(profile.hashed_row_sketch)
+
+    def test_profile_stream(self):
+        data = pd.DataFrame({'a': ['1', None, '3', '4', None, '6', '7'],
+                             'b': ['x', 'y', None, 'z', None, 'w', 'v']})
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False,
+                              'multiprocess.is_enabled': False})
+
+        profile = dp.Profiler(None, profiler_options=profiler_options)
+        profile.profile_stream(data, chunk_size=3)
+
+        # null indices are offset globally across the chunks
+        self.assertEqual(7, profile.total_samples)
+        self.assertEqual({'None': {1, 4}},
+                         profile.profile['a'].null_types_index)
+        self.assertEqual({'None': {2, 4}},
+                         profile.profile['b'].null_types_index)
+        self.assertEqual(3, profile.row_has_null_count)
+        self.assertEqual(1, profile.row_is_null_count)
+        self.assertEqual(7, profile.profile['a'].sample_size)
+        self.assertEqual(
+            "<class 'pandas.core.frame.DataFrame'>", profile.file_type)
+        self.assertEqual(list(range(7)), list(data.index))
+
+        # streaming further data continues the global row index
+        profile.profile_stream(data[:2], chunk_size=5)
+        self.assertEqual({'None': {1, 4, 8}},
+                         profile.profile['a'].null_types_index)
+
+        # stream a file through the data reader
+        data = dp.Data(os.path.join(test_root_path, 'data', 'csv/iris.csv'))
+        profile = dp.Profiler(None, profiler_options=profiler_options)
+        profile.profile_stream(data, chunk_size=40)
+        self.assertIsNone(data._data)
+        self.assertEqual('csv', profile.file_type)
+        self.assertEqual('utf-8', profile.encoding)
+        self.assertEqual(150, profile.total_samples)
+        full_profile = dp.Profiler(data, profiler_options=profiler_options)
+        self.assertAlmostEqual(
+            full_profile.report()['data_stats']['SepalLengthCm']['statistics']['mean'],
+            profile.report()['data_stats']['SepalLengthCm']['statistics']['mean'])
+
+        with self.assertRaisesRegex(ValueError, "`chunk_size` must be a "
+                                                "positive integer."):
+            profile.profile_stream(data, chunk_size=0)
+
+    def test_profile_stream_reservoir(self):
+        data = pd.DataFrame({'a': [str(i) for i in range(10000)],
+                             'b': ['x', 'y', None, 'z'] * 2500})
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False,
+                              'multiprocess.is_enabled': False,
+                              'reservoir.size': 100})
+
+        profile = dp.Profiler(None, profiler_options=profiler_options)
+        profile.profile_stream(data, chunk_size=2000)
+
+        # every row is counted while the types are profiled from reservoirs
+        report = profile.report()
+        self.assertEqual(10000, report['global_stats']['samples_used'])
+        self.assertEqual(2500, report['data_stats']['b']['statistics']
+                                     ['null_count'])
+        self.assertEqual(10000, report['data_stats']['a']['statistics']
+                                      ['unique_count'])
+        self.assertEqual('int', report['data_stats']['a']['data_type'])
+        self.assertEqual(100, len(profile.profile['a']._reservoir.values))
+
+        # as are the moments, min and max of numeric columns, unlike their
+        # histograms and precision
+        data = pd.DataFrame({'int': np.arange(1, 20001),
+                             'float': np.arange(1, 20001) / 4})
+        profile = dp.Profiler(None, profiler_options=profiler_options)
+        profile.profile_stream(data, chunk_size=2000)
+        report = profile.report()
+        for col in data.columns:
+            stats = report['data_stats'][col]['statistics']
+            self.assertEqual(data[col].min(), stats['min'])
+            self.assertEqual(data[col].max(), stats['max'])
+            self.assertAlmostEqual(data[col].mean(), stats['mean'])
+            self.assertAlmostEqual(1, stats['variance'] / data[col].var())
+            self.assertEqual(100, sum(stats['histogram']['bin_counts']))
+        self.assertEqual(100, report['data_stats']['float']['statistics']
+                                    ['precision']['sample_size'])
+
+    def test_update_profile_columns(self):
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False,
+                              'multiprocess.is_enabled': False})
+
+        # only the selected columns are read from the file
+        data = dp.Data(os.path.join(test_root_path, 'data', 'csv/iris.csv'))
+        profile = dp.Profiler(None, profiler_options=profiler_options)
+        profile.update_profile(data, columns=['Species', 'Id'])
+        self.assertEqual(['Species', 'Id'], list(profile.profile))
+        self.assertEqual(150, profile.total_samples)
+
+        # the given data is left unchanged
+        self.assertIsNone(data._data)
+        self.assertEqual([], data.selected_columns)
+        self.assertEqual(6, len(data.data.columns))
+
+        # data already loaded is profiled from the selected columns
+        profile = dp.Profiler(None, profiler_options=profiler_options)
+        profile.update_profile(data, columns=['Id'])
+        self.assertEqual(['Id'], list(profile.profile))
+        self.assertEqual(6, len(data.data.columns))
+
+        # as well as from each streamed chunk
+        data = dp.Data(os.path.join(test_root_path, 'data', 'csv/iris.csv'))
+        profile = dp.Profiler(None, profiler_options=profiler_options)
+        profile.profile_stream(data, chunk_size=40, columns=['Species'])
+        self.assertEqual(['Species'], list(profile.profile))
+        self.assertIsNone(data._data)
+        self.assertEqual([], data.selected_columns)
+        self.assertEqual(150, profile.total_samples)
+
+        # dataframes are profiled from the selected columns
+        data = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']})
+        profile = dp.Profiler(None, profiler_options=profiler_options)
+        profile.update_profile(data, columns=['b'])
+        self.assertEqual(['b'], list(profile.profile))
+        with self.assertRaisesRegex(ValueError, r"Columns \['c'\] are not in "
+                                                r"the data."):
+            profile.update_profile(data, columns=['c'])
+
+    def test_adaptive_sampling(self):
+        data = pd.DataFrame({'a': [str(i % 10) for i in range(20000)],
+                             'b': [str(i) if i % 2 else None
+                                   for i in range(20000)]})
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False,
+                              'multiprocess.is_enabled': False,
+                              'adaptive_sampling.ratio_tolerance': 0.01})
+
+        profile = dp.Profiler(data, samples_per_update=20000,
+                              profiler_options=profiler_options)
+
+        # the half null column needs more rounds to pin down its null ratio
+        report = profile.report()
+        self.assertEqual(1000, report['data_stats']['a']['statistics']
+                                     ['sample_size'])
+        self.assertEqual(15000, report['data_stats']['b']['statistics']
+                                      ['sample_size'])
+        self.assertAlmostEqual(
+            0.5, report['data_stats']['b']['statistics']['null_count']
+            / 15000, delta=0.01)
+        self.assertEqual(20000, report['global_stats']['row_count'])
+
+        # the rows with nulls are counted from the rows every column sampled
+        self.assertAlmostEqual(
+            0.5, profile._get_row_has_null_ratio(), delta=0.05)
+
+    def test_profile_stream_pipelined(self):
+        data = dp.Data(os.path.join(test_root_path, 'data', 'csv/iris.csv'))
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False,
+                              'multiprocess.is_enabled': False})
+
+        profile = dp.Profiler(None, profiler_options=profiler_options)
+        with mock.patch('builtins.print') as mock_print:
+            profile.profile_stream(data, chunk_size=40, pipeline_depth=2)
+        mock_print.assert_not_called()
+        sequential_profile = dp.Profiler(
+            None, profiler_options=profiler_options)
+        sequential_profile.profile_stream(data, chunk_size=40)
+        self.assertIsNone(sequential_profile.stream_metrics)
+
+        self.assertEqual(150, profile.total_samples)
+        self.assertEqual('csv', profile.file_type)
+        report = profile.report()
+        sequential_report = sequential_profile.report()
+        self.assertEqual(sequential_report['global_stats'],
+                         report['global_stats'])
+        for col in ['SepalLengthCm', 'Species']:
+            self.assertEqual(
+                sequential_report['data_stats'][col]['data_type'],
+                report['data_stats'][col]['data_type'])
+            self.assertEqual(
+                sequential_report['data_stats'][col]['statistics']['sample_size'],
+                report['data_stats'][col]['statistics']['sample_size'])
+        self.assertAlmostEqual(
+            sequential_report['data_stats']['SepalLengthCm']['statistics']['mean'],
+            report['data_stats']['SepalLengthCm']['statistics']['mean'])
+
+        metrics = profile.stream_metrics
+        self.assertEqual(['read', 'clean', 'profile'],
+                         list(metrics['stages']))
+        for stage_metrics in metrics['stages'].values():
+            self.assertEqual(4, stage_metrics['items'])
+            self.assertEqual(150, stage_metrics['rows'])
+        self.assertEqual(['read->clean', 'clean->profile'],
+                         list(metrics['queues']))
+        for queue_metrics in metrics['queues'].values():
+            self.assertEqual(2, queue_metrics['depth'])
+            self.assertLessEqual(queue_metrics['max_occupancy'], 2)
+
+        with self.assertRaisesRegex(ValueError, "`pipeline_depth` must be a "
+                                                "positive integer."):
+            profile.profile_stream(data, pipeline_depth=0)
+
+    def test_profile_stream_pipelined_new_column(self):
+        # the second chunk adds a column and is cleaned while the first one is
+        # still profiled, which must not see the column
+        chunks = [pd.DataFrame({'a': ['1', None, '3', None]}),
+                  pd.DataFrame({'a': ['5', '6', '7', '8'],
+                                'b': ['1', '2', None, '4']},
+                               index=range(4, 8))]
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False,
+                              'multiprocess.is_enabled': False})
+
+        profile = dp.Profiler(None, profiler_options=profiler_options)
+        row_is_null_counts = []
+        cleaned = threading.Event()
+        clean_chunk = profile._clean_chunk
+        profile_cleaned_chunk = profile._profile_cleaned_chunk
+
+        def clean(df, *args, **kwargs):
+            cleaned_chunk = clean_chunk(df, *args, **kwargs)
+            if 'b' in df.columns:
+                cleaned.set()
+            return cleaned_chunk
+
+        def profile_chunk(cleaned_chunk, *args, **kwargs):
+            if 'b' not in cleaned_chunk.df.columns:
+                self.assertTrue(cleaned.wait(timeout=10))
+            profile_cleaned_chunk(cleaned_chunk, *args, **kwargs)
+            row_is_null_counts.append(profile.row_is_null_count)
+
+        with mock.patch.object(profile, '_clean_chunk', side_effect=clean), \
+                mock.patch.object(profile, '_profile_cleaned_chunk',
+                                  side_effect=profile_chunk), \
+                mock.patch.object(profile, '_get_stream_chunks',
+                                  return_value=(None, iter(chunks))):
+            profile.profile_stream(None, pipeline_depth=2)
+
+        sequential_profile = dp.Profiler(
+            None, profiler_options=profiler_options)
+        sequential_row_is_null_counts = []
+        for chunk in chunks:
+            sequential_profile.update_profile(chunk)
+            sequential_row_is_null_counts.append(
+                sequential_profile.row_is_null_count)
+        self.assertEqual([2, 0], sequential_row_is_null_counts)
+        self.assertEqual(sequential_row_is_null_counts, row_is_null_counts)
+        self.assertEqual(8, profile.total_samples)
+        self.assertEqual(sequential_profile.row_is_null_count,
+                         profile.row_is_null_count)
+        self.assertEqual(sequential_profile.row_has_null_count,
+                         profile.row_has_null_count)
+        self.assertEqual(['a', 'b'], list(profile._profile))
+        self.assertEqual(1, profile._profile['b'].null_count)
+
+    def test_update_profile_async(self):
+        data = pd.DataFrame({'a': ['1', None, '3', '4', None, '6', '7'],
+                             'b': ['x', 'y', None, 'z', None, 'w', 'v']})
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False,
+                              'multiprocess.is_enabled': False})
+
+        progress = []
+
+        async def progress_callback(rows_profiled, total_rows):
+            progress.append((rows_profiled, total_rows))
+
+        # loops are run explicitly as asyncio.run requires python 3.7+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        profile = dp.Profiler(None, profiler_options=profiler_options)
+        with mock.patch('builtins.print') as mock_print:
+            loop.run_until_complete(profile.update_profile_async(
+                data, chunk_size=3, progress_callback=progress_callback))
+        mock_print.assert_not_called()
+        self.assertEqual([(3, 7), (6, 7), (7, 7)], progress)
+        self.assertEqual(7, profile.total_samples)
+        self.assertEqual({'None': {1, 4}},
+                         profile.profile['a'].null_types_index)
+        self.assertEqual(3, profile.row_has_null_count)
+        self.assertEqual(
+            "<class 'pandas.core.frame.DataFrame'>", profile.file_type)
+
+        # cancelling completes the chunk being profiled, then stops
+        async def cancel_after_first_chunk(rows_profiled, total_rows):
+            task.cancel()
+
+        profile = dp.Profiler(None, profiler_options=profiler_options)
+        task = loop.create_task(profile.update_profile_async(
+            data, chunk_size=3, progress_callback=cancel_after_first_chunk))
+        with self.assertRaises(asyncio.CancelledError):
+            loop.run_until_complete(task)
+        self.assertEqual(3, profile.total_samples)
+
+        with self.assertRaisesRegex(ValueError, "`chunk_size` must be a "
+                                                "positive integer."):
+            loop.run_until_complete(
+                profile.update_profile_async(data, chunk_size=0))
+
     def test_save_and_load(self):
         datapth = "dataprofiler/tests/data/"
         test_files = ["csv/guns.csv", "csv/iris.csv"]
@@ -410,6 +1145,87 @@ class TestProfiler(unittest.TestCase):
             self.assertDictEqual(save_report, load_report)       
 
 
+    def test_save_and_load_columns(self):
+        data = pd.DataFrame({'a': [1, 2, None, 4] * 10,
+                             'b': ['x', 'y', 'z', 'w'] * 10,
+                             'c': np.arange(40) / 3})
+        save_profile = dp.Profiler(data)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, 'profile.pkl')
+            save_profile.save(filepath)
+
+            # loading reads the columns without requiring the data labeler
+            with mock.patch('dataprofiler.profilers.profile_builder.'
+                            'DataLabeler') as mock_data_labeler:
+                load_profile = dp.Profiler.load(filepath)
+                column_profile = dp.Profiler.load(filepath, columns=['c'])
+                mock_data_labeler.assert_not_called()
+
+            with self.assertRaisesRegex(ValueError, r"Columns \['d'\] are "
+                                                    r"not in the saved "
+                                                    r"profile."):
+                dp.Profiler.load(filepath, columns=['c', 'd'])
+
+        save_report = save_profile.report()
+        load_report = load_profile.report()
+        self.assertEqual(save_report['global_stats'],
+                         load_report['global_stats'])
+        for col in ['a', 'b']:
+            for stat in ['sample_size', 'null_count', 'null_types_index',
+                         'unique_count', 'mean', 'max']:
+                self.assertEqual(
+                    save_report['data_stats'][col]['statistics'].get(stat),
+                    load_report['data_stats'][col]['statistics'].get(stat))
+        self.assertListEqual(['c'], list(column_profile.profile))
+        self.assertEqual(
+            save_report['data_stats']['c']['statistics']['mean'],
+            column_profile.report()['data_stats']['c']['statistics']['mean'])
+
+        # columns reference the loaded options, labelers restore on update
+        self.assertIs(load_profile.options.structured_options,
+                      load_profile.profile['a'].options)
+        load_profile.update_profile(data)
+        data_labeler = load_profile.options.structured_options.data_labeler \
+            .data_labeler_object
+        self.assertIsNotNone(data_labeler)
+        self.assertIs(data_labeler,
+                      load_profile.profile['b'].profiles['data_label_profile']
+                      ._profiles['data_labeler'].data_labeler)
+        self.assertEqual(80, load_profile.total_samples)
+
+    def test_load_legacy_and_unsupported_files(self):
+        profile = self.trained_schema
+        data = {"total_samples": profile.total_samples,
+                "encoding": profile.encoding,
+                "file_type": profile.file_type,
+                "row_has_null_count": profile.row_has_null_count,
+                "row_is_null_count": profile.row_is_null_count,
+                "hashed_row_dict": profile.hashed_row_dict,
+                "_samples_per_update": profile._samples_per_update,
+                "_min_true_samples": profile._min_true_samples,
+                "options": profile.options,
+                "_profile": profile.profile}
+
+        # profiles pickled prior to the versioned format still load
+        with mock.patch('builtins.open') as m:
+            mock_file = setup_save_mock_open(m)
+            pickle.dump(data, mock_file)
+            mock_file.seek(0)
+            load_profile = dp.Profiler.load("mock.pkl", columns=['src'])
+        self.assertListEqual(['src'], list(load_profile.profile))
+        self.assertEqual(2999, load_profile._get_unique_row_count())
+        self.assertIsNone(load_profile.hashed_row_sketch)
+
+        with mock.patch('builtins.open') as m:
+            mock_file = setup_save_mock_open(m)
+            mock_file.write(struct.pack('<8sIQQ', b'DPROFILE', 999, 0, 0))
+            mock_file.seek(0)
+            with self.assertRaisesRegex(ValueError, "Profile file version 999 "
+                                                    "is not supported"):
+                dp.Profiler.load("mock.pkl")
+
+
 class TestStructuredDataProfileClass(unittest.TestCase):
 
     def setUp(self):
@@ -461,6 +1277,101 @@ class TestStructuredDataProfileClass(unittest.TestCase):
         self.assertEqual(3*3, src_profile.null_count)
         self.assertEqual(2999*3, src_profile.sample_size)
 
+    def test_reservoir(self):
+        options = StructuredOptions()
+        options.set({'data_labeler.is_enabled': False,
+                     'multiprocess.is_enabled': False,
+                     'reservoir.size': 50})
+        data = pd.Series([str(i) if i % 10 else None for i in range(1000)],
+                         name='a')
+
+        profile = StructuredDataProfile(data[:100], options=options)
+        for start in range(100, 1000, 100):
+            profile.update_profile(data[start:start + 100])
+
+        # the base and category statistics are from every row
+        self.assertEqual(1000, profile.sample_size)
+        self.assertEqual(100, profile.null_count)
+        self.assertEqual(900, profile.profile['statistics']['unique_count'])
+        self.assertEqual(
+            ['data_type_profile', 'data_stats_profile'],
+            list(profile.profiles))
+
+        # the histograms are from the reservoir of the non-null values, while
+        # the other numeric statistics are from every value
+        self.assertEqual(900, profile._reservoir.count)
+        self.assertEqual(50, len(profile._reservoir.values))
+        int_profile = profile.profiles['data_type_profile']._profiles['int']
+        self.assertEqual(900, int_profile.sample_size)
+        self.assertEqual(50, sum(profile.profile['statistics']['histogram']
+                                 ['bin_counts']))
+        self.assertEqual('int', profile.profile['data_type'])
+        self.assertEqual(1, profile.profile['statistics']['min'])
+        self.assertEqual(999, profile.profile['statistics']['max'])
+        self.assertEqual(500, profile.profile['statistics']['mean'])
+
+        # merged profiles are profiled from the merged reservoirs
+        merged_profile = profile + profile
+        self.assertEqual(1800, merged_profile._reservoir.count)
+        self.assertEqual(50, sum(merged_profile.profile['statistics']
+                                 ['histogram']['bin_counts']))
+        self.assertEqual(
+            1800, merged_profile.profiles['data_type_profile']
+            ._profiles['int'].sample_size)
+        self.assertEqual(2000, merged_profile.sample_size)
+        self.assertEqual('int', merged_profile.profile['data_type'])
+        self.assertEqual(999, merged_profile.profile['statistics']['max'])
+
+        # the reservoir is saved along with the profile
+        loaded_profile = pickle.loads(pickle.dumps(profile))
+        self.assertEqual(profile._reservoir.values,
+                         loaded_profile._reservoir.values)
+
+    def test_adaptive_sampling(self):
+        options = StructuredOptions()
+        options.set({'data_labeler.is_enabled': False,
+                     'multiprocess.is_enabled': False,
+                     'adaptive_sampling.ratio_tolerance': 0.01,
+                     'adaptive_sampling.stats_tolerance': 0.1})
+        stable_data = pd.Series([str(i % 10) for i in range(20000)], name='a')
+        noisy_data = pd.Series([str(i) if i % 2 else None
+                                for i in range(20000)], name='b')
+
+        # a stable column converges after the first round
+        profile = StructuredDataProfile(stable_data, sample_size=20000,
+                                        options=options)
+        self.assertEqual(1000, profile.sample_size)
+        self.assertEqual('int', profile.profile['data_type'])
+        self.assertAlmostEqual(
+            4.5, profile.profile['statistics']['mean'], delta=0.5)
+
+        # rounds double until the null ratio is within the tolerance
+        profile = StructuredDataProfile(noisy_data, sample_size=20000,
+                                        options=options)
+        self.assertEqual(15000, profile.sample_size)
+        self.assertAlmostEqual(0.5, profile.null_count / 15000, delta=0.01)
+        self.assertEqual(profile.null_count,
+                         len(profile.null_types_index['None']))
+
+        # rounds stop at the sample size, unless the minimum number of true
+        # samples is not met
+        options.set({'adaptive_sampling.ratio_tolerance': 0.001})
+        profile = StructuredDataProfile(options=options)
+        profile.update_profile(noisy_data, sample_size=5000)
+        self.assertEqual(5000, profile.sample_size)
+        profile = StructuredDataProfile(options=options)
+        profile.update_profile(noisy_data, sample_size=500,
+                               min_true_samples=1000)
+        self.assertEqual(500 + 2000, profile.sample_size)
+        self.assertGreaterEqual(2500 - profile.null_count, 1000)
+
+        # the statistics are checked against their own tolerance
+        options.set({'adaptive_sampling.ratio_tolerance': None,
+                     'adaptive_sampling.stats_tolerance': 0.01})
+        profile = StructuredDataProfile(stable_data, sample_size=20000,
+                                        options=options)
+        self.assertEqual(20000, profile.sample_size)
+
     @mock.patch('dataprofiler.profilers.column_profile_compilers.'
                 'ColumnPrimitiveTypeProfileCompiler')
     @mock.patch('dataprofiler.profilers.column_profile_compilers.'
@@ -546,10 +1457,98 @@ class TestStructuredDataProfileClass(unittest.TestCase):
             StructuredDataProfile.clean_data_and_get_base_stats(
                 df_series=data[1:], sample_size=6, min_true_samples=0)
         # note data above is a subset `df_series=data[1:]`, 1.0 will not exist
-        self.assertTrue(np.issubdtype(np.object_, df_series.dtype))
+        # native floats are kept as is, their samples formatted as strings
+        self.assertEqual(np.float64, df_series.dtype)
         self.assertCountEqual({'sample': ['4.0', '6.0', '3.0'],
                                'sample_size': 5, 'null_count': 2,
                                'null_types': dict(nan=['e', 'b'])}, base_stats)
+        self.assertCountEqual(['4.0', '6.0', '3.0'], base_stats['sample'])
+
+        # values of other dtypes are converted to strings
+        df_series, base_stats = \
+            StructuredDataProfile.clean_data_and_get_base_stats(
+                df_series=data[1:].astype(object), sample_size=6,
+                min_true_samples=0)
+        self.assertTrue(np.issubdtype(np.object_, df_series.dtype))
+        self.assertCountEqual(['4.0', '6.0', '3.0'], base_stats['sample'])
+        self.assertEqual(dict(nan=['e', 'b']), base_stats['null_types'])
+
+    def test_native_dtypes(self):
+        data = pd.DataFrame({
+            'int': [12252020, 1, 2, 3],
+            'float': [1.5, np.nan, 2., 3.25],
+            'datetime': pd.to_datetime(['2020-01-01', None, '2021-03-04',
+                                        '2020-06-07 08:09:10']),
+        })
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False,
+                              'multiprocess.is_enabled': False})
+        with mock.patch('dataprofiler.profilers.numerical_column_stats.'
+                        'NumericStatsMixin.is_float') as mock_is_float:
+            profile = dp.Profiler(data, profiler_options=profiler_options)
+        mock_is_float.assert_not_called()
+        report = profile.report()
+
+        # native numbers are not guessed to be datetimes
+        int_report = report['data_stats']['int']
+        self.assertEqual('int', int_report['data_type'])
+        self.assertEqual(12252020, int_report['statistics']['max'])
+
+        float_report = report['data_stats']['float']
+        self.assertEqual('float', float_report['data_type'])
+        self.assertEqual(['nan'], float_report['statistics']['null_types'])
+        self.assertEqual(1.5, float_report['statistics']['min'])
+        self.assertEqual(3, float_report['statistics']['precision']['max'])
+
+        # NaT is null and datetimes are formatted as timestamps
+        datetime_report = report['data_stats']['datetime']
+        self.assertEqual('datetime', datetime_report['data_type'])
+        self.assertEqual(['NaT'], datetime_report['statistics']['null_types'])
+        self.assertEqual('2020-01-01 00:00:00',
+                         datetime_report['statistics']['min'])
+        self.assertEqual(['%Y-%m-%d %H:%M:%S'],
+                         datetime_report['statistics']['format'])
+        self.assertIn('2021-03-04 00:00:00', datetime_report['samples'])
+
+        # as are datetimes with fractions of a second
+        datetimes = pd.DataFrame({'datetime': pd.to_datetime([
+            '2020-01-01 10:00:00.123456', None, '2020-01-02 10:00:00.5'])})
+        datetime_report = dp.Profiler(
+            datetimes, profiler_options=profiler_options).report()[
+            'data_stats']['datetime']
+        self.assertEqual('datetime', datetime_report['data_type'])
+        self.assertEqual('2020-01-01 10:00:00.123456',
+                         datetime_report['statistics']['min'])
+        self.assertEqual('2020-01-02 10:00:00.500000',
+                         datetime_report['statistics']['max'])
+        self.assertEqual(['%Y-%m-%d %H:%M:%S.%f'],
+                         datetime_report['statistics']['format'])
+
+        # profiles of native and string columns merge
+        str_profile = dp.Profiler(data[['float']].astype(str),
+                                  profiler_options=profiler_options)
+        merged_profile = str_profile + dp.Profiler(
+            data[['float']], profiler_options=profiler_options)
+        self.assertEqual(3.25, merged_profile.report()['data_stats'][
+            'float']['statistics']['max'])
+
+    def test_null_type_categories(self):
+        data = pd.Series(['a', 'NaN', '', 'nan', '  ', '---', '_', ' -', 'NULL',
+                          'None', 'none1', 'NaN', 'b', '--'])
+        null_type_codes = dict()
+        categories = StructuredDataProfile._get_null_type_categories(
+            data, null_type_codes)
+        self.assertEqual({'NaN': 1, '': 2, 'nan': 3, '  ': 4, '---': 5,
+                          '_': 6, 'NULL': 7, 'None': 8, '--': 9},
+                         null_type_codes)
+        np.testing.assert_array_equal(
+            [0, 1, 2, 3, 4, 5, 6, 0, 7, 8, 0, 1, 0, 9], categories)
+
+        # previously found null types keep their code
+        categories = StructuredDataProfile._get_null_type_categories(
+            pd.Series(['null', 'NaN', 'c']), null_type_codes)
+        self.assertEqual(10, null_type_codes['null'])
+        np.testing.assert_array_equal([10, 1, 0], categories)
 
     def test_column_names(self):
         data = [['a', 1], ['b', 2], ['c', 3]]
@@ -778,9 +1777,9 @@ class TestProfilerNullValues(unittest.TestCase):
                              "sparse": [1, None, 3, None, 5, None, 7, None, 9]})
         profile = dp.Profiler(data, samples_per_update=5, min_true_samples=5,
                               profiler_options=opts)
-        # Rows 2, 4, 5, 6, 7 are sampled in first column
+        # Rows 2, 3, 4, 5, 6 are sampled in first column
         # Therefore only those rows should be considered for null calculations
-        # The only null in those rows in second column in that subset are 5, 7
+        # The only null in those rows in second column in that subset are 3, 5
         # Therefore only 2 rows have null according to row_has_null_count
         self.assertEqual(0, profile.row_is_null_count)
         self.assertEqual(2, profile.row_has_null_count)
@@ -794,14 +1793,14 @@ class TestProfilerNullValues(unittest.TestCase):
              "sparser": [1, None, None, None, None, None, None, 8]})
         profile2 = dp.Profiler(data2, samples_per_update=2, min_true_samples=2,
                                profiler_options=opts)
-        # Rows are sampled as follows: [6, 5], [1, 4], [2, 3], [0, 7]
-        # First column gets min true samples from ids 1, 4, 5, 6
-        # Second column gets completely sampled (has a null in 1, 4, 5, 6)
-        # rows 1 and 5 are completely null, 4 and 6 only null in col 2
-        self.assertEqual(2, profile2.row_is_null_count)
-        self.assertEqual(4, profile2.row_has_null_count)
-        # Only 4 total rows sampled, ratio accordingly
-        self.assertEqual(0.5, profile2._get_row_is_null_ratio())
+        # Rows are sampled as follows: [2, 4], [3, 6], [5, 0], [1, 7]
+        # First column gets min true samples from ids 2, 4
+        # Second column gets completely sampled (has a null in 2, 4)
+        # neither row is completely null, both are null in col 2
+        self.assertEqual(0, profile2.row_is_null_count)
+        self.assertEqual(2, profile2.row_has_null_count)
+        # Only 2 total rows sampled, ratio accordingly
+        self.assertEqual(0, profile2._get_row_is_null_ratio())
         self.assertEqual(1, profile2._get_row_has_null_ratio())
 
 
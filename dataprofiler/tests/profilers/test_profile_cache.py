@@ -0,0 +1,173 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from . import utils as test_utils
+
+import dataprofiler as dp
+from dataprofiler.profilers.profile_cache import ProfileCache, \
+    get_file_fingerprint, get_options_hash, get_data_options_hash
+from dataprofiler.profilers.profiler_options import ProfilerOptions
+
+
+class TestProfileCache(unittest.TestCase):
+
+    def setUp(self):
+        test_utils.set_seed(seed=0)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmpdir.name, 'cache')
+        self.filepath = os.path.join(self.tmpdir.name, 'data.csv')
+        self.data = pd.DataFrame({'a': np.arange(60) / 7,
+                                  'b': (['x', 'y', None] * 20)})
+        self.profiler_options = ProfilerOptions()
+        self.profiler_options.set({'data_labeler.is_enabled': False,
+                                   'multiprocess.is_enabled': False})
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_file_fingerprint(self):
+        self.data.to_csv(self.filepath, index=False)
+        fingerprint = get_file_fingerprint(self.filepath, block_size=16)
+        self.assertEqual(os.path.getsize(self.filepath), fingerprint['size'])
+        self.assertEqual(fingerprint,
+                         get_file_fingerprint(self.filepath, block_size=16))
+
+        with open(self.filepath, 'r+b') as outfile:
+            outfile.write(b'c')
+        self.assertNotEqual(fingerprint['head_hash'], get_file_fingerprint(
+            self.filepath, block_size=16)['head_hash'])
+
+    def test_options_hash(self):
+        options = ProfilerOptions()
+        self.assertEqual(get_options_hash(options),
+                         get_options_hash(ProfilerOptions()))
+
+        # multiprocessing does not change the profile
+        options.set({'multiprocess.is_enabled': False})
+        self.assertEqual(get_options_hash(options),
+                         get_options_hash(ProfilerOptions()))
+
+        options.set({'int.is_enabled': False})
+        self.assertNotEqual(get_options_hash(options),
+                            get_options_hash(ProfilerOptions()))
+
+    def test_profile_hit_and_miss(self):
+        self.data.to_csv(self.filepath, index=False)
+        cache = ProfileCache(self.cache_dir)
+        profile = cache.profile(self.filepath,
+                                profiler_options=self.profiler_options)
+        self.assertEqual(60, profile.total_samples)
+
+        with mock.patch('dataprofiler.profilers.profile_cache.Profiler',
+                        wraps=dp.Profiler) as mock_profiler:
+            cached_profile = cache.profile(
+                self.filepath, profiler_options=self.profiler_options)
+            mock_profiler.assert_not_called()
+        self.assertEqual(60, cached_profile.total_samples)
+        self.assertEqual(profile.report()['data_stats']['a']['statistics']
+                         ['mean'],
+                         cached_profile.report()['data_stats']['a']
+                         ['statistics']['mean'])
+
+        # a rewritten file is profiled again
+        self.data[:30].to_csv(self.filepath, index=False)
+        profile = cache.profile(self.filepath,
+                                profiler_options=self.profiler_options)
+        self.assertEqual(30, profile.total_samples)
+
+        # as is a file profiled with other options
+        profiler_options = ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False,
+                              'multiprocess.is_enabled': False,
+                              'text.is_enabled': False})
+        profile = cache.profile(self.filepath,
+                                profiler_options=profiler_options)
+        self.assertEqual(30, profile.total_samples)
+        self.assertEqual(4, len(os.listdir(self.cache_dir)))
+
+    def test_profile_data_options(self):
+        self.assertEqual(get_data_options_hash(None),
+                         get_data_options_hash({}))
+        self.assertEqual(
+            get_data_options_hash({'header': 0, 'delimiter': ','}),
+            get_data_options_hash({'delimiter': ',', 'header': 0}))
+        self.assertNotEqual(get_data_options_hash(None),
+                            get_data_options_hash(None, data_type='csv'))
+
+        self.data.to_csv(self.filepath, index=False)
+        cache = ProfileCache(self.cache_dir)
+        profile = cache.profile(self.filepath,
+                                profiler_options=self.profiler_options)
+        self.assertEqual(['a', 'b'], sorted(profile.profile))
+
+        # the same file read with other data options is profiled again
+        profile = cache.profile(self.filepath,
+                                profiler_options=self.profiler_options,
+                                data_options={'selected_columns': ['b']})
+        self.assertEqual(['b'], list(profile.profile))
+        profile = cache.profile(self.filepath,
+                                profiler_options=self.profiler_options,
+                                data_options={'header': None})
+        self.assertEqual(61, profile.total_samples)
+        profile = cache.profile(self.filepath,
+                                profiler_options=self.profiler_options,
+                                data_type='csv')
+        self.assertEqual(60, profile.total_samples)
+        self.assertEqual(8, len(os.listdir(self.cache_dir)))
+
+        # each is cached on its own
+        with mock.patch('dataprofiler.profilers.profile_cache.Profiler',
+                        wraps=dp.Profiler) as mock_profiler:
+            profile = cache.profile(self.filepath,
+                                    profiler_options=self.profiler_options,
+                                    data_options={'selected_columns': ['b']})
+            mock_profiler.assert_not_called()
+        self.assertEqual(['b'], list(profile.profile))
+
+    def test_profile_appended_rows(self):
+        self.data[:40].to_csv(self.filepath, index=False)
+        cache = ProfileCache(self.cache_dir)
+        cache.profile(self.filepath, profiler_options=self.profiler_options)
+
+        self.data[40:].to_csv(self.filepath, mode='a', header=False,
+                              index=False)
+        with mock.patch('dataprofiler.profilers.profile_cache.data_readers.'
+                        'data.Data') as mock_data:
+            profile = cache.profile(self.filepath,
+                                    profiler_options=self.profiler_options)
+            mock_data.assert_not_called()
+
+        full_profile = dp.Profiler(dp.Data(self.filepath),
+                                   profiler_options=self.profiler_options)
+        self.assertEqual(60, profile.total_samples)
+        self.assertEqual('csv', profile.file_type)
+        self.assertEqual(full_profile.row_has_null_count,
+                         profile.row_has_null_count)
+        report = profile.report()
+        full_report = full_profile.report()
+        for col in ['a', 'b']:
+            for stat in ['sample_size', 'null_count', 'null_types_index',
+                         'min', 'max']:
+                self.assertEqual(
+                    full_report['data_stats'][col]['statistics'].get(stat),
+                    report['data_stats'][col]['statistics'].get(stat))
+            self.assertAlmostEqual(
+                full_report['data_stats'][col]['statistics'].get('mean', 0),
+                report['data_stats'][col]['statistics'].get('mean', 0))
+
+        # the merged profile is cached
+        with mock.patch('dataprofiler.profilers.profile_cache.Profiler',
+                        wraps=dp.Profiler) as mock_profiler:
+            self.assertEqual(60, cache.profile(
+                self.filepath,
+                profiler_options=self.profiler_options).total_samples)
+            mock_profiler.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from dataprofiler.profilers.reservoir import Reservoir
+
+
+def _get_decile_frequencies(get_values, num_values, num_trials=2000):
+    """Average number of times a value of each decile is sampled."""
+    counts = np.zeros(num_values)
+    # each reservoir would draw the same values if seeded
+    environ = {key: value for key, value in os.environ.items()
+               if key != 'DATAPROFILER_SEED'}
+    with mock.patch.dict(os.environ, environ, clear=True):
+        for _ in range(num_trials):
+            counts[get_values()] += 1
+    return counts.reshape(10, -1).sum(axis=1) / num_trials
+
+
+class TestReservoir(unittest.TestCase):
+
+    def test_init(self):
+        reservoir = Reservoir(size=10)
+        self.assertEqual(10, reservoir.size)
+        self.assertEqual(0, reservoir.count)
+        self.assertEqual([], reservoir.values)
+
+        for size in [0, -1, 1.5, None, True]:
+            with self.assertRaisesRegex(ValueError, "Reservoir size must be a "
+                                                    "positive integer."):
+                Reservoir(size)
+
+    def test_update(self):
+        reservoir = Reservoir(size=10)
+        self.assertTrue(reservoir.update(np.arange(4)))
+        self.assertEqual([0, 1, 2, 3], reservoir.values)
+        self.assertFalse(reservoir.update([]))
+
+        # the reservoir is filled, then its values replaced
+        reservoir.update(np.arange(4, 1000))
+        self.assertEqual(1000, reservoir.count)
+        self.assertEqual(10, len(reservoir.values))
+        self.assertEqual(10, len(set(reservoir.values)))
+        self.assertTrue(set(reservoir.values).issubset(range(1000)))
+
+        # the later a value, the less likely it is sampled
+        changes = [reservoir.update(np.arange(1000 + i * 10, 1010 + i * 10))
+                   for i in range(1000)]
+        self.assertTrue(any(changes))
+        self.assertFalse(all(changes))
+
+    def test_uniform_sample(self):
+        def stream_in_chunks():
+            reservoir = Reservoir(size=10)
+            for start in range(0, 1000, 137):
+                reservoir.update(np.arange(start, min(start + 137, 1000)))
+            return reservoir.values
+
+        # each decile holds a tenth of the values, i.e. 1 of the 10 sampled
+        np.testing.assert_allclose(
+            np.ones(10), _get_decile_frequencies(stream_in_chunks, 1000),
+            atol=0.1)
+
+    def test_merge(self):
+        reservoir1 = Reservoir(size=10)
+        reservoir1.update(np.arange(300))
+        reservoir2 = Reservoir(size=20)
+        reservoir2.update(np.arange(300, 1000))
+
+        merged_reservoir = reservoir1 + reservoir2
+        self.assertEqual(10, merged_reservoir.size)
+        self.assertEqual(1000, merged_reservoir.count)
+        self.assertEqual(10, len(set(merged_reservoir.values)))
+        self.assertTrue(set(merged_reservoir.values).issubset(
+            set(reservoir1.values) | set(reservoir2.values)))
+
+        # merging reservoirs which are not full keeps every value
+        reservoir1 = Reservoir(size=10)
+        reservoir1.update(np.arange(3))
+        reservoir2 = Reservoir(size=10)
+        reservoir2.update(np.arange(3, 5))
+        merged_reservoir = reservoir1 + reservoir2
+        self.assertEqual([0, 1, 2, 3, 4], sorted(merged_reservoir.values))
+        self.assertTrue(merged_reservoir.update(np.arange(5, 10)))
+        self.assertEqual(list(range(10)), sorted(merged_reservoir.values))
+
+        with self.assertRaisesRegex(TypeError, '`Reservoir` and `int` are not '
+                                               'of the same sample type.'):
+            reservoir1 + 1
+
+    def test_merged_uniform_sample(self):
+        def merge_then_stream():
+            reservoir1 = Reservoir(size=10)
+            reservoir1.update(np.arange(0, 300))
+            reservoir2 = Reservoir(size=10)
+            reservoir2.update(np.arange(300, 1000))
+            merged_reservoir = reservoir1 + reservoir2
+            merged_reservoir.update(np.arange(1000, 2000))
+            return merged_reservoir.values
+
+        np.testing.assert_allclose(
+            np.ones(10), _get_decile_frequencies(merge_then_stream, 2000),
+            atol=0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
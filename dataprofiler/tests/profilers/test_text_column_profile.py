@@ -200,7 +200,7 @@ class TestTextColumnProfiler(unittest.TestCase):
                                       'variance': 1.0})
         )
         time_array = [float(x) for x in range(30, 0, -1)]
-        with mock.patch('time.time', side_effect=lambda: time_array.pop()):
+        with mock.patch('time.perf_counter', side_effect=lambda: time_array.pop()):
             profiler.update(df)
             profile = profiler.profile
             expected_histogram = expected_profile.pop('histogram')
@@ -229,7 +229,7 @@ class TestTextColumnProfiler(unittest.TestCase):
         profiler = TextColumn(df.name, options=options)
 
         time_array = [float(i) for i in range(100, 0, -1)]
-        with mock.patch('time.time', side_effect=lambda: time_array.pop()):
+        with mock.patch('time.perf_counter', side_effect=lambda: time_array.pop()):
             # Validate that the times dictionary is empty
             self.assertCountEqual(defaultdict(float), profiler.profile['times'])
             profiler.update(df)
@@ -292,7 +292,7 @@ class TestTextColumnProfiler(unittest.TestCase):
         profiler2.times = dict(vocab=3.0)
 
         time_array = [float(i) for i in range(2, 0, -1)]
-        with mock.patch('time.time', side_effect=lambda: time_array.pop()):
+        with mock.patch('time.perf_counter', side_effect=lambda: time_array.pop()):
             profiler3 = profiler1 + profiler2
 
             # __add__() call adds 1 so expected is 6
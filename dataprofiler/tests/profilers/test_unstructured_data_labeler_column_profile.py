@@ -125,7 +125,7 @@ class TestUnstructuredDataLabelerProfile(unittest.TestCase):
         )
 
         time_array = [float(i) for i in range(4, 0, -1)]
-        with mock.patch('time.time', side_effect=lambda: time_array.pop()):
+        with mock.patch('time.perf_counter', side_effect=lambda: time_array.pop()):
             default.update(sample)
         profile = default.profile
 
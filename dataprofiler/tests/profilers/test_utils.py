@@ -1,6 +1,11 @@
 import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
 
 from dataprofiler.profilers import utils
+from dataprofiler.profilers.numerical_column_stats import NumericStatsMixin
 
 
 class TestShuffleInChunks(unittest.TestCase):
@@ -44,3 +49,266 @@ class TestShuffleInChunks(unittest.TestCase):
             num_chunks += 1
         self.assertEqual(num_chunks, 100 // 7 + 1)
         self.assertCountEqual(all_values, list(range(100)))
+
+    def test_partial_sample_of_large_data(self):
+        """
+        Check only the consumed chunks are generated for large data.
+        """
+        sample_gen = utils.shuffle_in_chunks(data_length=10 ** 9,
+                                             chunk_size=1000)
+        first_sample = next(sample_gen)
+        second_sample = next(sample_gen)
+        sample_gen.close()
+        self.assertEqual(1000, len(set(first_sample)))
+        self.assertEqual(1000, len(set(second_sample)))
+        self.assertFalse(set(first_sample) & set(second_sample))
+        self.assertTrue(np.all((0 <= first_sample) & (first_sample < 10 ** 9)))
+
+    @mock.patch.dict('os.environ', {'DATAPROFILER_SEED': '0'})
+    def test_seeded_sample(self):
+        """
+        Check the shuffled chunks are reproducible when seeded.
+        """
+        sample = np.concatenate([*utils.shuffle_in_chunks(50, 7)])
+        np.testing.assert_array_equal(
+            sample, np.concatenate([*utils.shuffle_in_chunks(50, 7)]))
+
+
+@unittest.skipIf(utils.shared_memory is None,
+                 "shared memory requires python 3.8+")
+class TestSharedMemory(unittest.TestCase):
+    """
+    Validates series are properly handed off via shared memory.
+    """
+
+    def _share_and_attach(self, df_series):
+        shared_blocks, descriptor = utils.share_series(df_series)
+        self.assertIsNotNone(descriptor)
+        attached_blocks, attached_series = utils.attach_series(descriptor)
+        try:
+            pd.testing.assert_series_equal(df_series, attached_series,
+                                           check_index_type=False)
+        finally:
+            del attached_series
+            utils.release_shared_memory(attached_blocks)
+            utils.release_shared_memory(shared_blocks, unlink=True)
+
+    def test_share_series(self):
+        self._share_and_attach(pd.Series([1.5, 2, np.nan], name='float'))
+        self._share_and_attach(pd.Series([1, 2, 3], index=[4, 5, 6], name=0))
+        self._share_and_attach(pd.Series([True, False], name='bool'))
+        self._share_and_attach(
+            pd.Series(pd.to_datetime(['2020-01-01', '2021-01-01'])))
+
+    def test_share_series_unsupported(self):
+        # only fixed-width values are attached without copying, others are
+        # pickled
+        for df_series in [pd.Series(['a', 'bb', '', 'ccc']),
+                          pd.Series(['a', None]),
+                          pd.Series(['a', 1]),
+                          pd.Series([1, 2], index=['x', 'y'])]:
+            self.assertEqual(([], None), utils.share_series(df_series))
+
+    def test_share_args(self):
+        str_series = pd.Series(['1', '2.5', 'a'], name='str')
+        float_series = pd.Series([1.5, 2., 3.], name='float')
+        typed_view = utils.get_typed_view(str_series)
+        args = (str_series, float_series, typed_view, 3)
+
+        shared_blocks, shared_args = utils.share_args(args)
+        try:
+            # the string series is left to be pickled
+            self.assertEqual(3, len(shared_args) - 1)
+            self.assertIs(str_series, shared_args[0])
+            self.assertEqual('series', shared_args[1].kind)
+            self.assertEqual('typed_view', shared_args[2].kind)
+            self.assertEqual(3, shared_args[3])
+            self.assertEqual(1 + len(typed_view), len(shared_blocks))
+
+            attached_blocks, attached_args = utils.attach_args(shared_args)
+            self.assertIs(str_series, attached_args[0])
+            pd.testing.assert_series_equal(float_series, attached_args[1],
+                                           check_index_type=False)
+            self.assertIsInstance(attached_args[2], utils.TypedView)
+            for array, attached_array in zip(typed_view, attached_args[2]):
+                np.testing.assert_array_equal(array, attached_array)
+            self.assertEqual(3, attached_args[3])
+            del attached_args
+            utils.release_shared_memory(attached_blocks)
+        finally:
+            utils.release_shared_memory(shared_blocks, unlink=True)
+
+        # nothing to share
+        self.assertEqual(([], (str_series,)), utils.share_args((str_series,)))
+
+    def test_share_array(self):
+        array = np.array([[3, 1, 2]])
+        shm, descriptor = utils.share_array(array)
+        attached_shm, attached_array = utils.attach_array(descriptor)
+        np.testing.assert_array_equal(array, attached_array)
+        del attached_array
+        utils.release_shared_memory([attached_shm])
+        utils.release_shared_memory([shm], unlink=True)
+
+    def test_can_share_memory(self):
+        from multiprocessing.pool import ThreadPool
+        self.assertFalse(utils.can_share_memory(None))
+        with ThreadPool(1) as pool:
+            self.assertFalse(utils.can_share_memory(pool))
+
+
+class TestGeneratePool(unittest.TestCase):
+    """
+    Validates the pool backends generated for multiprocessing.
+    """
+
+    def test_thread_backend(self):
+        from multiprocessing.pool import ThreadPool
+        pool, pool_size = utils.generate_pool(2, backend='thread')
+        try:
+            self.assertIsInstance(pool, ThreadPool)
+            self.assertEqual(2, pool_size)
+        finally:
+            pool.close()
+            pool.join()
+
+        # a single thread is not worth a pool
+        pool, pool_size = utils.generate_pool(1, backend='thread')
+        self.assertIsNone(pool)
+
+    def test_auto_backend(self):
+        from multiprocessing.pool import ThreadPool
+        thread_pool = ThreadPool(2)
+        auto_pool = utils.AutoPool(None, thread_pool)
+        try:
+            class GILProfiler(object):
+                releases_gil = True
+
+            class PythonProfiler(object):
+                releases_gil = False
+
+            self.assertIs(thread_pool,
+                          utils.select_pool(auto_pool, GILProfiler()))
+            self.assertIsNone(utils.select_pool(auto_pool, PythonProfiler()))
+            self.assertIsNone(utils.select_pool(auto_pool))
+
+            # non-auto pools are used for all profilers
+            self.assertIs(thread_pool,
+                          utils.select_pool(thread_pool, PythonProfiler()))
+            self.assertIsNone(utils.select_pool(None, GILProfiler()))
+        finally:
+            auto_pool.close()
+            auto_pool.join()
+
+
+class TestMergeInTrees(unittest.TestCase):
+    """
+    Validates profiles are merged as balanced binary trees.
+    """
+
+    class MergeCounter(object):
+
+        def __init__(self, values, depth=0):
+            self.values = values
+            self.depth = depth
+
+        def __add__(self, other):
+            return type(self)(self.values + other.values,
+                              max(self.depth, other.depth) + 1)
+
+    def test_merge_in_trees(self):
+        groups = {'a': [self.MergeCounter([i]) for i in range(5)],
+                  'b': [self.MergeCounter(['x'])],
+                  'c': [self.MergeCounter([i]) for i in range(8)]}
+        merged = utils.merge_in_trees(groups)
+
+        self.assertListEqual(['a', 'b', 'c'], list(merged))
+        self.assertCountEqual(range(5), merged['a'].values)
+        self.assertListEqual(['x'], merged['b'].values)
+        self.assertListEqual(list(range(8)), merged['c'].values)
+
+        # the trees are balanced
+        self.assertEqual(3, merged['a'].depth)
+        self.assertEqual(0, merged['b'].depth)
+        self.assertEqual(3, merged['c'].depth)
+
+    def test_merge_in_trees_with_executor(self):
+        from concurrent.futures import ThreadPoolExecutor
+        groups = {0: list(range(100)), 1: list(range(10))}
+        with ThreadPoolExecutor(2) as executor:
+            with mock.patch.object(executor, 'map',
+                                   wraps=executor.map) as mock_map:
+                merged = utils.merge_in_trees(groups, executor)
+        self.assertEqual({0: sum(range(100)), 1: sum(range(10))}, merged)
+        # one map for each level of the deepest tree
+        self.assertEqual(7, mock_map.call_count)
+
+    def test_merge_nothing(self):
+        with self.assertRaisesRegex(ValueError, "No profiles to merge for a."):
+            utils.merge_in_trees({'a': []})
+
+
+class TestTypedView(unittest.TestCase):
+
+    def test_get_typed_view(self):
+        values = ['1', '2.5', ' 3 ', 'inf', '1e400', 'a1', 'Mar 1, 2020', '']
+        typed_view = utils.get_typed_view(pd.Series(values))
+        np.testing.assert_array_equal(
+            [1., 2.5, 3., np.inf, np.inf, np.nan, np.nan, np.nan],
+            typed_view.floats)
+        np.testing.assert_array_equal(
+            [NumericStatsMixin.is_float(value) for value in values],
+            typed_view.is_float)
+        np.testing.assert_array_equal(
+            [NumericStatsMixin.is_int(value) for value in values],
+            typed_view.is_int)
+        np.testing.assert_array_equal(
+            [False, False, False, False, False, True, True, False],
+            typed_view.is_datetime_candidate)
+
+        # all floats are converted at once
+        typed_view = utils.get_typed_view(pd.Series(['1', '-2', '0.5']))
+        np.testing.assert_array_equal([1., -2., .5], typed_view.floats)
+        np.testing.assert_array_equal([True, True, False], typed_view.is_int)
+
+        # the only numbers which may be datetimes are of the format '%m%d%Y'
+        typed_view = utils.get_typed_view(pd.Series(['03142013', '1']))
+        np.testing.assert_array_equal(
+            [True, False], typed_view.is_datetime_candidate)
+
+        typed_view = utils.get_typed_view(pd.Series([], dtype=object))
+        self.assertEqual(0, len(typed_view.floats))
+        self.assertEqual(0, len(typed_view.is_datetime_candidate))
+
+        # only native datetimes have their datetimes
+        for values in [['1', 'a'], [1.5, 2]]:
+            np.testing.assert_array_equal(
+                [utils.NAT_VALUE] * 2,
+                utils.get_typed_view(pd.Series(values)).datetimes)
+        datetimes = pd.to_datetime(['1970-01-01 00:00:01.5', '1969-12-31'])
+        np.testing.assert_array_equal(
+            [1500000000, -86400 * 10 ** 9],
+            utils.get_typed_view(pd.Series(datetimes)).datetimes)
+
+
+class TestRatioMarginOfError(unittest.TestCase):
+    """
+    Validates the margin of error of a sampled ratio.
+    """
+
+    def test_get_ratio_margin_of_error(self):
+        # close to the normal approximation for large samples
+        margin = utils.get_ratio_margin_of_error(0.5, 10000, 1.96)
+        self.assertAlmostEqual(1.96 * np.sqrt(0.25 / 10000), margin,
+                               places=5)
+
+        # does not collapse to zero when the ratio is 0 or 1
+        margin = utils.get_ratio_margin_of_error(1., 100, 1.96)
+        self.assertGreater(margin, 0.01)
+        self.assertEqual(
+            margin, utils.get_ratio_margin_of_error(0., 100, 1.96))
+        self.assertGreater(
+            margin, utils.get_ratio_margin_of_error(1., 1000, 1.96))
+
+        self.assertEqual(float('inf'),
+                         utils.get_ratio_margin_of_error(0.5, 0, 1.96))
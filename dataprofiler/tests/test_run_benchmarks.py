@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+
+from benchmarks import run_benchmarks
+
+
+class TestRunBenchmarks(unittest.TestCase):
+
+    def test_generate_data(self):
+        data = run_benchmarks.generate_data(
+            1000, 5, {'int': 0.5, 'string': 0.5}, null_rate=0.2)
+        self.assertEqual((1000, 5), data.shape)
+        for col in data.columns:
+            self.assertTrue(col.startswith(('int_', 'string_')))
+        null_rate = data.isnull().values.mean()
+        self.assertTrue(0.15 < null_rate < 0.25)
+
+        data = run_benchmarks.generate_data(10, 3, {'float': 1.}, 0., seed=1)
+        self.assertTrue(data.equals(run_benchmarks.generate_data(
+            10, 3, {'float': 1.}, 0., seed=1)))
+
+        with self.assertRaisesRegex(ValueError, 'Unknown column type: bool'):
+            run_benchmarks.generate_data(10, 1, {'bool': 1.}, 0.)
+
+    def test_peak_rss_monitor(self):
+        memory = run_benchmarks.PeakRSSMonitor(interval=0.001)
+        with memory:
+            rss = memory.peak_rss
+            array = np.ones(50 * 2 ** 20, dtype=np.uint8)
+        del array
+        # the memory allocated within the context is part of the peak
+        self.assertGreaterEqual(memory.peak_rss, rss + 40 * 2 ** 20)
+
+    def test_compare_to_baseline(self):
+        baseline = [
+            {'case': 'mixed', 'multiprocess': False, 'data_labeler': False,
+             'rows_per_second': 1000., 'cells_per_second': 10000.,
+             'peak_rss_bytes': 100},
+            {'case': 'wide', 'multiprocess': False, 'data_labeler': False,
+             'rows_per_second': 1000., 'cells_per_second': 10000.,
+             'peak_rss_bytes': 100},
+        ]
+        results = [
+            {'case': 'mixed', 'multiprocess': False, 'data_labeler': False,
+             'rows_per_second': 950., 'cells_per_second': 9500.,
+             'peak_rss_bytes': 105},
+            {'case': 'wide', 'multiprocess': False, 'data_labeler': False,
+             'rows_per_second': 800., 'cells_per_second': 8000.,
+             'peak_rss_bytes': 150},
+            {'case': 'numeric', 'multiprocess': False, 'data_labeler': False,
+             'rows_per_second': 1., 'cells_per_second': 1.,
+             'peak_rss_bytes': 1},
+            {'case': 'sparse', 'multiprocess': True, 'data_labeler': False,
+             'error': 'exit code 1'},
+        ]
+        regressions = run_benchmarks.compare_to_baseline(
+            results, baseline, tolerance=0.1)
+        self.assertEqual(4, len(regressions))
+        self.assertTrue(all('wide' in regression
+                            for regression in regressions[:3]))
+        self.assertIn('failed with exit code 1', regressions[3])
+        self.assertEqual([], run_benchmarks.compare_to_baseline(
+            results[:2], baseline, tolerance=0.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import json
+import multiprocessing as mp
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+import dataprofiler as dp
+from dataprofiler import tracing
+
+
+class TestTracing(unittest.TestCase):
+
+    def setUp(self):
+        tracing.clear()
+
+    def tearDown(self):
+        tracing.disable()
+        tracing.clear()
+
+    def test_disabled(self):
+        self.assertFalse(tracing.is_enabled())
+
+        @tracing.traced()
+        def add(a, b):
+            return a + b
+
+        with tracing.span('test'):
+            self.assertEqual(3, add(1, 2))
+        self.assertEqual([], tracing.get_events())
+
+    def test_nested_spans(self):
+        tracing.enable()
+
+        class Test(object):
+            @tracing.traced_method()
+            def method(self):
+                with tracing.span('inner', value=1):
+                    pass
+
+        Test().method()
+        inner, outer = tracing.get_events()
+        self.assertEqual('inner', inner['name'])
+        self.assertEqual({'value': 1}, inner['args'])
+        self.assertEqual('Test.method', outer['name'])
+        for event in [inner, outer]:
+            self.assertEqual('X', event['ph'])
+            self.assertEqual(os.getpid(), event['pid'])
+            self.assertEqual(threading.get_ident(), event['tid'])
+        self.assertLessEqual(outer['ts'], inner['ts'])
+        self.assertGreaterEqual(outer['ts'] + outer['dur'],
+                                inner['ts'] + inner['dur'])
+
+        tracing.disable()
+        Test().method()
+        self.assertEqual(2, len(tracing.get_events()))
+
+    def test_profile_trace(self):
+        data = pd.DataFrame({'a': [1, 2, None, 4], 'b': ['w', 'x', 'y', 'z']})
+        profiler_options = dp.ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False,
+                              'multiprocess.is_enabled': False})
+
+        tracing.enable()
+        dp.Profiler(data, profiler_options=profiler_options)
+        names = {event['name'] for event in tracing.get_events()}
+        self.assertIn('Profiler._update_profile_from_chunk', names)
+        self.assertIn('StructuredDataProfile.clean_data_and_get_base_stats',
+                      names)
+        self.assertIn('ColumnStatsProfileCompiler.update_profile', names)
+        self.assertIn('IntColumn.update', names)
+        self.assertIn('IntColumn.histogram_and_quantiles', names)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, 'trace.json')
+            tracing.save_chrome_trace(filepath)
+            with open(filepath) as infile:
+                trace = json.load(infile)
+        self.assertEqual(tracing.get_events(), trace['traceEvents'])
+
+    @mock.patch('dataprofiler.profilers.profile_builder.utils.generate_pool')
+    def test_worker_spans(self, mock_generate_pool):
+        mock_generate_pool.return_value = (mp.Pool(2), 2)
+        data = pd.DataFrame({'a': [1, 2, None, 4], 'b': ['w', 'x', 'y', 'z']})
+        profiler_options = dp.ProfilerOptions()
+        profiler_options.set({'data_labeler.is_enabled': False})
+
+        # the spans recorded by the workers of the pool are sent back
+        tracing.enable()
+        with dp.Profiler(data, profiler_options=profiler_options):
+            pass
+        worker_names = {event['name'] for event in tracing.get_events()
+                        if event['pid'] != os.getpid()}
+        self.assertIn('StructuredDataProfile.clean_data_and_get_base_stats',
+                      worker_names)
+        self.assertIn('IntColumn.update', worker_names)
+        self.assertIn('IntColumn.histogram_and_quantiles', worker_names)
+        self.assertIn('pool_wait', {event['name']
+                                    for event in tracing.get_events()})
+
+    def test_run_traced(self):
+        def add(a, b):
+            with tracing.span('add'):
+                return a + b
+
+        with tracing.span('before'):
+            pass
+        result, events = tracing.run_traced(True, add, 1, b=2)
+        self.assertEqual(3, result)
+        self.assertEqual(['add'], [event['name'] for event in events])
+        self.assertFalse(tracing.is_enabled())
+        self.assertEqual([], tracing.get_events())
+
+        self.assertEqual(3, tracing.collect_traced((result, events)))
+        self.assertEqual(events, tracing.get_events())
+
+if __name__ == '__main__':
+    unittest.main()
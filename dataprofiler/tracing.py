@@ -0,0 +1,251 @@
+"""
+coding=utf-8
+
+Tracing of the time spent in the steps of loading, profiling and labeling
+data. Spans are only recorded while tracing is enabled and can be exported as
+a Chrome trace, viewable in chrome://tracing or https://ui.perfetto.dev.
+"""
+import functools
+import json
+import os
+import threading
+import time
+
+
+# checked by every span, hence kept as a plain module attribute
+_enabled = False
+
+# completed spans of this process, as Chrome trace events
+_events = []
+
+
+class _Span(object):
+
+    __slots__ = ('name', 'args', 'start')
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        end = time.perf_counter()
+        event = {
+            'name': self.name,
+            'ph': 'X',
+            'ts': self.start * 1e6,
+            'dur': (end - self.start) * 1e6,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+        }
+        if self.args:
+            event['args'] = self.args
+        _events.append(event)
+
+
+class _NullSpan(object):
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def enable():
+    """
+    Starts recording spans.
+
+    :return: None
+    """
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """
+    Stops recording spans, the spans recorded are kept until cleared.
+
+    :return: None
+    """
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    """
+    Whether spans are being recorded.
+
+    :return: whether tracing is enabled
+    :rtype: bool
+    """
+    return _enabled
+
+
+def span(name, **args):
+    """
+    Context manager recording the time spent within it as a span, if tracing
+    is enabled. Spans nest by their timing, per thread.
+
+    :param name: name of the span
+    :type name: str
+    :param args: values shown with the span, must be JSON serializable
+    :type args: dict
+    :return: context manager of the span
+    :rtype: Union[_Span, _NullSpan]
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def traced(name=None):
+    """
+    Decorator recording each call of a function as a span, if tracing is
+    enabled.
+
+    :param name: name of the span, the function's qualified name if None
+    :type name: str
+    :return: decorator
+    :rtype: Callable
+    """
+    def decorator(method):
+        span_name = name or method.__qualname__
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return method(*args, **kwargs)
+            with _Span(span_name, None):
+                return method(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def traced_method(name=None):
+    """
+    Decorator recording each call of a method as a span named after the class
+    of the instance, if tracing is enabled.
+
+    :param name: name of the span within the class, the method's name if None
+    :type name: str
+    :return: decorator
+    :rtype: Callable
+    """
+    def decorator(method):
+        method_name = name or method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not _enabled:
+                return method(self, *args, **kwargs)
+            with _Span(type(self).__name__ + '.' + method_name, None):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def get_events():
+    """
+    Spans recorded by this process, as Chrome trace events.
+
+    :return: trace events
+    :rtype: list(dict)
+    """
+    return list(_events)
+
+
+def add_events(events):
+    """
+    Adds spans recorded by another process, e.g. a worker, to those of this
+    process.
+
+    :param events: trace events from `get_events`
+    :type events: list(dict)
+    :return: None
+    """
+    _events.extend(events)
+
+
+def run_traced(enabled, function, *args, **kwargs):
+    """
+    Calls a function within a worker process, tracing it if tracing was
+    enabled in the process submitting it, and returns the spans it recorded
+    along with its result so they can be added to those of the submitting
+    process with `collect_traced`.
+
+    :param enabled: whether tracing is enabled in the submitting process
+    :type enabled: bool
+    :param function: function to call
+    :type function: Callable
+    :return: the result of the function and the spans recorded by the call
+    :rtype: tuple(Any, list(dict))
+    """
+    global _enabled
+    was_enabled = _enabled
+    _enabled = enabled
+    # spans recorded before, e.g. inherited from a forked parent, are not sent
+    first_event = len(_events)
+    try:
+        result = function(*args, **kwargs)
+    finally:
+        _enabled = was_enabled
+    events = _events[first_event:]
+    del _events[first_event:]
+    return result, events
+
+
+def collect_traced(traced_result):
+    """
+    Adds the spans recorded by a call of `run_traced` to those of this process
+    and returns the result of the call.
+
+    :param traced_result: value returned by `run_traced`
+    :type traced_result: tuple(Any, list(dict))
+    :return: the result of the call
+    :rtype: Any
+    """
+    result, events = traced_result
+    add_events(events)
+    return result
+
+
+def clear():
+    """
+    Discards the spans recorded.
+
+    :return: None
+    """
+    del _events[:]
+
+
+def to_chrome_trace():
+    """
+    Spans recorded as a Chrome trace, with the time of each span in
+    microseconds.
+
+    :return: Chrome trace
+    :rtype: dict
+    """
+    return {'traceEvents': get_events(), 'displayTimeUnit': 'ms'}
+
+
+def save_chrome_trace(filepath):
+    """
+    Writes the spans recorded to a Chrome trace JSON file.
+
+    :param filepath: path of the file to write
+    :type filepath: str
+    :return: None
+    """
+    with open(filepath, 'w') as outfile:
+        json.dump(to_chrome_trace(), outfile)